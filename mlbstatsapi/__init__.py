@@ -1,6 +1,25 @@
 from .mlb_api import Mlb
-from .mlb_dataadapter import MlbDataAdapter, MlbResult
+from .mlb_dataadapter import MlbDataAdapter, MlbResult, MlbBatchResult
+from .mlb_async import AsyncMlb, AsyncMlbDataAdapter
+from .mlb_live import (
+    LiveGame,
+    LiveGameWatcher,
+    GameReplay,
+    LiveEvents,
+    LiveEvent,
+    PitchThrown,
+    PlayCompleted,
+    Substitution,
+    ScoreChanged,
+    InningChanged,
+    StatusChanged,
+    )
+from .mlb_cache import CacheEntry, CachePolicy, MemoryCache, SqliteCache, TieredCache
+from .mlb_ratelimit import RateLimiter, RetryPolicy
+from .mlb_hooks import RequestHook, RequestStats, LoggingHook
 from .exceptions import TheMlbStatsApiException
+from .models.identity import IdentityMap, identity_scope
+from .models.constructors import from_dict
 
 from .mlb_module import (
     return_splits,
@@ -1,13 +1,17 @@
+import copy
+import functools
 import logging
 import datetime
 
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 from mlbstatsapi.models.people import Person, Player, Coach
 from mlbstatsapi.models.teams import Team
 from mlbstatsapi.models.sports import Sport
 from mlbstatsapi.models.leagues import League
 from mlbstatsapi.models.game import Game, Plays, Linescore, BoxScore
+from mlbstatsapi.models.game.livedata.plays.play import Play
 from mlbstatsapi.models.venues import Venue
 from mlbstatsapi.models.divisions import Division
 from mlbstatsapi.models.schedules import Schedule, ScheduleGames
@@ -19,10 +23,18 @@ from mlbstatsapi.models.awards import Award
 from mlbstatsapi.models.gamepace import Gamepace
 from mlbstatsapi.models.homerunderby import Homerunderby
 from mlbstatsapi.models.standings import Standings
-
-from .mlb_dataadapter import MlbDataAdapter
-# from .exceptions import TheMlbStatsApiException
+from mlbstatsapi.models.identity import IdentityMap, current_identity_map, identity_scope
+from mlbstatsapi.models.constructors import from_dict
+
+from .mlb_dataadapter import MlbDataAdapter, MlbBatchResult
+from .mlb_cache import ResponseCache
+from .mlb_ratelimit import RateLimiter, RetryPolicy
+from .mlb_hooks import RequestHook, instrument
+from .mlb_stream import iter_array
+from .mlb_live import LiveGame
+from .exceptions import TheMlbStatsApiException
 from . import mlb_module
+from .models import projection
 
 
 class Mlb:
@@ -37,13 +49,101 @@ class Mlb:
         hostname of statsapi.mlb.com
     logger: logging.Loger
         logger
+    pool_size: int
+        number of keep-alive connections shared by every request this
+        instance makes
+    cache: MemoryCache, SqliteCache or TieredCache
+        optional response cache shared by every request this instance makes
+    rate_limiter: RateLimiter
+        optional token bucket shared by every request this instance makes
+    retry: RetryPolicy
+        optional retries with jittered exponential backoff for 429, 5xx and
+        connection errors, Retry-After headers are honored
+    hooks: Iterable[RequestHook]
+        optional hooks told about every request this instance makes, with
+        timings for the request, JSON decoding and building models
+    identity_map: str
+        optional 'response' to share one Person, Team and League instance per
+        id within each response, or 'session' to share them across every
+        response this instance returns. A shared instance gains the
+        attributes of fuller records seen later, also after it was returned.
+        A session keeps the SESSION_IDENTITY_MAP_SIZE most recently used
+    raw: str
+        optional 'dict' to return the decoded response with lowercase keys,
+        or 'bytes' to return the undecoded body, instead of building models.
+        Every get_ method also takes raw to choose per call
+
+    Examples
+    --------
+    >>> mlb = Mlb(cache=MemoryCache(max_bytes=32 * 1024 * 1024))
+    >>> mlb.get_team_id("Oakland Athletics")
+    [133]
     """
-    def __init__(self, hostname: str = 'statsapi.mlb.com', logger: logging.Logger = None):
-        self._mlb_adapter_v1 = MlbDataAdapter(hostname, 'v1', logger)
-        self._mlb_adapter_v1_1 = MlbDataAdapter(hostname, 'v1.1', logger)
+    _hooks = ()
+    _identity_maps = None
+    _raw = None
+
+    def __init__(self, hostname: str = 'statsapi.mlb.com', logger: logging.Logger = None,
+                 pool_size: int = 10, cache: ResponseCache = None, rate_limiter: RateLimiter = None,
+                 retry: RetryPolicy = None, hooks: Iterable[RequestHook] = None, identity_map: str = None,
+                 raw: str = None):
+        self._hooks = tuple(hooks or ())
+        self._identity_maps = _identity_map_factory(identity_map)
+        self._raw = _check_raw(raw)
+        self._session = MlbDataAdapter.create_session(pool_size)
+        self._mlb_adapter_v1 = MlbDataAdapter(hostname, 'v1', logger, session=self._session, cache=cache,
+                                              rate_limiter=rate_limiter, retry=retry, hooks=self._hooks)
+        self._mlb_adapter_v1_1 = MlbDataAdapter(hostname, 'v1.1', logger, session=self._session, cache=cache,
+                                                rate_limiter=rate_limiter, retry=retry, hooks=self._hooks)
         self._logger = logger or logging.getLogger(__name__)
         self._logger.setLevel(logging.DEBUG)
 
+    def close(self):
+        """
+        Close the pooled session shared by this instance's adapters
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _get_many(self, method: Callable, ids: Iterable, max_workers: int, **params) -> MlbBatchResult:
+        """
+        Call method once per id on a pool of max_workers threads
+
+        Parameters
+        ----------
+        method : Callable
+            bound single id method, e.g. self.get_game
+        ids : Iterable
+            ids to pass to method
+        max_workers : int
+            max number of requests in flight at once
+
+        Returns
+        -------
+        MlbBatchResult
+            results in input order, errors keyed by id
+        """
+        ids = list(ids)
+        results = [None] * len(ids)
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(method, id, **params) for id in ids]
+
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    self._logger.error('%s(%s) failed: %s', method.__name__, ids[index], e)
+                    errors[ids[index]] = e
+
+        return MlbBatchResult(ids, results, errors)
+
     def get_people(self, sport_id: int = 1, **params) -> List[Person]:
         """
         return the all players for sportid
@@ -86,7 +186,7 @@ class Mlb:
         people = []
 
         if 'people' in mlb_data.data and mlb_data.data['people']:
-            people = [Person(**person) for person in mlb_data.data['people']]
+            people = [from_dict(Person, person) for person in mlb_data.data['people']]
 
         return people
 
@@ -124,7 +224,7 @@ class Mlb:
 
         if 'people' in mlb_data.data and mlb_data.data['people']:
             for person in mlb_data.data['people']:
-                return Person(**person)
+                return from_dict(Person, person)
 
     def get_persons(self, person_ids: Union[str, List[int]], **params) -> List[Person]:
         """
@@ -188,10 +288,44 @@ class Mlb:
 
         if 'people' in mlb_data.data and mlb_data.data['people']:
             for person in mlb_data.data['people']:
-                person_list.append(Person(**person))
+                person_list.append(from_dict(Person, person))
 
         return person_list
 
+    def get_persons_many(self, person_ids: Iterable[int], max_workers: int = 8,
+                         **params) -> MlbBatchResult:
+        """
+        Return a Person for each person id, fetched in parallel
+
+        Parameters
+        ----------
+        person_ids : Iterable[int]
+            person ids to fetch with get_person
+        max_workers : int
+            max number of requests in flight at once
+
+        Other Parameters
+        ----------------
+        Passed to get_person for every id
+
+        Returns
+        -------
+        MlbBatchResult
+            Persons in the order of person_ids, failed ids in errors
+
+        See Also
+        --------
+        Mlb.get_person : Return Person from id.
+        Mlb.get_persons : Return a list of People from ids in one request.
+
+        Examples
+        --------
+        >>> mlb = Mlb()
+        >>> mlb.get_persons_many([660271, 605151]).results
+        [Person, Person]
+        """
+        return self._get_many(self.get_person, person_ids, max_workers, **params)
+
     def get_people_id(self, fullname: str, sport_id: int = 1, 
                       search_key: str = 'fullname', **params) -> List[int]:
         """
@@ -323,7 +457,7 @@ class Mlb:
         teams = []
 
         if 'teams' in mlb_data.data and mlb_data.data['teams']:
-            teams = [Team(**team) for team in mlb_data.data['teams']]
+            teams = [from_dict(Team, team) for team in mlb_data.data['teams']]
 
         return teams
 
@@ -393,7 +527,40 @@ class Mlb:
 
         if 'teams' in mlb_data.data and mlb_data.data['teams']:
             for team in mlb_data.data['teams']:
-                return Team(**team)
+                return from_dict(Team, team)
+
+    def get_teams_many(self, team_ids: Iterable[int], max_workers: int = 8,
+                       **params) -> MlbBatchResult:
+        """
+        Return a Team for each team id, fetched in parallel
+
+        Parameters
+        ----------
+        team_ids : Iterable[int]
+            team ids to fetch with get_team
+        max_workers : int
+            max number of requests in flight at once
+
+        Other Parameters
+        ----------------
+        Passed to get_team for every id
+
+        Returns
+        -------
+        MlbBatchResult
+            Teams in the order of team_ids, failed ids in errors
+
+        See Also
+        --------
+        Mlb.get_team : Return a Team from id
+
+        Examples
+        --------
+        >>> mlb = Mlb()
+        >>> mlb.get_teams_many([133, 136]).results
+        [Team, Team]
+        """
+        return self._get_many(self.get_team, team_ids, max_workers, **params)
 
     def get_team_id(self, team_name: str,
                     search_key: str = 'name', **params) -> List[int]:
@@ -449,7 +616,7 @@ class Mlb:
                     continue
         return team_ids
 
-    def get_team_roster(self, team_id: int, **params) -> List[Player]:
+    def get_team_roster(self, team_id: int, attributes: Iterable[str] = None, **params) -> List[Player]:
         """
         return the team player roster
 
@@ -458,6 +625,10 @@ class Mlb:
         team_id : int
             teamId to return a directory of players based on roster status for
             a particular club.
+        attributes : Iterable[str], optional
+            Dotted paths of the attributes wanted, e.g. 'fullname' or 'jerseynumber'.
+            Only those are requested, with the fields param, and a partial
+            Player for each player with just them set is returned
 
         Other Parameters
         ----------------
@@ -519,6 +690,11 @@ class Mlb:
         [Player, Player, Player]
         """
 
+        if attributes:
+            # each player's person is merged into the Player
+            tree = projection.projection_tree(attributes)
+            params['fields'] = ','.join(sorted(projection.projection_fields(Player, tree, {'roster', 'person'})))
+
         mlb_data = self._mlb_adapter_v1.get(endpoint=f'teams/{team_id}/roster', ep_params=params)
         if 400 <= mlb_data.status_code <= 499:
             return []
@@ -527,7 +703,12 @@ class Mlb:
 
         if 'roster' in mlb_data.data and mlb_data.data['roster']:
             for player in mlb_data.data['roster']:
-                players.append(Player(**mlb_module.merge_keys(player, ['person'])))
+                player = mlb_module.merge_keys(player, ['person'])
+
+                if attributes:
+                    players.append(projection.build_partial(Player, player, tree))
+                else:
+                    players.append(from_dict(Player, player))
 
         return players
 
@@ -577,7 +758,7 @@ class Mlb:
 
         if 'roster' in mlb_data.data and mlb_data.data['roster']:
             for coach in mlb_data.data['roster']:
-                coaches.append(Coach(**mlb_module.merge_keys(coach, ['person'])))
+                coaches.append(from_dict(Coach, mlb_module.merge_keys(coach, ['person'])))
 
         return coaches
 
@@ -586,7 +767,8 @@ class Mlb:
                     start_date: str = None, 
                     end_date: str = None, 
                     sport_id: int = 1, 
-                    team_id: int = None, **params) -> Union[Schedule, None]:
+                    team_id: int = None,
+                    attributes: Iterable[str] = None, **params) -> Union[Schedule, None]:
         """
         return the schedule created from the included params.
 
@@ -607,6 +789,10 @@ class Mlb:
             sport id of schedule defaults to 1
         team_id : int
             get schedule for team with team_id
+        attributes : Iterable[str], optional
+            Dotted paths of the attributes wanted, e.g. 'dates.games.gamepk' or 'dates.games.status'.
+            Only those are requested, with the fields param, and a partial
+            Schedule with just them set is returned
 
         Other Parameters
         ----------------
@@ -763,6 +949,11 @@ class Mlb:
     
         params['sportId'] = sport_id
 
+        if attributes:
+            # the schedule is only returned when it has dates
+            tree = projection.projection_tree(['dates.date', *attributes])
+            params['fields'] = ','.join(sorted(projection.projection_fields(Schedule, tree)))
+
         mlb_data = self._mlb_adapter_v1.get(endpoint='schedule', ep_params=params)
         if 400 <= mlb_data.status_code <= 499:
             return None
@@ -772,7 +963,10 @@ class Mlb:
         # Only check for existance 'dates' key for this reason.
 
         if 'dates' in mlb_data.data and mlb_data.data['dates']:
-            return Schedule(**mlb_data.data)
+            if attributes:
+                return projection.build_partial(Schedule, mlb_data.data, tree)
+
+            return from_dict(Schedule, mlb_data.data)
 
     def get_scheduled_games_by_date(self, date: str = None,
                                     start_date: str = None, 
@@ -845,11 +1039,12 @@ class Mlb:
         if 'dates' in mlb_data.data and mlb_data.data['dates']:
             for date in mlb_data.data['dates']:
                for game in date['games']:
-                   games.append(ScheduleGames(**game))
+                   games.append(from_dict(ScheduleGames, game))
 
         return games
 
-    def get_game(self, game_id: int, **params) -> Union[Game, None]:
+    def get_game(self, game_id: int, lazy: bool = False, attributes: Iterable[str] = None,
+                 **params) -> Union[Game, None]:
         """
         Return the game for a specific game id
         Gumbo Live Feed for a specific gamePk.
@@ -858,7 +1053,15 @@ class Mlb:
         ----------
         game_id : int
             Insert gamePk to return the GUMBO live feed for a specific game.
-            
+        lazy : bool
+            Build the nested models of the game, e.g. every play and pitch,
+            only when they are first read. Use this when only a few
+            attributes, such as gamedata.status, are needed.
+        attributes : Iterable[str], optional
+            Dotted paths of the attributes wanted, e.g. 'gamedata.status' or 'livedata.linescore'.
+            Only those are requested, with the fields param, and a partial
+            Game with just them set is returned
+
         Other Parameters
         ----------------
         timecode : str
@@ -877,10 +1080,8 @@ class Mlb:
                 officials
         fields : str
             Comma delimited list of specific fields to be returned. 
-            Format: topLevelNode, childNode, attribute
-
-            !!! To use this we would need to make almost every !!!
-            !!!    data class attr optonal? Do we want this?   !!!
+            Format: topLevelNode, childNode, attribute. Use attributes to
+            build a partial Game from them
 
         Returns
         -------
@@ -897,14 +1098,163 @@ class Mlb:
         >>> mlb = Mlb()
         >>> mlb.get_game(662242)
         Game
+        >>> mlb.get_game(662242, lazy=True).gamedata.status
+        GameStatus
+        >>> mlb.get_game(662242, attributes=['gamedata.status']).gamedata.status
+        GameStatus
         """
+        if attributes:
+            # gamepk is checked against game_id
+            tree = projection.projection_tree(['gamepk', *attributes])
+            params['fields'] = ','.join(sorted(projection.projection_fields(Game, tree)))
 
         mlb_data = self._mlb_adapter_v1_1.get(endpoint=f'game/{game_id}/feed/live', ep_params=params)
         if 400 <= mlb_data.status_code <= 499:
             return None
 
         if 'gamepk' in mlb_data.data and mlb_data.data['gamepk'] == game_id:
-            return Game(**mlb_data.data)
+            if attributes:
+                return projection.build_partial(Game, mlb_data.data, tree)
+
+            return from_dict(Game, {**mlb_data.data, 'lazy': lazy})
+
+    def live_game(self, game_id: int, **params) -> Union[LiveGame, None]:
+        """
+        Return a LiveGame for a specific game id, kept up to date with diff patches
+
+        The full feed is downloaded once, then LiveGame.update applies the
+        changes since the last update from the diffPatch endpoint to the raw
+        feed and to the models they touch, instead of downloading and
+        building the whole Game again as get_game does.
+
+        Parameters
+        ----------
+        game_id : int
+            Insert gamePk to follow a specific game.
+
+        Other Parameters
+        ----------------
+        hydrate : str
+            Insert hydration(s) to return putout credits or defensive
+            positioning data for all plays. Format 'credits,alignment,flags'
+
+        Returns
+        -------
+        LiveGame
+            None for a game id that does not exist
+
+        See Also
+        --------
+        Mlb.get_game : return the game
+
+        Examples
+        --------
+        >>> mlb = Mlb()
+        >>> live = mlb.live_game(662242)
+        >>> live.game.gamedata.status.abstractgamestate
+        'Live'
+        >>> live.update()
+        True
+        """
+        live = LiveGame(self._mlb_adapter_v1_1, game_id, self._logger, **params)
+
+        if live.refresh() is None:
+            return None
+
+        return live
+
+    def iter_game_plays(self, game_id: int, chunk_size: int = 65536, **params) -> Iterator[Play]:
+        """
+        Yield the plays of a game one at a time as its live feed downloads
+
+        The feed is read in chunks and each play is built when its JSON has
+        arrived, the rest of the feed is skipped without being decoded. Only
+        one play is held in memory at a time, instead of the whole feed and
+        every play as with get_game. Streamed feeds are not cached.
+
+        Parameters
+        ----------
+        game_id : int
+            Insert gamePk to return the plays of a specific game.
+        chunk_size : int
+            Max bytes read from the response at a time
+
+        Other Parameters
+        ----------------
+        timecode : str
+            Use this parameter to return the plays at the specified time.
+            Format: YYYYMMDD_HHMMSS.
+        hydrate : str
+            Insert hydration(s) to return putout credits or defensive
+            positioning data for all plays. Format 'credits,alignment,flags'
+
+        Yields
+        ------
+        Play
+            nothing for a game id that does not exist
+
+        See Also
+        --------
+        Mlb.get_game : return the whole game
+        Mlb.get_game_play_by_play : return play by play data for a game
+
+        Examples
+        --------
+        >>> mlb = Mlb()
+        >>> next(mlb.iter_game_plays(662242))
+        Play
+        """
+        chunks = self._mlb_adapter_v1_1.stream(endpoint=f'game/{game_id}/feed/live', ep_params=params,
+                                               chunk_size=chunk_size)
+        identity_map = self._identity_maps() if self._identity_maps is not None else None
+
+        for play in iter_array(chunks, ['livedata', 'plays', 'allplays']):
+            if not play:
+                continue
+
+            # the identity map is only active while a play is built, not while the caller has it
+            if identity_map is None or current_identity_map() is not None:
+                built = from_dict(Play, play)
+            else:
+                with identity_scope(identity_map):
+                    built = from_dict(Play, play)
+
+            yield built
+
+    def get_games(self, game_ids: Iterable[int], max_workers: int = 8,
+                  **params) -> MlbBatchResult:
+        """
+        Return the Game for each game id, fetched in parallel
+
+        Parameters
+        ----------
+        game_ids : Iterable[int]
+            game ids to fetch with get_game
+        max_workers : int
+            max number of requests in flight at once
+
+        Other Parameters
+        ----------------
+        Passed to get_game for every id
+
+        Returns
+        -------
+        MlbBatchResult
+            Games in the order of game_ids, failed ids in errors
+
+        See Also
+        --------
+        Mlb.get_game : return a specific game from game id
+        Mlb.get_game_ids : return a list of game ids for dates
+
+        Examples
+        --------
+        >>> mlb = Mlb()
+        >>> games = mlb.get_games(mlb.get_game_ids(date='2022-08-01'))
+        >>> games.errors
+        {}
+        """
+        return self._get_many(self.get_game, game_ids, max_workers, **params)
 
     def get_game_play_by_play(self, game_id: int, **params) -> Union[Plays, None]:
         """
@@ -949,7 +1299,40 @@ class Mlb:
             return None
 
         if 'allplays' in mlb_data.data and mlb_data.data['allplays']:
-            return Plays(**mlb_data.data)
+            return from_dict(Plays, mlb_data.data)
+
+    def get_game_timestamps(self, game_id: int, **params) -> List[str]:
+        """
+        Return the timecodes of every snapshot of a game's live feed
+
+        Parameters
+        ----------
+        game_id : int
+            Insert gamePk to return the timecodes of a specific game.
+
+        Returns
+        -------
+        list of str
+            timecodes, 'yyyymmdd_hhmmss', oldest first. Pass one to get_game
+            or LiveGame.refresh as timecode to get the feed as it was then
+
+        See Also
+        --------
+        Mlb.get_game : return a specific game from game id
+        GameReplay : step through the snapshots of a game
+
+        Examples
+        --------
+        >>> mlb = Mlb()
+        >>> timecodes = mlb.get_game_timestamps(662242)
+        >>> mlb.get_game(662242, timecode=timecodes[0])
+        Game
+        """
+        mlb_data = self._mlb_adapter_v1_1.get(endpoint=f'game/{game_id}/feed/live/timestamps', ep_params=params)
+        if 400 <= mlb_data.status_code <= 499:
+            return []
+
+        return list(mlb_data.data)
 
     def get_game_line_score(self, game_id: int, **params) -> Union[Linescore, None]:
         """
@@ -992,7 +1375,34 @@ class Mlb:
         mlb_data = self._mlb_adapter_v1.get(endpoint=f'game/{game_id}/linescore', ep_params=params)
 
         if 'teams' in mlb_data.data and mlb_data.data['teams']:
-            return Linescore(**mlb_data.data)
+            return from_dict(Linescore, mlb_data.data)
+
+    def get_game_line_scores(self, game_ids: Iterable[int], max_workers: int = 8,
+                             **params) -> MlbBatchResult:
+        """
+        Return the Linescore for each game id, fetched in parallel
+
+        Parameters
+        ----------
+        game_ids : Iterable[int]
+            game ids to fetch with get_game_line_score
+        max_workers : int
+            max number of requests in flight at once
+
+        Other Parameters
+        ----------------
+        Passed to get_game_line_score for every id
+
+        Returns
+        -------
+        MlbBatchResult
+            Linescores in the order of game_ids, failed ids in errors
+
+        See Also
+        --------
+        Mlb.get_game_line_score : return a linescore for a game
+        """
+        return self._get_many(self.get_game_line_score, game_ids, max_workers, **params)
 
     def get_game_box_score(self, game_id: int, **params) -> Union[BoxScore, None]:
         """
@@ -1037,8 +1447,34 @@ class Mlb:
             return None
 
         if 'teams' in mlb_data.data and mlb_data.data['teams']:
-            return BoxScore(**mlb_data.data)
+            return from_dict(BoxScore, mlb_data.data)
+
+    def get_game_box_scores(self, game_ids: Iterable[int], max_workers: int = 8,
+                            **params) -> MlbBatchResult:
+        """
+        Return the BoxScore for each game id, fetched in parallel
+
+        Parameters
+        ----------
+        game_ids : Iterable[int]
+            game ids to fetch with get_game_box_score
+        max_workers : int
+            max number of requests in flight at once
+
+        Other Parameters
+        ----------------
+        Passed to get_game_box_score for every id
+
+        Returns
+        -------
+        MlbBatchResult
+            BoxScores in the order of game_ids, failed ids in errors
 
+        See Also
+        --------
+        Mlb.get_game_box_score : return a boxscore for a game
+        """
+        return self._get_many(self.get_game_box_score, game_ids, max_workers, **params)
 
     def get_game_ids(self, date: str = None,
                      start_date: str = None,
@@ -1095,7 +1531,7 @@ class Mlb:
         if 'dates' in mlb_data.data and mlb_data.data['dates']:
             for date in mlb_data.data['dates']:
                for game in date['games']:
-                   game_ids.append(game.gamepk)
+                   game_ids.append(game['gamepk'])
 
         return game_ids
 
@@ -1164,7 +1600,7 @@ class Mlb:
             or 'leagues' in mlb_data.data and mlb_data.data['leagues']
             or 'sports' in mlb_data.data and mlb_data.data['sports']):
 
-            return Gamepace(**mlb_data.data)
+            return from_dict(Gamepace, mlb_data.data)
 
     def get_venue(self, venue_id: int, **params) -> Union[Venue, None]:
         """
@@ -1203,7 +1639,7 @@ class Mlb:
 
         if 'venues' in mlb_data.data and mlb_data.data['venues']:
             for venue in mlb_data.data['venues']:
-                return Venue(**venue)
+                return from_dict(Venue, venue)
 
     def get_venues(self, **params) -> List[Venue]:
         """
@@ -1250,7 +1686,7 @@ class Mlb:
         venues = []
 
         if 'venues' in mlb_data.data and mlb_data.data['venues']:
-            venues = [Venue(**venue) for venue in mlb_data.data['venues']]
+            venues = [from_dict(Venue, venue) for venue in mlb_data.data['venues']]
 
         return venues
 
@@ -1334,7 +1770,7 @@ class Mlb:
 
         if 'sports' in mlb_data.data and mlb_data.data['sports']:
             for sport in mlb_data.data['sports']:
-                return Sport(**sport)
+                return from_dict(Sport, sport)
 
     def get_sports(self, **params) -> List[Sport]:
         """
@@ -1370,7 +1806,7 @@ class Mlb:
         sports = []
 
         if 'sports' in mlb_data.data and mlb_data.data['sports']:
-            sports = [Sport(**sport) for sport in mlb_data.data['sports']]
+            sports = [from_dict(Sport, sport) for sport in mlb_data.data['sports']]
 
         return sports
 
@@ -1456,7 +1892,7 @@ class Mlb:
 
         if 'leagues' in mlb_data.data and mlb_data.data['leagues']:
             for league in mlb_data.data['leagues']:
-                return League(**league)
+                return from_dict(League, league)
 
     def get_leagues(self, **params) -> List[League]:
         """
@@ -1500,7 +1936,7 @@ class Mlb:
         leagues = []
 
         if 'leagues' in mlb_data.data and mlb_data.data['leagues']:
-            leagues = [League(**league) for league in mlb_data.data['leagues']]
+            leagues = [from_dict(League, league) for league in mlb_data.data['leagues']]
 
         return leagues
 
@@ -1579,7 +2015,7 @@ class Mlb:
 
         if 'divisions' in mlb_data.data and mlb_data.data['divisions']:
             for division in mlb_data.data['divisions']:
-                return Division(**division)
+                return from_dict(Division, division)
 
     def get_divisions(self, **params) -> List[Division]:
         """
@@ -1621,7 +2057,7 @@ class Mlb:
         divisions = []
 
         if 'divisions' in mlb_data.data and mlb_data.data['divisions']:
-            divisions = [Division(**division) for division in mlb_data.data['divisions']]
+            divisions = [from_dict(Division, division) for division in mlb_data.data['divisions']]
 
         return divisions
 
@@ -1712,7 +2148,7 @@ class Mlb:
 
         if 'seasons' in mlb_data.data and mlb_data.data['seasons']:
             for season in mlb_data.data['seasons']:
-                return Season(**season)
+                return from_dict(Season, season)
 
     def get_seasons(self, sport_id: int = 1, **params) -> List[Season]:
         """
@@ -1771,7 +2207,7 @@ class Mlb:
 
         if 'seasons' in mlb_data.data and mlb_data.data['seasons']:
             for season in mlb_data.data['seasons']:
-                season_list.append(Season(**season))
+                season_list.append(from_dict(Season, season))
         
         return season_list
 
@@ -1849,7 +2285,7 @@ class Mlb:
 
         if 'records' in mlb_data.data and mlb_data.data['records']:
             for standing in mlb_data.data['records']:
-                standings_list.append(Standings(**standing))
+                standings_list.append(from_dict(Standings, standing))
         
         return standings_list
 
@@ -1920,7 +2356,7 @@ class Mlb:
             return None
 
         if 'records' in mlb_data.data and mlb_data.data['records']:
-            return Attendance(**mlb_data.data)
+            return from_dict(Attendance, mlb_data.data)
 
     def get_draft(self, year_id: int, **params) -> List[Round]:
         """
@@ -1972,7 +2408,7 @@ class Mlb:
         if 'drafts' in mlb_data.data and mlb_data.data['drafts']:
             if mlb_data.data['drafts']['rounds']:
                 for round in mlb_data.data['drafts']['rounds']:
-                    round_list.append(Round(**round))
+                    round_list.append(from_dict(Round, round))
         return round_list
 
     def get_awards(self, award_id: str, **params) -> List[Award]:
@@ -2012,7 +2448,7 @@ class Mlb:
 
         if 'awards' in mlb_data.data and mlb_data.data['awards']:
             for award in mlb_data.data['awards']:
-                awards_list.append(Award(**award))
+                awards_list.append(from_dict(Award, award))
         
         return awards_list
 
@@ -2049,10 +2485,11 @@ class Mlb:
             None
         
         if 'status' in mlb_data.data and mlb_data.data['status']:
-            return Homerunderby(**mlb_data.data)
+            return from_dict(Homerunderby, mlb_data.data)
 
 
-    def get_team_stats(self, team_id: int, stats: list, groups: list, **params) -> dict:
+    def get_team_stats(self, team_id: int, stats: list, groups: list, table: Optional[str] = None,
+                       **params) -> dict:
         """
         returns a split stat data for a team
 
@@ -2064,6 +2501,10 @@ class Mlb:
             list of stat types. List of statTypes can be found at https://statsapi.mlb.com/api/v1/statTypes
         groups : list
             list of stat grous. List of statGroups can be found at https://statsapi.mlb.com/api/v1/statGroups
+        table : str, optional
+            'pandas' or 'arrow' to return a pandas.DataFrame or pyarrow.Table of each
+            stat's splits, with flattened columns like stat.hits and team.id,
+            instead of split classes
 
         Other Parameters
         ----------------
@@ -2090,6 +2531,7 @@ class Mlb:
         >>> mlb.get_team_stats(133, stats, groups)
         {'pitching': {'season': [PitchingSeason], 'seasonadvanced': [PitchingSeasonAdvanced] }}
         """
+        mlb_module.check_table(table)
         params['stats'] = stats
         params['group'] = groups
 
@@ -2098,13 +2540,17 @@ class Mlb:
             return {}
 
         if 'stats' in mlb_data.data and mlb_data.data['stats']:
+            if table:
+                return mlb_module.create_split_tables(mlb_data.data['stats'], table)
+
             splits = mlb_module.create_split_data(mlb_data.data['stats'])
         else:
             return {}
             
         return splits
 
-    def get_players_stats_for_game(self, person_id: int, game_id: int, **params) -> dict:
+    def get_players_stats_for_game(self, person_id: int, game_id: int, table: Optional[str] = None,
+                                   **params) -> dict:
         """
         Insert personId and gamePk to view stats for individual player based on a specific game.
          
@@ -2116,6 +2562,10 @@ class Mlb:
             the team id 
         game_id : list
             list of stat types
+        table : str, optional
+            'pandas' or 'arrow' to return a pandas.DataFrame or pyarrow.Table of each
+            stat's splits, with flattened columns like stat.hits and team.id,
+            instead of split classes
 
         Returns
         -------
@@ -2137,18 +2587,23 @@ class Mlb:
         >>> print(stats['stats']['gamelog'])
         >>> print(stats['hitting']['playlog'])
         """
+        mlb_module.check_table(table)
         mlb_data = self._mlb_adapter_v1.get(endpoint=f'people/{person_id}/stats/game/{game_id}')
         if 400 <= mlb_data.status_code <= 499:
             return {}
 
         if 'stats' in mlb_data.data and mlb_data.data['stats']:
+            if table:
+                return mlb_module.create_split_tables(mlb_data.data['stats'], table)
+
             splits = mlb_module.create_split_data(mlb_data.data['stats'])
         else:
             return {}
             
         return splits
         
-    def get_player_stats(self, person_id: int, stats: list, groups: list, **params) -> dict:
+    def get_player_stats(self, person_id: int, stats: list, groups: list, table: Optional[str] = None,
+                         **params) -> dict:
         """
         returns stat data for a team
 
@@ -2160,6 +2615,10 @@ class Mlb:
             list of stat types. List of statTypes can be found at https://statsapi.mlb.com/api/v1/statTypes
         groups : list
             list of stat grous. List of statGroups can be found at https://statsapi.mlb.com/api/v1/statGroups
+        table : str, optional
+            'pandas' or 'arrow' to return a pandas.DataFrame or pyarrow.Table of each
+            stat's splits, with flattened columns like stat.hits and team.id,
+            instead of split classes
 
         Other Parameters
         ----------------
@@ -2188,6 +2647,7 @@ class Mlb:
         >>> mlb.get_player_stats(647351, stats, groups)
         {'hitting': {'season': [HittingSeason], 'seasonadvanced': [HittingSeasonAdvanced] }}
         """
+        mlb_module.check_table(table)
         params['stats'] = stats
         params['group'] = groups
 
@@ -2196,13 +2656,16 @@ class Mlb:
             return {}
 
         if 'stats' in mlb_data.data and mlb_data.data['stats']:
+            if table:
+                return mlb_module.create_split_tables(mlb_data.data['stats'], table)
+
             splits = mlb_module.create_split_data(mlb_data.data['stats'])
         else:
             return {}
 
         return splits
 
-    def get_stats(self, stats: list, groups: list, **params: dict) -> dict:
+    def get_stats(self, stats: list, groups: list, table: Optional[str] = None, **params: dict) -> dict:
         """
         return a stat dictionary
 
@@ -2214,6 +2677,10 @@ class Mlb:
             list of stat types. List of statTypes can be found at https://statsapi.mlb.com/api/v1/statTypes
         groups : list
             list of stat grous. List of statGroups can be found at https://statsapi.mlb.com/api/v1/statGroups
+        table : str, optional
+            'pandas' or 'arrow' to return a pandas.DataFrame or pyarrow.Table of each
+            stat's splits, with flattened columns like stat.hits and team.id,
+            instead of split classes
 
         Other Parameters
         ----------------
@@ -2247,6 +2714,7 @@ class Mlb:
         >>> mlb = Mlb()
         >>> mlb.get_stats()
         """
+        mlb_module.check_table(table)
         params['stats'] = stats
         params['group'] = groups
 
@@ -2255,11 +2723,142 @@ class Mlb:
             return {}
 
         if 'stats' in mlb_data.data and mlb_data.data['stats']:
+            if table:
+                return mlb_module.create_split_tables(mlb_data.data['stats'], table)
+
             splits = mlb_module.create_split_data(mlb_data.data['stats'])
         else:
             return {}
             
         return splits
 
+
+# shared instances kept by Mlb(identity_map='session'), the least recently used are dropped
+SESSION_IDENTITY_MAP_SIZE = 50000
+
+
+def _identity_map_factory(identity_map: Optional[str]) -> Optional[Callable[[], IdentityMap]]:
+    """
+    return a function giving the identity map for each response, or None
+
+    Parameters
+    ----------
+    identity_map : str
+        None, 'response' for a new map per response, or 'session' for one map
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        for any other identity_map
+    """
+    if identity_map is None:
+        return None
+
+    if identity_map == 'response':
+        return IdentityMap
+
+    if identity_map == 'session':
+        session_map = IdentityMap(max_size=SESSION_IDENTITY_MAP_SIZE)
+        return lambda: session_map
+
+    raise TheMlbStatsApiException(f"identity_map must be 'response' or 'session', not {identity_map!r}")
+
+
+def _interned(method: Callable) -> Callable:
+    """
+    Wrap a Mlb method so the models it builds are interned in its identity map
+
+    An identity map the caller already made active with identity_scope is
+    kept, so nested calls share it.
+    """
+    @functools.wraps(method)
+    def wrapped(self, *args, **params):
+        if self._identity_maps is None or current_identity_map() is not None:
+            return method(self, *args, **params)
+
+        with identity_scope(self._identity_maps()):
+            return method(self, *args, **params)
+
+    return wrapped
+
+
+class _RawResponse(BaseException):
+    """
+    Raised by _RawAdapter with the response a Mlb method asked for, so the
+    method stops before building models from it
+
+    A BaseException so that an except Exception in a Mlb method does not
+    catch it.
+    """
+    def __init__(self, value):
+        self.value = value
+
+
+class _RawAdapter:
+    """
+    Stand in for an adapter that hands the response back as a dict or bytes
+    """
+    def __init__(self, adapter, raw: str):
+        # get_games and the other batch methods call a raw get_ method again
+        self._adapter = adapter._adapter if isinstance(adapter, _RawAdapter) else adapter
+        self._raw = raw
+
+    def get(self, endpoint: str, ep_params: Dict = None, data: Dict = None):
+        result = self._adapter.get(endpoint, ep_params=ep_params, decode=self._raw == 'dict')
+
+        if 400 <= result.status_code <= 499:
+            raise _RawResponse(None)
+
+        raise _RawResponse(result.data if self._raw == 'dict' else result.content)
+
+
+def _check_raw(raw: Optional[str]) -> Optional[str]:
+    """
+    return raw if it is None, False, 'dict' or 'bytes'
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        for any other raw
+    """
+    if raw and raw not in ('dict', 'bytes'):
+        raise TheMlbStatsApiException(f"raw must be 'dict' or 'bytes', not {raw!r}")
+
+    return raw
+
+
+def _passthrough(method: Callable) -> Callable:
+    """
+    Wrap a Mlb method so raw='dict' or raw='bytes' returns its response instead of models
+
+    The method is run with adapters that raise the response of its first
+    request, None for a 4xx, so nothing after the request runs.
+    """
+    @functools.wraps(method)
+    def wrapped(self, *args, raw: Optional[str] = None, **params):
+        raw = self._raw if raw is None else _check_raw(raw)
+
+        if not raw:
+            return method(self, *args, **params)
+
+        raw_mlb = copy.copy(self)
+        raw_mlb._raw = raw
+        raw_mlb._mlb_adapter_v1 = _RawAdapter(self._mlb_adapter_v1, raw)
+        raw_mlb._mlb_adapter_v1_1 = _RawAdapter(self._mlb_adapter_v1_1, raw)
+
+        try:
+            return method(raw_mlb, *args, **params)
+        except _RawResponse as response:
+            return response.value
+
+    return wrapped
+
+
+# report the requests of every get_ method to hooks with their model building time,
+# intern the models it builds, and let it return its raw response instead
+for _name, _method in list(vars(Mlb).items()):
+    if _name.startswith('get_') and callable(_method):
+        setattr(Mlb, _name, instrument(_interned(_passthrough(_method))))
+
 # This is to test pypi, please delete later
 
@@ -0,0 +1,512 @@
+import asyncio
+import functools
+import logging
+import threading
+import time
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Mapping, Tuple
+from urllib.parse import parse_qsl
+
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp is only required by the async client, python-mlb-statsapi[async]
+    aiohttp = None
+
+from .mlb_api import Mlb, _check_raw, _identity_map_factory
+from .mlb_dataadapter import MlbDataAdapter, MlbResult, MlbBatchResult, decode_lowered
+from .mlb_cache import CacheEntry, MemoryCache, ResponseCache
+from .mlb_ratelimit import RateLimiter, RetryPolicy
+from .mlb_hooks import RequestHook, RequestStats, collect, report
+from .exceptions import TheMlbStatsApiException
+
+
+if aiohttp is not None:
+    _REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+else:
+    _REQUEST_ERRORS = (asyncio.TimeoutError,)
+
+
+class _AsyncSingleFlight:
+    """
+    Run at most one coroutine per key at a time, concurrent tasks with the
+    same key await that coroutine and share its outcome
+    """
+    def __init__(self):
+        self._flights = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable]) -> Tuple[object, bool]:
+        """
+        return the value of fn() and whether it came from another task's call
+        """
+        flight = self._flights.get(key)
+
+        if flight is not None:
+            # shield so a cancelled follower does not cancel the leader's request
+            return await asyncio.shield(flight), True
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            value = await fn()
+            flight.set_result(value)
+            return value, False
+
+        except BaseException as e:
+            flight.set_exception(e)
+            # retrieve the exception so an unawaited flight does not log a warning
+            flight.exception()
+            raise
+
+        finally:
+            del self._flights[key]
+
+
+class AsyncMlbDataAdapter(MlbDataAdapter):
+    """
+    Asyncio adapter for calling the mlb statsapi endpoint
+
+    Returns the same MlbResult objects as MlbDataAdapter, requests are sent
+    through a pooled aiohttp.ClientSession.
+
+    Attributes
+    ----------
+    hostname : str
+        rest endpoint for data
+    ver : str
+        api version
+    logger : logging.Logger
+        instance of logger class
+    session : aiohttp.ClientSession
+        session used for every request, created on first use if not passed
+    pool_size : int
+        number of connections kept alive per host when the adapter creates
+        its own session
+    cache : MemoryCache, SqliteCache or TieredCache
+        optional response cache consulted before the network, a SqliteCache
+        or TieredCache is read and written in the loop's default executor
+    rate_limiter : RateLimiter
+        optional token bucket every request waits on
+    retry : RetryPolicy
+        optional retries with backoff for 429, 5xx and connection errors
+    hooks : Iterable[RequestHook]
+        optional hooks told about every request with its RequestStats, ttfb
+        includes the body download since aiohttp reads it with the headers
+
+    Identical requests made at the same time from several tasks share one
+    HTTP request.
+    """
+
+    def __init__(self, hostname: str = 'statsapi.mlb.com', ver: str = 'v1', logger: logging.Logger = None,
+                 session: 'aiohttp.ClientSession' = None, pool_size: int = 10, cache: ResponseCache = None,
+                 rate_limiter: RateLimiter = None, retry: RetryPolicy = None,
+                 hooks: Iterable[RequestHook] = None):
+        self._session_lock = threading.Lock()
+        super().__init__(hostname, ver, logger, session, pool_size, cache, rate_limiter, retry, hooks)
+
+    _single_flight = _AsyncSingleFlight
+
+    def _default_session(self) -> None:
+        # an aiohttp session belongs to the loop it is created in, so it is created on first use
+        return None
+
+    @staticmethod
+    def create_session(pool_size: int = 10) -> 'aiohttp.ClientSession':
+        """
+        Create an aiohttp session that keeps up to pool_size connections alive
+
+        Parameters
+        ----------
+        pool_size : int
+            max number of pooled connections per host
+
+        Returns
+        -------
+        aiohttp.ClientSession
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncMlb requires aiohttp, '
+                              'install it with python3 -m pip install python-mlb-statsapi[async]')
+
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=pool_size))
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        # tasks of one loop cannot interleave here, the lock guards against loops in other threads
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self.create_session(self._pool_size)
+
+        return self._session
+
+    async def close(self):
+        """
+        Close the session and release its pooled connections
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    async def _in_cache(self, fn: Callable, *args):
+        """
+        return fn(*args), run in the loop's default executor unless the cache is a MemoryCache
+
+        SqliteCache and TieredCache read and write a file, which would block
+        the loop.
+        """
+        if self._cache is None or type(self._cache) is MemoryCache:
+            return fn(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args))
+
+    async def _request(self, full_url: str, ep_params: List[Tuple[str, str]],
+                       headers: Dict[str, str] = None) -> Tuple[int, str, str, bytes, Mapping]:
+        """
+        Send a GET request and return status_code, reason, url, body and headers
+        """
+        async with self.session.get(full_url, params=ep_params, headers=headers) as response:
+            content = await response.read()
+            return response.status, response.reason, str(response.url), content, response.headers
+
+    async def get(self, endpoint: str, ep_params: Dict = None, data: Dict = None,
+                  decode: bool = True) -> MlbResult:
+        """
+        return a MlbResult from endpoint
+
+        Parameters
+        ----------
+        endpoint : str
+            rest api endpoint
+        ep_params : dict
+            params
+        data : dict
+            data to send with requests (we aren't using this)
+        decode : bool
+            decode the body into data, if False data is None and only
+            content is set
+
+        Returns
+        -------
+        MlbResult
+        """
+
+        # a few endpoints carry part of their query string, aiohttp wants it all in params
+        path, _, query = endpoint.partition('?')
+        full_url = self.url + path
+        stats = RequestStats(full_url, ep_params) if self._hooks else None
+
+        if stats is None:
+            return await self._get(endpoint, full_url, query, ep_params, None, decode)
+
+        stats.started = time.perf_counter()
+
+        try:
+            return await self._get(endpoint, full_url, query, ep_params, stats, decode)
+
+        except Exception as e:
+            stats.error = e
+            raise
+
+        finally:
+            stats.finished = time.perf_counter()
+            stats.total = stats.finished - stats.started
+            report(self._hooks, stats, self._logger)
+
+    async def _get(self, endpoint: str, full_url: str, query: str, ep_params: Dict,
+                   stats: RequestStats, decode: bool = True) -> MlbResult:
+        cache_key, entry = await self._in_cache(self._get_cached, endpoint, self.url + endpoint, ep_params)
+
+        if entry is not None and entry.is_fresh():
+            if stats is not None:
+                stats.from_cache = True
+            return self._parse_response(full_url, entry.status_code, entry.reason, entry.url, entry.content,
+                                        stats, decode)
+
+        flight_key = cache_key or self._cache_key(self.url + endpoint, ep_params)
+        (response, result), shared = await self._flights.do(
+            flight_key, lambda: self._download(endpoint, full_url, query, ep_params, cache_key, entry, stats,
+                                               decode))
+
+        if shared:
+            if stats is not None:
+                stats.shared = True
+            return self._parse_response(full_url, *response, stats, decode)
+
+        return result
+
+    async def _download(self, endpoint: str, full_url: str, query: str, ep_params: Dict, cache_key: str,
+                        entry: CacheEntry, stats: RequestStats,
+                        decode: bool = True) -> Tuple[Tuple[int, str, str, bytes], MlbResult]:
+        """
+        Send the request, revalidating a stale cache entry, and cache the response
+        """
+        headers = entry.conditional_headers() if entry is not None else None
+
+        params = parse_qsl(query) + self._encode_params(ep_params)
+        attempt = 0
+
+        while True:
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve())
+
+            try:
+                self._logger.debug('url=%s, attempt=%s', full_url, attempt)
+                sent = time.perf_counter()
+                status_code, reason, url, content, response_headers = await self._request(full_url, params, headers)
+
+            except _REQUEST_ERRORS as e:
+                delay = self._retry_delay(full_url, attempt, None, None)
+
+                if delay is None:
+                    self._logger.error(msg=(str(e)))
+                    raise TheMlbStatsApiException('Request failed') from e
+
+            else:
+                delay = self._retry_delay(full_url, attempt, status_code, response_headers)
+
+                if delay is None:
+                    break
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if stats is not None:
+            stats.attempts = attempt + 1
+            stats.ttfb = time.perf_counter() - sent
+
+        if status_code == 304 and entry is not None:
+            entry = await self._in_cache(self._refresh_cached, cache_key, endpoint, entry, response_headers)
+            if stats is not None:
+                stats.revalidated = True
+            raw = (entry.status_code, entry.reason, entry.url, entry.content)
+            return raw, self._parse_response(full_url, *raw, stats, decode)
+
+        raw = (status_code, reason, url, content)
+        result = self._parse_response(full_url, *raw, stats, decode)
+        await self._in_cache(self._set_cached, cache_key, endpoint, ep_params, result, url, content, response_headers)
+
+        return raw, result
+
+
+# a Mlb method replayed more often than this is taken to never finish
+_MAX_REPLAYS = 50
+
+
+class _PendingRequest(BaseException):
+    """
+    Raised by _ReplayAdapter when a Mlb method asks for a result that has not
+    been fetched yet
+
+    A BaseException so that an except Exception in a Mlb method does not
+    catch it.
+    """
+    def __init__(self, adapter_name: str, endpoint: str, ep_params: Dict, decode: bool = True):
+        self.adapter_name = adapter_name
+        self.endpoint = endpoint
+        self.ep_params = ep_params
+        self.decode = decode
+        self.key = _request_key(adapter_name, endpoint, ep_params)
+
+
+def _request_key(adapter_name: str, endpoint: str, ep_params: Dict) -> tuple:
+    return (adapter_name, endpoint, tuple(MlbDataAdapter._encode_params(ep_params)))
+
+
+class _ReplayAdapter:
+    """
+    Stand in for MlbDataAdapter that answers from already fetched results
+
+    Results are kept, a method is replayed from the start and can ask for
+    the same request more than once. Models are built into the dicts they
+    are given, so a result already handed out is decoded again from its
+    content.
+    """
+    def __init__(self, adapter_name: str, prefetched: Dict[tuple, MlbResult], served: set):
+        self._adapter_name = adapter_name
+        self._prefetched = prefetched
+        self._served = served
+
+    def get(self, endpoint: str, ep_params: Dict = None, data: Dict = None, decode: bool = True) -> MlbResult:
+        key = _request_key(self._adapter_name, endpoint, ep_params)
+        result = self._prefetched.get(key)
+
+        if result is None:
+            raise _PendingRequest(self._adapter_name, endpoint, ep_params, decode)
+
+        if key not in self._served:
+            self._served.add(key)
+            return result
+
+        data = None if result.data is None else decode_lowered(result.content)
+        return MlbResult(result.status_code, result.message, data=data, content=result.content)
+
+
+class _ReplayMlb(Mlb):
+    """
+    Mlb whose adapters replay results fetched by AsyncMlb
+    """
+    def __init__(self, prefetched: Dict[tuple, MlbResult], served: set, logger: logging.Logger, identity_maps=None,
+                 raw: str = None):
+        self._mlb_adapter_v1 = _ReplayAdapter('_mlb_adapter_v1', prefetched, served)
+        self._mlb_adapter_v1_1 = _ReplayAdapter('_mlb_adapter_v1_1', prefetched, served)
+        self._logger = logger
+        self._identity_maps = identity_maps
+        self._raw = raw
+
+
+class AsyncMlb:
+    """
+    An asyncio version of Mlb
+
+    Every get_ method of Mlb is available as a coroutine that takes the same
+    arguments and returns the same model objects.
+
+    Attributes
+    ----------
+    hostname: str
+        hostname of statsapi.mlb.com
+    logger: logging.Loger
+        logger
+    pool_size: int
+        number of keep-alive connections shared by every request this
+        instance makes
+    cache: MemoryCache, SqliteCache or TieredCache
+        optional response cache shared by every request this instance makes
+    rate_limiter: RateLimiter
+        optional token bucket shared by every request this instance makes
+    retry: RetryPolicy
+        optional retries with backoff for 429, 5xx and connection errors
+    hooks: Iterable[RequestHook]
+        optional hooks told about every request this instance makes
+    identity_map: str
+        optional 'response' or 'session' to share one Person, Team and League
+        instance per id within each response or across all of them
+    raw: str
+        optional 'dict' or 'bytes' to return responses instead of models
+
+    Examples
+    --------
+    >>> async with AsyncMlb() as mlb:
+    ...     games = await asyncio.gather(mlb.get_game(662242), mlb.get_game(662243))
+    """
+    def __init__(self, hostname: str = 'statsapi.mlb.com', logger: logging.Logger = None,
+                 pool_size: int = 10, cache: ResponseCache = None, rate_limiter: RateLimiter = None,
+                 retry: RetryPolicy = None, hooks: Iterable[RequestHook] = None, identity_map: str = None,
+                 raw: str = None):
+        self._hooks = tuple(hooks or ())
+        self._identity_maps = _identity_map_factory(identity_map)
+        self._raw = _check_raw(raw)
+        self._mlb_adapter_v1 = AsyncMlbDataAdapter(hostname, 'v1', logger, pool_size=pool_size, cache=cache,
+                                                   rate_limiter=rate_limiter, retry=retry, hooks=self._hooks)
+        self._mlb_adapter_v1_1 = AsyncMlbDataAdapter(hostname, 'v1.1', logger, pool_size=pool_size, cache=cache,
+                                                     rate_limiter=rate_limiter, retry=retry, hooks=self._hooks)
+        self._logger = logger or logging.getLogger(__name__)
+        self._logger.setLevel(logging.DEBUG)
+
+    async def close(self):
+        """
+        Close the pooled session shared by this instance's adapters
+        """
+        await self._mlb_adapter_v1.close()
+        await self._mlb_adapter_v1_1.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _fetch(self, request: _PendingRequest) -> MlbResult:
+        adapter = getattr(self, request.adapter_name)
+
+        # sessions are created lazily inside the running loop, hand the first
+        # one created to the other adapter so both share one pool
+        if adapter._session is None:
+            adapter._session = self._mlb_adapter_v1._session or self._mlb_adapter_v1_1._session
+
+        return await adapter.get(request.endpoint, ep_params=request.ep_params, decode=request.decode)
+
+    async def _get_many(self, method: Callable, ids: Iterable, max_workers: int, **params) -> MlbBatchResult:
+        """
+        Await method once per id with at most max_workers calls in flight
+        """
+        ids = list(ids)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def get_one(id):
+            async with semaphore:
+                return await method(id, **params)
+
+        outcomes = await asyncio.gather(*(get_one(id) for id in ids), return_exceptions=True)
+        results = [None] * len(ids)
+        errors = {}
+
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                self._logger.error('%s(%s) failed: %s', method.__name__, ids[index], outcome)
+                errors[ids[index]] = outcome
+            else:
+                results[index] = outcome
+
+        return MlbBatchResult(ids, results, errors)
+
+    async def _call(self, method, *args, **params):
+        """
+        Run a Mlb method, awaiting each request it makes
+
+        The method is replayed until every request it makes has been fetched,
+        so the model building code in Mlb is shared by both clients.
+        """
+        if not self._hooks:
+            return await self._replay(method, *args, **params)
+
+        with collect(self._hooks, method.__name__, self._logger):
+            return await self._replay(method, *args, **params)
+
+    async def _replay(self, method, *args, **params):
+        prefetched = {}
+        served = set()
+
+        for _ in range(_MAX_REPLAYS):
+            try:
+                return method(_ReplayMlb(prefetched, served, self._logger, self._identity_maps, self._raw),
+                              *args, **params)
+            except _PendingRequest as request:
+                prefetched[request.key] = await self._fetch(request)
+
+        raise TheMlbStatsApiException(f'{method.__name__} made more than {_MAX_REPLAYS} requests')
+
+
+# Mlb methods that fan out over another get_ method instead of calling an adapter
+_BATCH_METHODS = {
+    'get_persons_many': 'get_person',
+    'get_teams_many': 'get_team',
+    'get_games': 'get_game',
+    'get_game_line_scores': 'get_game_line_score',
+    'get_game_box_scores': 'get_game_box_score',
+}
+
+
+def _mirror(method):
+    @functools.wraps(method)
+    async def mirrored(self, *args, **params):
+        return await self._call(method, *args, **params)
+    return mirrored
+
+
+def _mirror_batch(method, single_name: str):
+    @functools.wraps(method)
+    async def mirrored(self, ids: Iterable, max_workers: int = 8, **params):
+        return await self._get_many(getattr(self, single_name), ids, max_workers, **params)
+    return mirrored
+
+
+for _name, _method in list(vars(Mlb).items()):
+    if not _name.startswith('get_') or not callable(_method):
+        continue
+
+    if _name in _BATCH_METHODS:
+        setattr(AsyncMlb, _name, _mirror_batch(_method, _BATCH_METHODS[_name]))
+    else:
+        setattr(AsyncMlb, _name, _mirror(_method))
@@ -0,0 +1,456 @@
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+
+class CacheEntry:
+    """
+    A class that holds a cached response from statsapi.mlb.com
+
+    Attributes
+    ----------
+    status_code : int
+        HTTP Return Code
+    reason : str
+        HTTP reason phrase
+    url : str
+        url of the response including params
+    content : bytes
+        raw response body
+    expires : float
+        unix time the entry goes stale, None if it never does
+    etag : str
+        ETag header of the response, used to revalidate a stale entry
+    last_modified : str
+        Last-Modified header of the response, used to revalidate a stale entry
+    """
+
+    def __init__(self, status_code: int, reason: str, url: str, content: bytes,
+                 expires: Optional[float] = None, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None):
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.content = content
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float = None) -> bool:
+        """
+        return True if the entry has not expired
+        """
+        if self.expires is None:
+            return True
+        return (now or time.time()) < self.expires
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        return the headers that ask the server to revalidate this entry
+        """
+        headers = {}
+
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class CachePolicy:
+    """
+    Per endpoint time to live for cached responses
+
+    Endpoints are matched against glob patterns in order, the first match
+    sets the ttl in seconds. A ttl of 0 or None disables caching for that
+    endpoint. Responses that can no longer change, see is_immutable, never
+    expire.
+
+    Attributes
+    ----------
+    ttls : Iterable[Tuple[str, float]]
+        (pattern, ttl) pairs, e.g. ('game/*/feed/live', 10)
+    default_ttl : float
+        ttl of endpoints that match no pattern
+    """
+    DEFAULT_TTLS = (
+        ('game/*/feed/live', 10),
+        # changes since a timecode keep growing, so they are never cached
+        ('game/*/feed/live/diffPatch', 0),
+        ('game/*', 30),
+        ('schedule', MINUTE),
+        ('teams/*/roster', HOUR),
+        ('teams/*/stats', HOUR),
+        ('teams', 6 * HOUR),
+        ('teams/*', 6 * HOUR),
+        ('venues', 24 * HOUR),
+        ('venues/*', 24 * HOUR),
+        ('sports', 24 * HOUR),
+        ('sports/*', 6 * HOUR),
+        ('leagues', 24 * HOUR),
+        ('leagues/*', 24 * HOUR),
+        ('divisions', 24 * HOUR),
+        ('divisions/*', 24 * HOUR),
+        ('seasons/*', 24 * HOUR),
+    )
+
+    # endpoints whose response decides if they are immutable, see needs_data
+    DATA_PATTERNS = ('game/*/feed/live', 'game/*/feed/live/timestamps')
+
+    def __init__(self, ttls: Iterable[Tuple[str, float]] = DEFAULT_TTLS, default_ttl: float = MINUTE):
+        self.ttls = tuple(ttls)
+        self.default_ttl = default_ttl
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """
+        return the ttl in seconds for endpoint
+
+        Parameters
+        ----------
+        endpoint : str
+            rest api endpoint, e.g. teams/133
+
+        Returns
+        -------
+        float
+        """
+        path = endpoint.partition('?')[0]
+
+        for pattern, ttl in self.ttls:
+            if fnmatchcase(path, pattern):
+                return ttl
+
+        return self.default_ttl
+
+    def needs_data(self, endpoint: str, ep_params: Dict) -> bool:
+        """
+        return True if is_immutable reads the response of endpoint
+
+        Responses that were not decoded, e.g. requested with raw='bytes', are
+        decoded to cache them only for these endpoints. A policy whose
+        is_immutable reads the response of other endpoints overrides this.
+
+        Parameters
+        ----------
+        endpoint : str
+            rest api endpoint
+        ep_params : dict
+            params
+
+        Returns
+        -------
+        bool
+        """
+        path = endpoint.partition('?')[0]
+
+        if fnmatchcase(path, 'game/*/feed/live') and (ep_params or {}).get('timecode'):
+            return False
+
+        return any(fnmatchcase(path, pattern) for pattern in self.DATA_PATTERNS)
+
+    def is_immutable(self, endpoint: str, ep_params: Dict, data: Dict) -> bool:
+        """
+        return True if a response can never change
+
+        Final game feeds, feed snapshots requested by timecode, the
+        timestamps of games without a snapshot for a week, drafts and stats
+        of past seasons are immutable.
+
+        Parameters
+        ----------
+        endpoint : str
+            rest api endpoint
+        ep_params : dict
+            params
+        data : dict
+            decoded response with lowercase keys, may be None for endpoints
+            needs_data is False for
+
+        Returns
+        -------
+        bool
+        """
+        path = endpoint.partition('?')[0]
+        ep_params = ep_params or {}
+        current_year = datetime.date.today().year
+
+        if fnmatchcase(path, 'game/*/feed/live'):
+            if ep_params.get('timecode'):
+                return True
+
+            status = data.get('gamedata', {}).get('status', {})
+            return status.get('abstractgamestate') == 'Final'
+
+        if fnmatchcase(path, 'game/*/feed/live/timestamps'):
+            # a game that has not changed for a week is over, or suspended for a long time
+            try:
+                last = datetime.datetime.strptime(data[-1], '%Y%m%d_%H%M%S')
+            except (IndexError, KeyError, TypeError, ValueError):
+                return False
+
+            now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+            return now - last > datetime.timedelta(days=7)
+
+        if fnmatchcase(path, 'draft/*'):
+            year = path.split('/')[1]
+            return year.isdigit() and int(year) < current_year
+
+        if path == 'stats' or fnmatchcase(path, '*/stats'):
+            season = str(ep_params.get('season', ''))
+            return season.isdigit() and int(season) < current_year
+
+        return False
+
+
+class MemoryCache:
+    """
+    A thread safe in memory response cache with LRU eviction
+
+    Attributes
+    ----------
+    max_bytes : int
+        max total size of cached response bodies
+    policy : CachePolicy
+        per endpoint ttls
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, policy: CachePolicy = None):
+        self.max_bytes = max_bytes
+        self.policy = policy or CachePolicy()
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        total size in bytes of cached response bodies
+        """
+        return self._size
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        return the entry for key, fresh or stale, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        """
+        store entry under key, evicting least recently used entries to fit
+        """
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._size -= entry.size
+
+
+class SqliteCache:
+    """
+    A response cache stored in a SQLite database that persists across runs
+
+    Entries are evicted least recently used first once the total size of
+    cached bodies passes max_bytes.
+
+    Attributes
+    ----------
+    path : str
+        path of the database file, created if missing
+    max_bytes : int
+        max total size of cached response bodies
+    policy : CachePolicy
+        per endpoint ttls
+    immutable_only : bool
+        only store entries that never expire, see CachePolicy.is_immutable
+    """
+
+    def __init__(self, path: str, max_bytes: int = 1024 * 1024 * 1024, policy: CachePolicy = None,
+                 immutable_only: bool = True):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.policy = policy or CachePolicy()
+        self.immutable_only = immutable_only
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, status_code INTEGER, reason TEXT, url TEXT, '
+                'content BLOB, expires REAL, size INTEGER, accessed REAL, etag TEXT, last_modified TEXT)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+            # databases written before revalidation was added lack the validator columns
+            columns = [row[1] for row in self._db.execute('PRAGMA table_info(responses)')]
+            for column in ('etag', 'last_modified'):
+                if column not in columns:
+                    self._db.execute(f'ALTER TABLE responses ADD COLUMN {column} TEXT')
+
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        total size in bytes of cached response bodies
+        """
+        return self._size
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        return the entry for key, fresh or stale, or None
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT status_code, reason, url, content, expires, etag, last_modified '
+                'FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            with self._db:
+                self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (time.time(), key))
+
+        return CacheEntry(*row)
+
+    def set(self, key: str, entry: CacheEntry):
+        """
+        store entry under key, evicting least recently used entries to fit
+        """
+        if entry.size > self.max_bytes or (self.immutable_only and entry.expires is not None):
+            return
+
+        with self._lock, self._db:
+            self._pop(key)
+            self._db.execute(
+                'INSERT INTO responses (key, status_code, reason, url, content, expires, size, accessed, '
+                'etag, last_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, entry.status_code, entry.reason, entry.url, entry.content,
+                 entry.expires, entry.size, time.time(), entry.etag, entry.last_modified)
+            )
+            self._size += entry.size
+
+            if self._size > self.max_bytes:
+                rows = self._db.execute('SELECT key FROM responses ORDER BY accessed').fetchall()
+
+                for (oldest_key,) in rows:
+                    if self._size <= self.max_bytes:
+                        break
+                    self._pop(oldest_key)
+
+    def delete(self, key: str):
+        with self._lock, self._db:
+            self._pop(key)
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+            self._size = 0
+
+    def close(self):
+        self._db.close()
+
+    def _pop(self, key: str):
+        row = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+
+        if row is not None:
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._size -= row[0]
+
+
+class TieredCache:
+    """
+    A cache that checks several caches in order, e.g. memory then disk
+
+    Hits in a later cache are copied into the earlier ones, new entries are
+    offered to every cache.
+
+    Attributes
+    ----------
+    caches : Iterable
+        caches to check, fastest first
+    policy : CachePolicy
+        per endpoint ttls, defaults to the first cache's policy
+    """
+
+    def __init__(self, *caches, policy: CachePolicy = None):
+        self.caches = caches
+        self.policy = policy or caches[0].policy
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        return the entry for key from the first cache that has it
+        """
+        for index, cache in enumerate(self.caches):
+            entry = cache.get(key)
+
+            if entry is not None:
+                for faster_cache in self.caches[:index]:
+                    faster_cache.set(key, entry)
+                return entry
+
+        return None
+
+    def set(self, key: str, entry: CacheEntry):
+        for cache in self.caches:
+            cache.set(key, entry)
+
+    def delete(self, key: str):
+        for cache in self.caches:
+            cache.delete(key)
+
+    def clear(self):
+        for cache in self.caches:
+            cache.clear()
+
+
+ResponseCache = Union[MemoryCache, SqliteCache, TieredCache]
@@ -1,7 +1,59 @@
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
 from .exceptions import TheMlbStatsApiException
+from .mlb_cache import CacheEntry, ResponseCache
+from .mlb_ratelimit import RateLimiter, RetryPolicy
+from .mlb_hooks import RequestHook, RequestStats, report
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+import json
+import threading
+import time
+
+
+class _LoweredKeys(dict):
+    """
+    Memo of lowercased JSON keys, the feeds repeat the same few hundred keys
+    so each is lowered once instead of once per object
+    """
+    max_size = 65536
+
+    def __missing__(self, key: str) -> str:
+        if len(self) >= self.max_size:
+            # player keys like ID660271 are unbounded, start over rather than grow
+            self.clear()
+
+        lowered = self[key] = key.lower()
+        return lowered
+
+
+_lowered_keys = _LoweredKeys()
+
+
+def _lowered_dict(pairs: List[Tuple[str, object]]) -> dict:
+    """
+    json object_pairs_hook that builds each object with lowercase keys
+    """
+    return {_lowered_keys[key]: value for key, value in pairs}
+
+
+def decode_lowered(content: bytes) -> Union[dict, list]:
+    """
+    Decode a JSON body with every object key lowercased
+
+    Keys are lowered while decoding, so the tree is only built once.
+
+    Parameters
+    ----------
+    content : bytes
+        raw JSON
+
+    Returns
+    -------
+    dict or list
+    """
+    return json.loads(content, object_pairs_hook=_lowered_dict)
 
 
 class MlbResult:
@@ -15,18 +67,102 @@ class MlbResult:
     message : str
         Message returned from REST Endpoint
     data : dict
-        JSON Data received from request
+        JSON Data received from request, None if the body was not decoded
+    content : bytes
+        raw response body
     """
 
-    def __init__(self, status_code: int, message: str, data: Dict = {}):
+    def __init__(self, status_code: int, message: str, data: Dict = {}, content: bytes = None):
         self.status_code = int(status_code)
         self.message = str(message)
+        self.content = content
 
         self.data = data
-        if 'copyright' in data:
+        if data is not None and 'copyright' in data:
             del data['copyright']
 
 
+class MlbBatchResult:
+    """
+    A class that holds the results of a batch of requests made by id
+
+    Attributes
+    ----------
+    ids : list
+        requested ids, in input order
+    results : list
+        result for each id in input order, None if the request failed or
+        nothing was found
+    errors : dict
+        exception raised for each id that failed
+    """
+
+    def __init__(self, ids: List, results: List, errors: Dict = None):
+        self.ids = ids
+        self.results = results
+        self.errors = errors or {}
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+
+class _Flight:
+    """
+    A request in flight and the outcome shared with every caller waiting on it
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class _SingleFlight:
+    """
+    Run at most one call per key at a time, concurrent callers with the same
+    key wait for that call and share its outcome
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key: str, fn: Callable) -> Tuple[object, bool]:
+        """
+        return the value of fn and whether it came from another caller's call
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = fn()
+            return flight.value, False
+
+        except BaseException as e:
+            flight.error = e
+            raise
+
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
 class MlbDataAdapter:
     """
     Adapter for calling the mlb statsapi endpoint
@@ -39,17 +175,117 @@ class MlbDataAdapter:
         api version
     logger : logging.Logger
         instance of logger class
+    session : requests.Session
+        pooled keep-alive session used for every request, created with
+        create_session if not passed. Pass the same session to several
+        adapters to share their connection pool
+    pool_size : int
+        number of connections kept alive per host when the adapter creates
+        its own session
+    cache : MemoryCache, SqliteCache or TieredCache
+        optional response cache consulted before the network, ttls are set
+        per endpoint by the cache's policy
+    rate_limiter : RateLimiter
+        optional token bucket every request waits on, share it between
+        adapters to limit them together
+    retry : RetryPolicy
+        optional retries with backoff for 429, 5xx and connection errors,
+        without it a 5xx raises TheMlbStatsApiException right away
+    hooks : Iterable[RequestHook]
+        optional hooks told about every request with its RequestStats
+
+    Identical requests made at the same time from several threads share one
+    HTTP request, every caller gets its own MlbResult decoded from the same
+    response.
     """
 
-    def __init__(self, hostname: str = 'statsapi.mlb.com', ver: str = 'v1', logger: logging.Logger = None):
+    def __init__(self, hostname: str = 'statsapi.mlb.com', ver: str = 'v1', logger: logging.Logger = None,
+                 session: requests.Session = None, pool_size: int = 10, cache: ResponseCache = None,
+                 rate_limiter: RateLimiter = None, retry: RetryPolicy = None,
+                 hooks: Iterable[RequestHook] = None):
         self.url = f'https://{hostname}/api/{ver}/'
         self._logger = logger or logging.getLogger(__name__)
         self._logger.setLevel(logging.DEBUG)
+        self._pool_size = pool_size
+        self._session = session or self._default_session()
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._hooks = tuple(hooks or ())
+        self._flights = self._single_flight()
+
+    # shares one request between identical concurrent requests
+    _single_flight = _SingleFlight
+
+    def _default_session(self) -> requests.Session:
+        """
+        return the session used when none is passed
+        """
+        return self.create_session(self._pool_size)
+
+    @staticmethod
+    def create_session(pool_size: int = 10) -> requests.Session:
+        """
+        Create a requests session that keeps up to pool_size connections alive
+
+        Parameters
+        ----------
+        pool_size : int
+            max number of pooled connections per host
+
+        Returns
+        -------
+        requests.Session
+        """
+        session = requests.Session()
+        http_adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', http_adapter)
+        session.mount('http://', http_adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    def close(self):
+        """
+        Close the session and release its pooled connections
+        """
+        self._session.close()
+
+    @staticmethod
+    def _encode_params(ep_params: Dict = None) -> List[Tuple[str, str]]:
+        """
+        Flatten params into (key, value) pairs the way requests encodes them
+
+        None values are dropped and list values are repeated once per item.
+
+        Parameters
+        ----------
+        ep_params : dict
+            params
+
+        Returns
+        -------
+        list of tuples
+        """
+        encoded = []
+
+        for key, value in (ep_params or {}).items():
+            if isinstance(value, (list, tuple)):
+                encoded.extend((key, str(item)) for item in value if item is not None)
+            elif value is not None:
+                encoded.append((key, str(value)))
+
+        return encoded
 
     def _transform_keys_in_data(self, data) -> dict:
         """
         Recursivly transform all the keys in a dictionary to lowercase
 
+        Responses are lowercased while decoding, see decode_lowered, this is
+        kept for data decoded elsewhere.
+
         Parameters
         ----------
         data : dict
@@ -79,7 +315,7 @@ class MlbDataAdapter:
         else:
             return data
 
-    def get(self, endpoint: str, ep_params: Dict = None, data: Dict = None) -> MlbResult:
+    def get(self, endpoint: str, ep_params: Dict = None, data: Dict = None, decode: bool = True) -> MlbResult:
         """
         return a MlbResult from endpoint
 
@@ -91,6 +327,9 @@ class MlbDataAdapter:
             params
         data : dict
             data to send with requests (we aren't using this)
+        decode : bool
+            decode the body into data, if False data is None and only
+            content is set
 
         Returns
         -------
@@ -98,45 +337,367 @@ class MlbDataAdapter:
         """
 
         full_url = self.url + endpoint
-        print (full_url)
-        logline_pre = f'url={full_url}'
-        logline_post = " ,".join((logline_pre, 'success={}, status_code={}, message={}, url={}'))
+        stats = RequestStats(full_url, ep_params) if self._hooks else None
+
+        if stats is None:
+            return self._get(endpoint, full_url, ep_params, None, decode)
+
+        stats.started = time.perf_counter()
+
+        try:
+            return self._get(endpoint, full_url, ep_params, stats, decode)
+
+        except Exception as e:
+            stats.error = e
+            raise
+
+        finally:
+            stats.finished = time.perf_counter()
+            stats.total = stats.finished - stats.started
+            report(self._hooks, stats, self._logger)
+
+    def _get(self, endpoint: str, full_url: str, ep_params: Optional[Dict],
+             stats: Optional[RequestStats], decode: bool = True) -> MlbResult:
+        cache_key, entry = self._get_cached(endpoint, full_url, ep_params)
+
+        if entry is not None and entry.is_fresh():
+            if stats is not None:
+                stats.from_cache = True
+            return self._parse_response(full_url, entry.status_code, entry.reason, entry.url, entry.content,
+                                        stats, decode)
+
+        # concurrent callers share the leader's response, but decode their own
+        # copy of it since models modify the data they are built from
+        flight_key = cache_key or self._cache_key(full_url, ep_params)
+        (response, result), shared = self._flights.do(
+            flight_key, lambda: self._download(endpoint, full_url, ep_params, cache_key, entry, stats, decode))
+
+        if shared:
+            if stats is not None:
+                stats.shared = True
+            return self._parse_response(full_url, *response, stats, decode)
+
+        return result
+
+    def stream(self, endpoint: str, ep_params: Dict = None, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        yield the body of a response from endpoint in chunks as it downloads
+
+        A fresh cached response is yielded from the cache, otherwise the body
+        is streamed from the network and is not cached, so it never has to
+        be held in memory whole. The request is reported to hooks once the
+        body has been read or the caller stops reading.
+
+        Parameters
+        ----------
+        endpoint : str
+            rest api endpoint
+        ep_params : dict
+            params
+        chunk_size : int
+            max bytes per chunk
+
+        Yields
+        ------
+        bytes
+            nothing for a 4xx response
+
+        Raises
+        ------
+        TheMlbStatsApiException
+            for a 5xx response or a failed request
+        """
+        full_url = self.url + endpoint
+        stats = RequestStats(full_url, ep_params) if self._hooks else None
+
+        if stats is None:
+            yield from self._stream(full_url, endpoint, ep_params, chunk_size, None)
+            return
+
+        stats.started = time.perf_counter()
 
         try:
-            self._logger.debug(logline_post)
-            response = requests.get(url=full_url, params=ep_params)
+            yield from self._stream(full_url, endpoint, ep_params, chunk_size, stats)
+
+        except Exception as e:
+            stats.error = e
+            raise
+
+        finally:
+            stats.finished = time.perf_counter()
+            stats.total = stats.finished - stats.started
+            report(self._hooks, stats, self._logger)
+
+    def _stream(self, full_url: str, endpoint: str, ep_params: Optional[Dict], chunk_size: int,
+                stats: Optional[RequestStats]) -> Iterator[bytes]:
+        _, entry = self._get_cached(endpoint, full_url, ep_params)
+
+        if entry is not None and entry.is_fresh():
+            if stats is not None:
+                stats.from_cache = True
+            status_code, reason, url, content = entry.status_code, entry.reason, entry.url, entry.content
+            chunks = (content[start:start + chunk_size] for start in range(0, len(content), chunk_size))
+            response = None
+
+        else:
+            response, received = self._send(full_url, ep_params, None, stats, read=False)
+            status_code, reason, url = response.status_code, response.reason, response.url
+            chunks = response.iter_content(chunk_size)
+
+        size = 0
+
+        try:
+            # the status is checked with an empty body, the body is not decoded here
+            self._parse_response(full_url, status_code, reason, url, b'', stats, decode=False)
+
+            if status_code >= 400:
+                return
+
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
 
         except requests.exceptions.RequestException as e:
             self._logger.error(msg=(str(e)))
             raise TheMlbStatsApiException('Request failed') from e
 
+        finally:
+            if response is not None:
+                response.close()
+
+            # bytes read before the caller stopped, if it stopped early
+            if stats is not None:
+                stats.bytes = size
+
+                if response is not None:
+                    stats.download = time.perf_counter() - received
+
+    def _download(self, endpoint: str, full_url: str, ep_params: Dict, cache_key: Optional[str],
+                  entry: Optional[CacheEntry], stats: Optional[RequestStats],
+                  decode: bool = True) -> Tuple[Tuple[int, str, str, bytes], MlbResult]:
+        """
+        Send the request, revalidating a stale cache entry, and cache the response
+
+        Returns
+        -------
+        tuple
+            (status_code, reason, url, content) of the response and its MlbResult
+        """
+        # a stale entry with validators is revalidated instead of downloaded again
+        headers = entry.conditional_headers() if entry is not None else None
+        response, received = self._send(full_url, ep_params, headers, stats)
+        content = response.content
+
+        if stats is not None:
+            stats.download = time.perf_counter() - received
+
+        if response.status_code == 304 and entry is not None:
+            entry = self._refresh_cached(cache_key, endpoint, entry, response.headers)
+            if stats is not None:
+                stats.revalidated = True
+            raw = (entry.status_code, entry.reason, entry.url, entry.content)
+            return raw, self._parse_response(full_url, *raw, stats, decode)
+
+        raw = (response.status_code, response.reason, response.url, content)
+        result = self._parse_response(full_url, *raw, stats, decode)
+        self._set_cached(cache_key, endpoint, ep_params, result, response.url, content,
+                         response.headers)
+
+        return raw, result
+
+    def _send(self, full_url: str, ep_params: Optional[Dict], headers: Optional[Dict],
+              stats: Optional[RequestStats], read: bool = True) -> Tuple[requests.Response, float]:
+        """
+        Send a request, waiting on the rate limiter and retrying as the retry policy says
+
+        Parameters
+        ----------
+        read : bool
+            read the body before returning, so a connection lost while
+            reading it is retried too. If False the body is left to be
+            streamed by the caller
+
+        Returns
+        -------
+        tuple
+            the response and the time its headers were received
+        """
+        attempt = 0
+
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            try:
+                self._logger.debug('url=%s, attempt=%s', full_url, attempt)
+                sent = time.perf_counter()
+
+                # stream so the wait for headers and the body download are timed apart
+                response = self._session.get(url=full_url, params=ep_params, headers=headers, stream=True)
+                received = time.perf_counter()
+
+                if read:
+                    response.content
+
+            except requests.exceptions.RequestException as e:
+                delay = self._retry_delay(full_url, attempt, None, None)
+
+                if delay is None:
+                    self._logger.error(msg=(str(e)))
+                    raise TheMlbStatsApiException('Request failed') from e
+
+            else:
+                delay = self._retry_delay(full_url, attempt, response.status_code, response.headers)
+
+                if delay is None:
+                    break
+
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+        if stats is not None:
+            stats.attempts = attempt + 1
+            stats.ttfb = received - sent
+
+        return response, received
+
+    def _retry_delay(self, full_url: str, attempt: int, status_code: Optional[int],
+                     headers: Optional[Mapping]) -> Optional[float]:
+        """
+        return the seconds to wait before retrying a request, or None to stop
+
+        A 429 also holds the rate limiter so other requests back off with it.
+        """
+        if self._retry is None:
+            return None
+
+        retry_after = headers.get('Retry-After') if headers is not None else None
+        delay = self._retry.retry_delay(attempt, status_code, retry_after)
+
+        if delay is None:
+            return None
+
+        if status_code == 429 and self._rate_limiter is not None:
+            self._rate_limiter.hold(delay)
+
+        self._logger.warning('url=%s, status_code=%s, retrying in %.2fs', full_url, status_code, delay)
+        return delay
+
+    def _cache_key(self, full_url: str, ep_params: Dict = None) -> str:
+        """
+        return full_url with params sorted, so equal requests share a key
+        """
+        return f'{full_url}?{urlencode(sorted(self._encode_params(ep_params)))}'
+
+    def _get_cached(self, endpoint: str, full_url: str,
+                    ep_params: Dict = None) -> Tuple[Optional[str], Optional[CacheEntry]]:
+        """
+        return the cache key and cached entry for a request
+
+        The key is None when there is no cache or the cache policy does not
+        cache endpoint, the entry is None on a cache miss.
+        """
+        if self._cache is None or not self._cache.policy.ttl_for(endpoint):
+            return None, None
+
+        cache_key = self._cache_key(full_url, ep_params)
+        return cache_key, self._cache.get(cache_key)
+
+    def _set_cached(self, cache_key: Optional[str], endpoint: str, ep_params: Dict,
+                    result: MlbResult, url: str, content: bytes, headers: Mapping):
+        """
+        store a successful response in the cache, immutable responses never expire
+        """
+        if cache_key is None or result.status_code != 200:
+            return
+
+        policy = self._cache.policy
+        data = result.data
+
+        # undecoded results are decoded only where the response decides if they are immutable
+        if data is None and policy.needs_data(endpoint, ep_params):
+            data = decode_lowered(content)
+
+        if policy.is_immutable(endpoint, ep_params, data):
+            expires = None
+        else:
+            expires = time.time() + policy.ttl_for(endpoint)
+
+        self._cache.set(cache_key, CacheEntry(result.status_code, result.message, url, content, expires,
+                                              headers.get('ETag'), headers.get('Last-Modified')))
+
+    def _refresh_cached(self, cache_key: str, endpoint: str, entry: CacheEntry,
+                        headers: Mapping) -> CacheEntry:
+        """
+        extend a stale entry after a 304 Not Modified response
+        """
+        entry = CacheEntry(entry.status_code, entry.reason, entry.url, entry.content,
+                           time.time() + self._cache.policy.ttl_for(endpoint),
+                           headers.get('ETag', entry.etag), headers.get('Last-Modified', entry.last_modified))
+        self._cache.set(cache_key, entry)
+        return entry
+
+    def _parse_response(self, full_url: str, status_code: int, reason: str,
+                        url: str, content: bytes, stats: RequestStats = None, decode: bool = True) -> MlbResult:
+        """
+        Decode a response body and return a MlbResult for its status code
+
+        Parameters
+        ----------
+        full_url : str
+            requested url without params
+        status_code : int
+            HTTP return code
+        reason : str
+            HTTP reason phrase
+        url : str
+            url of the response including params
+        content : bytes
+            raw response body
+        stats : RequestStats
+            optional stats to record status, size and decode timings in
+        decode : bool
+            decode content into data, if False data is None
+
+        Returns
+        -------
+        MlbResult
+        """
+        logline = 'url=%s, success=%s, status_code=%s, message=%s, url=%s'
+
+        if stats is not None:
+            stats.status_code = status_code
+            stats.bytes = len(content)
+            started = time.perf_counter()
+
         try:
-            data = response.json()
+            data = decode_lowered(content) if decode else None
 
-        except (ValueError, requests.JSONDecodeError) as e: 
+        except ValueError as e:
             self._logger.error(msg=(str(e)))
             raise TheMlbStatsApiException('Bad JSON in response') from e
 
-        if response.status_code <= 200 and response.status_code <= 299:
-            self._logger.debug(msg=logline_post.format('success',
-            response.status_code, response.reason, response.url))
+        if stats is not None and decode:
+            stats.decode = time.perf_counter() - started
+
+        if status_code <= 200 and status_code <= 299:
+            self._logger.debug(logline, full_url, 'success', status_code, reason, url)
 
-            data = self._transform_keys_in_data(data)
-            return MlbResult(response.status_code, message=response.reason, data=data)
+            return MlbResult(status_code, message=reason, data=data, content=content)
 
-        elif response.status_code >= 400 and response.status_code <= 499:  
-            self._logger.error(msg=logline_post.format('Invalid Request',
-            response.status_code, response.reason, response.url))
+        elif status_code >= 400 and status_code <= 499:
+            self._logger.error(logline, full_url, 'Invalid Request', status_code, reason, url)
 
             # return MlbResult with 404 and empty data
-            return MlbResult(response.status_code, message=response.reason, data={})
+            return MlbResult(status_code, message=reason, data={}, content=content)
 
-        elif response.status_code >= 500 and response.status_code <= 599:
+        elif status_code >= 500 and status_code <= 599:
 
-            self._logger.error(msg=logline_post.format('Internal error occurred', 
-            response.status_code, response.reason, response.url))
+            self._logger.error(logline, full_url, 'Internal error occurred', status_code, reason, url)
 
-            raise TheMlbStatsApiException(f"{response.status_code}: {response.reason}")
+            raise TheMlbStatsApiException(f"{status_code}: {reason}")
 
         else:
-            raise TheMlbStatsApiException(f"{response.status_code}: {response.reason}")
+            raise TheMlbStatsApiException(f"{status_code}: {reason}")
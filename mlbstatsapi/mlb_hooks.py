@@ -0,0 +1,177 @@
+import contextlib
+import contextvars
+import functools
+import logging
+import time
+
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class RequestStats:
+    """
+    A class that holds timings and details of one request made by an adapter
+
+    Durations are in seconds and None for steps that did not happen, e.g.
+    a response served from the cache has no ttfb or download. The
+    connection setup, DNS and connect, is part of ttfb since requests
+    does not report it on its own.
+
+    Attributes
+    ----------
+    url : str
+        requested url without params
+    params : dict
+        params of the request
+    method : str
+        name of the Mlb method that made the request, None when the adapter
+        is used directly
+    status_code : int
+        HTTP return code
+    bytes : int
+        size of the response body
+    from_cache : bool
+        True if the response came from the cache without a request
+    revalidated : bool
+        True if a stale cached response was confirmed with a 304
+    shared : bool
+        True if the response was downloaded by a concurrent identical request
+    attempts : int
+        number of requests sent, more than 1 after retries
+    ttfb : float
+        time from sending the request to receiving the response headers
+    download : float
+        time to read the response body
+    decode : float
+        time to decode the JSON body, keys are lowercased while decoding
+    model : float
+        time the Mlb method spent building models from the response
+    total : float
+        time spent in MlbDataAdapter.get
+    error : Exception
+        exception raised by the request, if any
+    """
+
+    def __init__(self, url: str, params: Dict = None):
+        self.url = url
+        self.params = params
+        self.method = None
+        self.status_code = None
+        self.bytes = None
+        self.from_cache = False
+        self.revalidated = False
+        self.shared = False
+        self.attempts = 0
+        self.ttfb = None
+        self.download = None
+        self.decode = None
+        self.model = None
+        self.total = None
+        self.error = None
+        # perf_counter readings used to work out model time
+        self.started = None
+        self.finished = None
+
+    def __repr__(self) -> str:
+        kws = [f'{key}={value}' for key, value in self.__dict__.items()
+               if value is not None and value is not False and key not in ('started', 'finished')]
+        return '{}({})'.format(type(self).__name__, ', '.join(kws))
+
+
+class RequestHook:
+    """
+    Base class for request hooks
+
+    Pass hooks to Mlb, AsyncMlb or an adapter and on_request is called once
+    per request with its RequestStats. Requests made by Mlb methods are
+    reported after the method has built its models, so model is set.
+    """
+
+    def on_request(self, stats: RequestStats):
+        pass
+
+
+class LoggingHook(RequestHook):
+    """
+    A request hook that logs every request and its timings
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        logger to write to
+    level : int
+        logging level of the records
+    """
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def on_request(self, stats: RequestStats):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, '%r', stats)
+
+
+# requests made inside an instrumented Mlb method are collected here so they
+# can be reported with the time spent building models from them
+_collected: contextvars.ContextVar[Optional[List[RequestStats]]] = contextvars.ContextVar(
+    'mlbstatsapi_collected_requests', default=None)
+
+
+def report(hooks: Iterable[RequestHook], stats: RequestStats, logger: logging.Logger = None):
+    """
+    hand stats to the running Mlb method if there is one, else to hooks
+    """
+    collected = _collected.get()
+
+    if collected is not None:
+        collected.append(stats)
+    else:
+        _call_hooks(hooks, stats, logger)
+
+
+def _call_hooks(hooks: Iterable[RequestHook], stats: RequestStats, logger: logging.Logger = None):
+    for hook in hooks:
+        try:
+            hook.on_request(stats)
+        except Exception:
+            # a broken hook should never fail the request it reports on
+            (logger or logging.getLogger(__name__)).exception('request hook %r failed', hook)
+
+
+@contextlib.contextmanager
+def collect(hooks: Iterable[RequestHook], method_name: str, logger: logging.Logger = None):
+    """
+    Collect the requests made inside the block, then report them to hooks
+    with the time spent building models from each response
+    """
+    collected = []
+    token = _collected.set(collected)
+
+    try:
+        yield collected
+
+    finally:
+        finished = time.perf_counter()
+        _collected.reset(token)
+
+        for index, stats in enumerate(collected):
+            # models are built between one response and the next request
+            next_started = collected[index + 1].started if index + 1 < len(collected) else finished
+            stats.method = method_name
+            stats.model = next_started - stats.finished
+            _call_hooks(hooks, stats, logger)
+
+
+def instrument(method: Callable) -> Callable:
+    """
+    Wrap a Mlb method so the requests it makes are reported to its hooks
+    """
+    @functools.wraps(method)
+    def instrumented(self, *args, **params):
+        if not self._hooks:
+            return method(self, *args, **params)
+
+        with collect(self._hooks, method.__name__, self._logger):
+            return method(self, *args, **params)
+
+    return instrumented
@@ -0,0 +1,1033 @@
+import collections
+import copy
+import datetime
+import functools
+import heapq
+import logging
+import threading
+import time
+
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.game.livedata.plays.play import Play
+from mlbstatsapi.models.game.livedata.plays.play.playevent import PlayEvent
+from mlbstatsapi.models.lazy import LazyModel
+from mlbstatsapi.models.constructors import from_dict
+
+from .mlb_dataadapter import MlbDataAdapter
+from .mlb_ratelimit import RateLimiter
+from .exceptions import TheMlbStatsApiException
+
+
+_MISSING = object()
+
+
+def copy_json(value):
+    """
+    return a copy of a decoded JSON value, some models build into the dicts they are given
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+
+    return value
+
+
+def _pointer(path: str) -> List[str]:
+    """
+    return the lowercased reference tokens of a JSON pointer, e.g. /liveData/plays -> ['livedata', 'plays']
+    """
+    if not path:
+        return []
+
+    if not path.startswith('/'):
+        raise TheMlbStatsApiException(f'Bad JSON pointer in diff patch: {path!r}')
+
+    return [token.replace('~1', '/').replace('~0', '~').lower() for token in path[1:].split('/')]
+
+
+class _Patcher:
+    """
+    Applies JSON patch operations to a document without changing it
+
+    Every dict and list on the path of an operation is copied before it is
+    changed, once per patch, so the patched document shares everything that
+    did not change with the original and the original stays as it was.
+    """
+
+    def __init__(self, document: Union[dict, list]):
+        self.document = document
+        # copies made by this patch, kept so their ids are not reused
+        self._copies: Dict[int, Union[dict, list]] = {}
+
+    def _writable(self, container: Union[dict, list]) -> Union[dict, list]:
+        if id(container) in self._copies:
+            return container
+
+        if not isinstance(container, (dict, list)):
+            raise TypeError(f'cannot index {type(container).__name__}')
+
+        container = dict(container) if isinstance(container, dict) else list(container)
+        self._copies[id(container)] = container
+        return container
+
+    @staticmethod
+    def _key(container: Union[dict, list], token: str, insert: bool = False) -> Union[str, int]:
+        if isinstance(container, dict):
+            return token
+
+        if insert and token == '-':
+            return len(container)
+
+        if not token.isdigit():
+            raise ValueError(f'{token!r} is not a list index')
+
+        index = int(token)
+
+        if index > len(container) or (index == len(container) and not insert):
+            raise IndexError(f'list index {index} out of range')
+
+        return index
+
+    def _parent(self, tokens: List[str]) -> Union[dict, list]:
+        node = self.document = self._writable(self.document)
+
+        for token in tokens[:-1]:
+            key = self._key(node, token)
+            child = node[key] = self._writable(node[key])
+            node = child
+
+        return node
+
+    def get(self, tokens: List[str]):
+        node = self.document
+
+        for token in tokens:
+            if not isinstance(node, (dict, list)):
+                raise TypeError(f'cannot index {type(node).__name__}')
+
+            node = node[self._key(node, token)]
+
+        return node
+
+    def add(self, tokens: List[str], value):
+        if not tokens:
+            self.document = value
+            return
+
+        parent = self._parent(tokens)
+        key = self._key(parent, tokens[-1], insert=True)
+
+        if isinstance(parent, list):
+            parent.insert(key, value)
+        else:
+            parent[key] = value
+
+    def remove(self, tokens: List[str]):
+        if not tokens:
+            raise ValueError('cannot remove the whole document')
+
+        parent = self._parent(tokens)
+        key = self._key(parent, tokens[-1])
+        value = parent[key]
+        del parent[key]
+        return value
+
+    def replace(self, tokens: List[str], value):
+        if not tokens:
+            self.document = value
+            return
+
+        parent = self._parent(tokens)
+        key = self._key(parent, tokens[-1])
+
+        if isinstance(parent, dict) and key not in parent:
+            raise KeyError(key)
+
+        parent[key] = value
+
+    def apply(self, operation: dict):
+        op = operation.get('op')
+        tokens = _pointer(operation.get('path', ''))
+
+        if op == 'add':
+            self.add(tokens, operation['value'])
+        elif op == 'remove':
+            self.remove(tokens)
+        elif op == 'replace':
+            self.replace(tokens, operation['value'])
+        elif op == 'move':
+            self.add(tokens, self.remove(_pointer(operation['from'])))
+        elif op == 'copy':
+            self.add(tokens, self.get(_pointer(operation['from'])))
+        elif op == 'test':
+            if self.get(tokens) != operation['value']:
+                raise ValueError(f'test failed at {operation.get("path")!r}')
+        else:
+            raise ValueError(f'unknown op {op!r}')
+
+
+def apply_patch(document: Union[dict, list], operations: Iterable[dict]) -> Union[dict, list]:
+    """
+    return document with JSON patch operations applied, document is left as it was
+
+    Paths are matched against the lowercase keys of documents decoded with
+    decode_lowered, so the camelCase paths of the api can be used as they
+    are. The patched document shares every dict and list the operations
+    did not change with document.
+
+    Parameters
+    ----------
+    document : dict or list
+        decoded JSON with lowercase keys
+    operations : Iterable[dict]
+        RFC 6902 operations, e.g. {'op': 'replace', 'path': '/gameData/status/detailedState', 'value': 'Final'}
+
+    Returns
+    -------
+    dict or list
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        for an operation that does not apply to document
+    """
+    patcher = _Patcher(document)
+
+    for operation in operations:
+        try:
+            patcher.apply(operation)
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise TheMlbStatsApiException(f'Bad diff patch operation {operation!r}: {e}') from e
+
+    return patcher.document
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    return frozenset(model_field.name for model_field in fields(cls))
+
+
+def _is_model(value) -> bool:
+    return is_dataclass(value) and not isinstance(value, type)
+
+
+def _patched_items(items: Union[list, dict], before: Union[list, dict], after: Union[list, dict]):
+    """
+    return a list or dict of models brought up to date with after, or None if they cannot be
+
+    Each item is taken to be built with from_dict from the item of before at
+    the same index or key. Items whose dict did not change are kept.
+    """
+    values = items if isinstance(items, list) else list(items.values())
+
+    if not values or not all(_is_model(item) for item in values):
+        return None
+
+    if isinstance(items, list):
+        if len(items) != len(before):
+            return None
+        keys = range(len(after))
+        olds = dict(enumerate(before))
+    else:
+        if items.keys() != before.keys():
+            return None
+        keys = after.keys()
+        olds = before
+
+    known = {id(olds[key]): items[key] for key in olds}
+    cls = type(values[0])
+    patched = []
+
+    for key in keys:
+        raw = after[key]
+        item = known.get(id(raw))
+
+        if item is None:
+            if not isinstance(raw, dict) or not raw:
+                return None
+
+            old = olds.get(key)
+
+            if isinstance(old, dict) and old:
+                item = patch_model(items[key], old, raw)
+            else:
+                item = from_dict(cls, copy_json(raw))
+
+        patched.append(item)
+
+    return patched if isinstance(items, list) else dict(zip(keys, patched))
+
+
+def patch_model(model, before: dict, after: dict):
+    """
+    return model brought up to date with the dict it was built from changing from before to after
+
+    Only what changed is rebuilt. after must share the dicts and lists that
+    did not change with before, like the documents apply_patch returns, so
+    a change is found by identity without comparing values. A nested model
+    whose dict changed is patched the same way, and a model with a changed
+    value of its own is built again from after. model is left as it was, a
+    shallow copy with the changed attributes is returned, or model itself
+    if nothing it has changed.
+
+    Parameters
+    ----------
+    model : dataclass
+        model built from before, e.g. with from_dict
+    before : dict
+        dict model was built from
+    after : dict
+        before with patches applied
+
+    Returns
+    -------
+    dataclass
+    """
+    if before is after:
+        return model
+
+    names = _field_names(type(model))
+    builders = model._builders if isinstance(model, LazyModel) else {}
+    changes = {}
+
+    for key in before.keys() | after.keys():
+        old, new = before.get(key, _MISSING), after.get(key, _MISSING)
+
+        if old is new or key not in names:
+            continue
+
+        if new is _MISSING:
+            return from_dict(type(model), copy_json(after))
+
+        current = getattr(model, key)
+        patched = None
+
+        if _is_model(current) and isinstance(old, dict) and isinstance(new, dict) and old and new:
+            patched = patch_model(current, old, new)
+        elif isinstance(current, (list, dict)) and type(old) is type(new) is type(current):
+            patched = _patched_items(current, old, new)
+
+        if patched is None:
+            if key in builders:
+                patched = builders[key](copy_json(new), False)
+            elif isinstance(model, LazyModel):
+                # only the builders change the values of a lazy model
+                patched = copy_json(new)
+            else:
+                return from_dict(type(model), copy_json(after))
+
+        changes[key] = patched
+
+    if not changes:
+        return model
+
+    model = copy.copy(model)
+
+    for key, value in changes.items():
+        setattr(model, key, value)
+
+    return model
+
+
+class LiveGame:
+    """
+    A game kept up to date from its live feed with diff patches
+
+    The full feed is downloaded once, after that update asks the diffPatch
+    endpoint for the changes since the feed's timestamp and applies them to
+    the raw feed and to the models of the Game they touch. Models that did
+    not change are kept, so an update of a live game costs about as much as
+    the few plays it changed. Each update makes a new Game and feed that
+    share what did not change with the ones before, which are left as they
+    were.
+
+    Attributes
+    ----------
+    game_id : int
+        gamePk of the game
+    game : Game
+        the game as of the last refresh or update, None before the first
+    data : dict
+        raw feed of game with lowercase keys
+    timecode : str
+        timestamp of data, the diff patches asked for start from it
+    """
+
+    def __init__(self, adapter: MlbDataAdapter, game_id: int, logger: logging.Logger = None, **params):
+        self._adapter = adapter
+        self._params = params
+        self._logger = logger or logging.getLogger(__name__)
+        self.game_id = game_id
+        self.game: Optional[Game] = None
+        self.data: Optional[dict] = None
+
+    @property
+    def timecode(self) -> Optional[str]:
+        if self.data is None:
+            return None
+
+        return self.data.get('metadata', {}).get('timestamp')
+
+    def refresh(self, timecode: str = None) -> Optional[Game]:
+        """
+        download the full feed and build the Game from it
+
+        Parameters
+        ----------
+        timecode : str
+            download the feed as it was at timecode instead, 'yyyymmdd_hhmmss'
+            as listed by Mlb.get_game_timestamps. Snapshots never change, so
+            a cache keeps them for good
+
+        Returns
+        -------
+        Game
+            None for a game id that does not exist
+        """
+        params = self._params if timecode is None else {**self._params, 'timecode': timecode}
+        mlb_data = self._adapter.get(endpoint=f'game/{self.game_id}/feed/live', ep_params=params)
+
+        if 400 <= mlb_data.status_code <= 499:
+            return None
+
+        self._replace(mlb_data.data, copy_json(mlb_data.data))
+        return self.game
+
+    def _replace(self, data: dict, model_data: dict):
+        if data.get('gamepk') != self.game_id:
+            raise TheMlbStatsApiException(f'feed of game {data.get("gamepk")} is not game {self.game_id}')
+
+        livedata = model_data.get('livedata')
+
+        if self.game is not None and isinstance(livedata, dict) and isinstance(livedata.get('plays'), dict):
+            # completed plays of the game before are kept instead of built again
+            livedata['plays'] = copy.copy(self.game.livedata.plays).merge(livedata['plays'])
+
+        # models build into the dicts they are given, so they get their own
+        self.game = from_dict(Game, model_data)
+        self.data = data
+
+    def update(self) -> bool:
+        """
+        apply the changes to the game since the last update
+
+        Falls back to the full feed when there is no game yet, the api sends
+        the full feed instead of patches, or a patch does not apply.
+
+        Returns
+        -------
+        bool
+            True if the game changed
+        """
+        if self.data is None or not self.timecode:
+            return self.refresh() is not None
+
+        params = {**self._params, 'startTimecode': self.timecode}
+        mlb_data = self._adapter.get(endpoint=f'game/{self.game_id}/feed/live/diffPatch', ep_params=params)
+
+        if 400 <= mlb_data.status_code <= 499:
+            self._logger.warning('game=%s, no diff patch from %s, downloading the full feed',
+                                 self.game_id, self.timecode)
+            return self.refresh() is not None
+
+        if isinstance(mlb_data.data, dict):
+            # too much changed, the api answered with the full feed
+            self._replace(mlb_data.data, copy_json(mlb_data.data))
+            return True
+
+        operations = [operation for patch in mlb_data.data for operation in patch.get('diff', [])]
+
+        if not operations:
+            return False
+
+        try:
+            data = apply_patch(self.data, operations)
+        except TheMlbStatsApiException as e:
+            self._logger.warning('game=%s, %s, downloading the full feed', self.game_id, e)
+            return self.refresh() is not None
+
+        self.game = patch_model(self.game, self.data, data)
+        self.data = data
+        return True
+
+
+@dataclass
+class LiveEvent:
+    """
+    A class to represent something that happened in a live game
+
+    Attributes
+    ----------
+    game_id : int
+        gamePk of the game
+    """
+    game_id: int
+
+    @property
+    def key(self) -> tuple:
+        """
+        return what identifies this event, an event with the same key is only reported once
+
+        Once per kind of event and game, events that can happen more than
+        once in a game add what tells them apart.
+        """
+        return type(self).__name__, self.game_id
+
+
+@dataclass
+class PitchThrown(LiveEvent):
+    """
+    A class to represent a pitch
+
+    Attributes
+    ----------
+    atbatindex : int
+        index of the play the pitch is in
+    play : Play
+        the play as of the pitch
+    event : PlayEvent
+        the pitch
+    """
+    atbatindex: int
+    play: Play
+    event: PlayEvent
+
+    @property
+    def key(self) -> tuple:
+        return 'pitch', self.event.playid or (self.atbatindex, self.event.index)
+
+
+@dataclass
+class PlayCompleted(LiveEvent):
+    """
+    A class to represent a play that has its result
+
+    Attributes
+    ----------
+    atbatindex : int
+        index of the play
+    play : Play
+        the completed play
+    """
+    atbatindex: int
+    play: Play
+
+    @property
+    def key(self) -> tuple:
+        return 'play', self.atbatindex
+
+
+@dataclass
+class Substitution(LiveEvent):
+    """
+    A class to represent a substitution, e.g. a pitching change
+
+    Attributes
+    ----------
+    atbatindex : int
+        index of the play the substitution was made in
+    event : PlayEvent
+        the substitution, with player and replacedplayer
+    """
+    atbatindex: int
+    event: PlayEvent
+
+    @property
+    def key(self) -> tuple:
+        return 'substitution', self.event.playid or (self.atbatindex, self.event.index)
+
+
+@dataclass
+class ScoreChanged(LiveEvent):
+    """
+    A class to represent a change of the score
+
+    Attributes
+    ----------
+    away : int
+        runs of the away team
+    home : int
+        runs of the home team
+    """
+    away: int
+    home: int
+
+    @property
+    def key(self) -> tuple:
+        return 'score', self.away, self.home
+
+
+@dataclass
+class InningChanged(LiveEvent):
+    """
+    A class to represent the start of a half inning
+
+    Attributes
+    ----------
+    inning : int
+        the inning
+    istopinning : bool
+        True for the top of the inning
+    """
+    inning: int
+    istopinning: bool
+
+    @property
+    def key(self) -> tuple:
+        return 'inning', self.inning, self.istopinning
+
+
+@dataclass
+class StatusChanged(LiveEvent):
+    """
+    A class to represent a change of the game's status
+
+    Attributes
+    ----------
+    abstractgamestate : str
+        Preview, Live or Final
+    detailedstate : str
+        e.g. In Progress, Delayed or Final
+    """
+    abstractgamestate: str
+    detailedstate: str
+
+    @property
+    def key(self) -> tuple:
+        return 'status', self.abstractgamestate, self.detailedstate
+
+
+# eventtypes of play events that substitute a player
+_SUBSTITUTIONS = frozenset(['offensive_substitution', 'defensive_substitution', 'pitching_substitution',
+                            'defensive_switch'])
+
+
+class LiveEvents:
+    """
+    Turns successive states of a game into the events that happened between them
+
+    Only the plays that were not complete the last time are looked at, so
+    each state costs about the same however far the game is. Pitches,
+    completed plays and substitutions are reported once per key. The score,
+    inning and status are reported when they differ from the last state.
+
+    Attributes
+    ----------
+    backlog : bool
+        report the events that happened before the first state, if False
+        the first state only sets where the events start from
+    """
+
+    def __init__(self, backlog: bool = True):
+        self.backlog = backlog
+        self._seen = set()
+        # index into allplays of the first play that was not complete
+        self._next_play = 0
+        # a game starts 0-0, that is not a change of the score
+        self._last: Dict[str, tuple] = {'score': ('score', 0, 0)}
+        self._started = False
+
+    def events(self, game: Game) -> List[LiveEvent]:
+        """
+        return the events of game since the state given before
+
+        Parameters
+        ----------
+        game : Game
+            the game as of now, e.g. LiveGame.game
+
+        Returns
+        -------
+        List[LiveEvent]
+            in the order they happened, status first
+        """
+        found = []
+        status = game.gamedata.status
+        self._changed(found, StatusChanged(game.gamepk, status.abstractgamestate, status.detailedstate))
+
+        allplays = game.livedata.plays.allplays
+        self._next_play = min(self._next_play, len(allplays))
+
+        for index in range(self._next_play, len(allplays)):
+            play = allplays[index]
+
+            for event in play.playevents:
+                if event.ispitch:
+                    self._once(found, PitchThrown(game.gamepk, play.atbatindex, play, event))
+                elif event.issubstitution or getattr(event.details, 'eventtype', None) in _SUBSTITUTIONS:
+                    self._once(found, Substitution(game.gamepk, play.atbatindex, event))
+
+            if play.about.iscomplete:
+                self._once(found, PlayCompleted(game.gamepk, play.atbatindex, play))
+
+                if index == self._next_play:
+                    self._next_play += 1
+
+        linescore = game.livedata.linescore
+
+        if linescore:
+            if linescore.currentinning is not None:
+                self._changed(found, InningChanged(game.gamepk, linescore.currentinning, linescore.istopinning))
+
+            teams = linescore.teams
+            self._changed(found, ScoreChanged(game.gamepk, teams.away.runs or 0, teams.home.runs or 0))
+
+        backlog, self._started = self.backlog or self._started, True
+        return found if backlog else []
+
+    def _once(self, found: List[LiveEvent], event: LiveEvent):
+        if event.key not in self._seen:
+            self._seen.add(event.key)
+            found.append(event)
+
+    def _changed(self, found: List[LiveEvent], event: LiveEvent):
+        kind = event.key[0]
+
+        if self._last.get(kind) != event.key:
+            self._last[kind] = event.key
+            found.append(event)
+
+
+class LiveGameWatcher:
+    """
+    Polls many games from one thread, each as often as its status needs
+
+    Every game is a LiveGame updated with diff patches. After each poll the
+    game is polled again after the interval of its abstractgamestate, a
+    game in Preview is polled sparsely but no later than its first pitch,
+    a Live game tightly, and a Final game is not polled again. Polls of
+    every game take from one budget, so the load stays the same however
+    many games are live at once.
+
+    Attributes
+    ----------
+    mlb : Mlb
+        client the games are fetched with
+    game_ids : Iterable[int]
+        gamePks to watch, defaults to the games of date
+    date : str
+        date, 'yyyy-mm-dd', of the games to watch when game_ids is not passed,
+        defaults to today
+    intervals : Dict[str, float]
+        seconds between polls per abstractgamestate, None to stop polling
+    default_interval : float
+        seconds between polls of a game in any other state, or after a
+        failed poll
+    budget : RateLimiter
+        optional token bucket every poll waits on, e.g. RateLimiter(0.5) for
+        one poll every 2 seconds across all games
+    on_update : Callable[[LiveGame], None]
+        optional callback for every poll that changed a game
+    on_event : Callable[[LiveEvent], None]
+        optional callback for every event found in the games, see LiveEvents
+
+    Examples
+    --------
+    >>> watcher = LiveGameWatcher(Mlb(), date='2023-04-23', budget=RateLimiter(1),
+    ...                           on_update=lambda live: print(live.game.livedata.linescore.currentinning))
+    >>> watcher.run()
+    """
+    DEFAULT_INTERVALS = {
+        'Preview': 300.0,
+        'Live': 10.0,
+        'Final': None,
+    }
+
+    def __init__(self, mlb, game_ids: Iterable[int] = None, date: str = None,
+                 intervals: Dict[str, Optional[float]] = None, default_interval: float = 60.0,
+                 budget: RateLimiter = None, on_update: Callable[[LiveGame], None] = None,
+                 on_event: Callable[[LiveEvent], None] = None, logger: logging.Logger = None, **params):
+        if game_ids is None:
+            game_ids = mlb.get_game_ids(date=date or datetime.date.today().strftime('%Y-%m-%d'))
+
+        self.mlb = mlb
+        self.intervals = dict(self.DEFAULT_INTERVALS if intervals is None else intervals)
+        self.default_interval = default_interval
+        self.budget = budget
+        self.on_update = on_update
+        self.on_event = on_event
+        self._events: Dict[int, LiveEvents] = {}
+        # events found while iter_events runs
+        self._pending: Optional[collections.deque] = None
+        self._logger = logger or logging.getLogger(__name__)
+        self._stop = threading.Event()
+        self.games: Dict[int, LiveGame] = {
+            game_id: LiveGame(mlb._mlb_adapter_v1_1, game_id, self._logger, **params) for game_id in game_ids
+        }
+        # (due, game id) of every game still polled, earliest first
+        self._due = [(0.0, game_id) for game_id in self.games]
+        heapq.heapify(self._due)
+
+    @property
+    def watching(self) -> List[int]:
+        """
+        return the ids of the games that are still polled
+        """
+        return [game_id for _, game_id in self._due]
+
+    def _interval(self, live: LiveGame) -> Optional[float]:
+        """
+        return the seconds until live should be polled again, None to stop
+        """
+        if live.game is None:
+            # the game does not exist
+            return None
+
+        state = live.game.gamedata.status.abstractgamestate
+
+        if state not in self.intervals:
+            return self.default_interval
+
+        interval = self.intervals[state]
+
+        if interval is None or state != 'Preview':
+            return interval
+
+        # wake up for the first pitch, but no more often than a live game
+        try:
+            start = datetime.datetime.strptime(live.game.gamedata.datetime.datetime, '%Y-%m-%dT%H:%M:%SZ')
+        except (AttributeError, TypeError, ValueError):
+            return interval
+
+        until_start = (start.replace(tzinfo=datetime.timezone.utc)
+                       - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        return max(min(interval, until_start), self.intervals.get('Live') or self.default_interval)
+
+    def poll(self) -> Optional[float]:
+        """
+        poll every game that is due
+
+        Returns
+        -------
+        float
+            seconds until the next game is due, None when no game is left to poll
+        """
+        while self._due and self._due[0][0] <= time.monotonic() and not self._stop.is_set():
+            _, game_id = heapq.heappop(self._due)
+            live = self.games[game_id]
+
+            if self.budget is not None:
+                wait = self.budget.reserve()
+
+                if wait > 0 and self._stop.wait(wait):
+                    heapq.heappush(self._due, (0.0, game_id))
+                    break
+
+            try:
+                changed = live.update()
+                interval = self._interval(live)
+            except TheMlbStatsApiException as e:
+                self._logger.error('game=%s, poll failed: %s', game_id, e)
+                interval = self.default_interval
+            except Exception:
+                self._logger.exception('game=%s, poll failed', game_id)
+                interval = self.default_interval
+            else:
+                if changed:
+                    self._notify(live)
+
+            if interval is None:
+                self._logger.debug('game=%s, stopped polling', game_id)
+                continue
+
+            heapq.heappush(self._due, (time.monotonic() + interval, game_id))
+
+        if not self._due:
+            return None
+
+        return max(self._due[0][0] - time.monotonic(), 0.0)
+
+    def _notify(self, live: LiveGame):
+        # a callback that raises is logged, it does not stop the other games from being polled
+        if self.on_update is not None:
+            try:
+                self.on_update(live)
+            except Exception:
+                self._logger.exception('game=%s, on_update failed', live.game_id)
+
+        if self.on_event is not None or self._pending is not None:
+            self._emit(live)
+
+    def _emit(self, live: LiveGame):
+        events = self._events.setdefault(live.game_id, LiveEvents()).events(live.game)
+
+        for event in events:
+            if self.on_event is not None:
+                try:
+                    self.on_event(event)
+                except Exception:
+                    self._logger.exception('game=%s, on_event failed for %r', live.game_id, event)
+
+            if self._pending is not None:
+                self._pending.append(event)
+
+    def iter_events(self) -> Iterator[LiveEvent]:
+        """
+        poll the games like run and yield the events found in them as they happen
+
+        Yields
+        ------
+        LiveEvent
+            e.g. PitchThrown, PlayCompleted or ScoreChanged
+        """
+        self._pending = collections.deque()
+
+        try:
+            while not self._stop.is_set():
+                wait = self.poll()
+
+                while self._pending:
+                    yield self._pending.popleft()
+
+                if wait is None:
+                    return
+
+                self._stop.wait(wait)
+        finally:
+            self._pending = None
+
+    def run(self):
+        """
+        poll the games until every one is stopped or stop is called
+        """
+        while not self._stop.is_set():
+            wait = self.poll()
+
+            if wait is None:
+                return
+
+            self._stop.wait(wait)
+
+    def start(self) -> threading.Thread:
+        """
+        run in a daemon thread
+
+        Returns
+        -------
+        threading.Thread
+        """
+        self._stop.clear()
+        thread = threading.Thread(target=self.run, name='LiveGameWatcher', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """
+        stop run after the poll in progress
+        """
+        self._stop.set()
+
+
+class GameReplay:
+    """
+    Steps a past game forward snapshot by snapshot, as fast or as slow as wanted
+
+    The snapshots are the feeds at the timecodes of Mlb.get_game_timestamps.
+    A snapshot never changes, so with a cache on mlb, e.g. a SqliteCache,
+    every snapshot is downloaded once and later replays read them from the
+    cache. Completed plays are kept from one snapshot to the next, see
+    Plays.merge.
+
+    Attributes
+    ----------
+    mlb : Mlb
+        client the snapshots are fetched with
+    game_id : int
+        gamePk of the game
+    speed : float
+        how many times faster than it happened the game is replayed, None
+        to step through the snapshots without waiting
+    timecodes : List[str]
+        timecodes of the snapshots, defaults to every timestamp of the game
+    start : str
+        first timecode to replay, 'yyyymmdd_hhmmss'
+    end : str
+        last timecode to replay
+
+    Examples
+    --------
+    >>> mlb = Mlb(cache=SqliteCache('snapshots.db'))
+    >>> for game in GameReplay(mlb, 662242, speed=60):
+    ...     print(game.livedata.linescore.currentinning)
+    """
+
+    def __init__(self, mlb, game_id: int, speed: Optional[float] = 1.0, timecodes: Iterable[str] = None,
+                 start: str = None, end: str = None, logger: logging.Logger = None, **params):
+        if speed is not None and speed <= 0:
+            raise TheMlbStatsApiException('speed must be greater than 0')
+
+        if timecodes is None:
+            timecodes = mlb.get_game_timestamps(game_id)
+
+        self.mlb = mlb
+        self.game_id = game_id
+        self.speed = speed
+        self.timecodes = [timecode for timecode in timecodes
+                          if (start is None or timecode >= start) and (end is None or timecode <= end)]
+        self._live = LiveGame(mlb._mlb_adapter_v1_1, game_id, logger, **params)
+        self._stop = threading.Event()
+
+    @staticmethod
+    def _seconds(timecode: str) -> float:
+        return datetime.datetime.strptime(timecode, '%Y%m%d_%H%M%S').timestamp()
+
+    def snapshots(self) -> Iterator[Tuple[str, Game]]:
+        """
+        yield each timecode with the game as it was then, spaced out by speed
+
+        The wait before a snapshot is the time between it and the one
+        before divided by speed, less the time taken to load it.
+
+        Yields
+        ------
+        tuple
+            (timecode, Game)
+        """
+        self._stop.clear()
+        started = first = None
+
+        for timecode in self.timecodes:
+            if self.speed is not None:
+                if started is None:
+                    started, first = time.monotonic(), self._seconds(timecode)
+
+                wait = started + (self._seconds(timecode) - first) / self.speed - time.monotonic()
+
+                if wait > 0 and self._stop.wait(wait):
+                    return
+
+            if self._stop.is_set():
+                return
+
+            game = self._live.refresh(timecode)
+
+            if game is not None:
+                yield timecode, game
+
+    def __iter__(self) -> Iterator[Game]:
+        for _, game in self.snapshots():
+            yield game
+
+    def iter_events(self, backlog: bool = True) -> Iterator[LiveEvent]:
+        """
+        yield the events of the game as they happen in the replay, see LiveEvents
+
+        Yields
+        ------
+        LiveEvent
+        """
+        live_events = LiveEvents(backlog)
+
+        for game in self:
+            yield from live_events.events(game)
+
+    def stop(self):
+        """
+        stop the replay before its next snapshot
+        """
+        self._stop.set()
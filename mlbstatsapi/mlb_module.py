@@ -1,8 +1,23 @@
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional, Type
 import importlib
 import inspect
+import logging
+import threading
 
+from mlbstatsapi.exceptions import TheMlbStatsApiException
 from mlbstatsapi.models.stats import Stat
+from mlbstatsapi.models.constructors import from_dict
+
+
+logger = logging.getLogger(__name__)
+
+# stat group -> {stat type: split class}, each group module is scanned once
+_stat_registry: Dict[str, Dict[str, Type]] = {}
+_stat_registry_lock = threading.Lock()
+_reported_stats = set()
+
+# table kind -> the optional package that builds it, python-mlb-statsapi[pandas] or [arrow]
+_TABLE_PACKAGES = {'pandas': 'pandas', 'arrow': 'pyarrow'}
 
 
 def merge_keys(mlb_dict, mlb_keys: Union[List[Union[dict, str]], str]) -> dict:
@@ -39,12 +54,73 @@ def merge_keys(mlb_dict, mlb_keys: Union[List[Union[dict, str]], str]) -> dict:
 
     return mlb_dict
 
+def get_stat_classes(stat_group: str) -> Dict[str, Type]:
+    """
+    return the split classes of stat_group keyed by stat type
+
+    The module for the group, e.g. hitting.py for hitting, is scanned for
+    classes with a _stat list the first time the group is asked for.
+
+    Parameters
+    ----------
+    stat_group : str
+        group of stat
+
+    Returns
+    -------
+    dict
+        split class for each stat type of the group
+    """
+    stat_classes = _stat_registry.get(stat_group)
+
+    if stat_classes is not None:
+        return stat_classes
+
+    with _stat_registry_lock:
+        if stat_group in _stat_registry:
+            return _stat_registry[stat_group]
+
+        stat_classes = {}
+
+        try:
+            stat_module = importlib.import_module(f"mlbstatsapi.models.stats.{stat_group}")
+        except ImportError as e:
+            logger.warning('no split classes for stat group %s: %s', stat_group, e)
+        else:
+            for name, obj in inspect.getmembers(stat_module, predicate=inspect.isclass):
+                if hasattr(obj, '_stat'):
+                    for stat_type in obj._stat:
+                        stat_classes.setdefault(stat_type, obj)
+
+        _stat_registry[stat_group] = stat_classes
+        return stat_classes
+
+
+def get_stat_class(stat_group: str, stat_type: str) -> Optional[Type]:
+    """
+    return the split class for a stat group and type, or None if there is none
+
+    Parameters
+    ----------
+    stat_group : str
+        group of stat
+    stat_type : str
+        type of stat
+
+    Returns
+    -------
+    class
+    """
+    return get_stat_classes(stat_group).get(stat_type)
+
+
 def return_splits(split_data: dict, stat_type: str, stat_group: str) -> List['Split']:
     """
     The split objects are built using the group name and split data. The stat group name is used to source the correct
     stat group classes.
 
-    stat group: hitting will load the classes in hitting.py and use the _type parameter to locate the correct class.
+    stat group: hitting will use the classes in hitting.py and use the _type parameter to locate the correct class.
+    A stat type without a class is logged once and returns no splits.
 
     Parameters
     ----------
@@ -63,14 +139,17 @@ def return_splits(split_data: dict, stat_type: str, stat_group: str) -> List['Sp
 
     splits = []
 
-    stat_module = f"mlbstatsapi.models.stats.{stat_group}"
-    stat_module = importlib.import_module(stat_module)
-    
-    for name, obj in inspect.getmembers(stat_module, predicate=inspect.isclass):
-        if hasattr(obj, '_stat') and stat_type in obj._stat:
-            for split in split_data:
-                if 'stat' in split and split['stat']:
-                    splits.append(obj(**split))
+    stat_class = get_stat_class(stat_group, stat_type)
+
+    if stat_class is None:
+        if (stat_group, stat_type) not in _reported_stats:
+            _reported_stats.add((stat_group, stat_type))
+            logger.warning('unknown stat type %s for stat group %s, its splits are skipped', stat_type, stat_group)
+        return splits
+
+    for split in split_data:
+        if 'stat' in split and split['stat']:
+            splits.append(from_dict(stat_class, split))
 
     return splits
 
@@ -125,6 +204,135 @@ def create_split_data(stat_data: dict) -> dict:
 
     return stats
 
+def flatten_split(split: dict, prefix: str = '', row: Optional[dict] = None) -> dict:
+    """
+    flatten the nested dicts of a split into one dict with dotted keys
+
+    Parameters
+    ----------
+    split : dict
+        split data
+    prefix : str
+        prefix for the keys of split, e.g. 'stat.'
+    row : dict
+        dict the flattened keys are added to
+
+    Returns
+    -------
+    dict
+        e.g. {'season': '2022', 'stat.hits': 160, 'team.id': 136, ...}
+    """
+    row = {} if row is None else row
+
+    for key, value in split.items():
+        if isinstance(value, dict):
+            flatten_split(value, f'{prefix}{key}.', row)
+        else:
+            row[f'{prefix}{key}'] = value
+
+    return row
+
+
+def split_columns(split_data: List[dict]) -> Dict[str, list]:
+    """
+    return the splits that have a stat as columns of flattened split keys
+
+    Parameters
+    ----------
+    split_data : list
+        split data
+
+    Returns
+    -------
+    dict
+        a list for each flattened key, None where a split does not have it
+    """
+    columns = {}
+    rows = 0
+
+    for split in split_data:
+        if 'stat' not in split or not split['stat']:
+            continue
+
+        for key, value in flatten_split(split).items():
+            column = columns.get(key)
+
+            if column is None:
+                column = columns[key] = [None] * rows
+
+            column.append(value)
+
+        rows += 1
+
+        for column in columns.values():
+            if len(column) < rows:
+                column.append(None)
+
+    return columns
+
+
+def check_table(table: Optional[str]) -> Optional[str]:
+    """
+    return table if it is None or a table kind create_split_tables builds, checked before a request is made
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        for any other table
+    """
+    if table is not None and table not in _TABLE_PACKAGES:
+        raise TheMlbStatsApiException(f"table must be one of {', '.join(_TABLE_PACKAGES)}, not {table!r}")
+
+    return table
+
+
+def create_split_tables(stat_data: dict, table: str) -> dict:
+    """
+    function that loops through stat information and returns a table of splits for each stat,
+    straight from the split data without building split classes
+
+    Parameters
+    ----------
+    stat_data: dict
+        dict of params to pass
+    table : str
+        'pandas' for a pandas.DataFrame, or 'arrow' for a pyarrow.Table
+
+    Returns
+    -------
+    dict
+        returns a dict of tables, keyed like create_split_data
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        if table is not 'pandas' or 'arrow'
+    ImportError
+        if the package for table is not installed
+    """
+    check_table(table)
+
+    # imported here, pandas and pyarrow are optional and slow to import
+    try:
+        package = importlib.import_module(_TABLE_PACKAGES[table])
+    except ImportError as e:
+        raise ImportError(f'{table} tables require {_TABLE_PACKAGES[table]}, '
+                          f'install it with python3 -m pip install python-mlb-statsapi[{table}]') from e
+
+    stats = {}
+
+    for stat in stat_data:
+        stat_type, stat_group, _ = get_stat_attributes(stat)
+
+        if 'splits' not in stat or not stat['splits']:
+            continue
+
+        columns = split_columns(stat['splits'])
+        stats.setdefault(stat_group, {})[stat_type.lower()] = (package.DataFrame(columns) if table == 'pandas'
+                                                              else package.table(columns))
+
+    return stats
+
 def get_stat_attributes(stats) -> str:
     """
     return stat type
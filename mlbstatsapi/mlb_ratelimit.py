@@ -0,0 +1,152 @@
+import datetime
+import random
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+class RateLimiter:
+    """
+    A thread safe token bucket that spaces out requests
+
+    Every request takes a token, tokens refill at rate per second up to
+    burst. Share one RateLimiter between adapters, or Mlb instances, to
+    limit them together.
+
+    Attributes
+    ----------
+    rate : float
+        requests per second allowed over time
+    burst : int
+        requests allowed at once after being idle, defaults to rate
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._hold_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        take a token and return the seconds to wait before using it
+
+        Returns
+        -------
+        float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._hold_until - now)
+
+    def acquire(self):
+        """
+        block until a request may be sent
+        """
+        wait = self.reserve()
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def hold(self, seconds: float):
+        """
+        stop every request through this limiter for seconds, e.g. after a 429
+        """
+        with self._lock:
+            self._hold_until = max(self._hold_until, time.monotonic() + seconds)
+
+
+class RetryPolicy:
+    """
+    Retry failed requests with jittered exponential backoff
+
+    The n-th retry waits a random time between 0 and backoff * 2 ** n
+    seconds, capped at max_backoff, unless the response has a Retry-After
+    header, which is honored as is.
+
+    Attributes
+    ----------
+    retries : int
+        max number of retries per request
+    backoff : float
+        base delay in seconds
+    max_backoff : float
+        max delay in seconds between retries without Retry-After
+    statuses : Iterable[int]
+        HTTP return codes that are retried, connection errors always are
+    """
+    STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 statuses: Iterable[int] = STATUSES):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+
+    def retry_delay(self, attempt: int, status_code: int = None, retry_after: str = None) -> Optional[float]:
+        """
+        return the seconds to wait before retrying, or None to give up
+
+        Parameters
+        ----------
+        attempt : int
+            number of retries already made
+        status_code : int
+            HTTP return code, None for a connection error
+        retry_after : str
+            value of the Retry-After header
+
+        Returns
+        -------
+        float
+        """
+        if attempt >= self.retries:
+            return None
+
+        if status_code is not None and status_code not in self.statuses:
+            return None
+
+        delay = self.parse_retry_after(retry_after)
+
+        if delay is None:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str = None) -> Optional[float]:
+        """
+        return the seconds asked for by a Retry-After header, in seconds or as
+        an HTTP date, or None if it is missing or invalid
+        """
+        if not value:
+            return None
+
+        value = value.strip()
+
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (retry_at - now).total_seconds())
@@ -0,0 +1,242 @@
+import codecs
+import re
+
+from typing import Iterable, Iterator, Sequence, Union
+
+from .exceptions import TheMlbStatsApiException
+from .mlb_dataadapter import decode_lowered
+
+
+# a complete string, or one cut off by the end of the buffer, or a bracket
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*("|\\?\Z)|[{}\[\]]', re.DOTALL)
+
+# the end of a number, true, false or null
+_SCALAR_END = re.compile(rb'[,}\]\s]')
+
+_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+
+
+class _JsonStream:
+    """
+    A JSON document read from chunks of bytes, one value at a time
+
+    Values are found by scanning for their closing bracket or quote without
+    decoding them, and the bytes before the value being read are dropped as
+    more chunks arrive, so only the value being read is held in memory.
+    Values that are skipped are dropped while they are scanned.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self.buffer = b''
+        self.pos = 0
+
+    def _more(self, keep: int) -> int:
+        """
+        append the next chunk, dropping the bytes before keep
+
+        Returns
+        -------
+        int
+            number of bytes dropped, indexes into the buffer move back by it
+
+        Raises
+        ------
+        TheMlbStatsApiException
+            when the document ends first
+        """
+        for chunk in self._chunks:
+            if chunk:
+                self.buffer = self.buffer[keep:] + chunk
+                self.pos -= keep
+                return keep
+
+        raise TheMlbStatsApiException('Bad JSON in response')
+
+    def peek(self) -> bytes:
+        """
+        return the next byte that is not whitespace, b'' at the end of the document
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos:self.pos + 1]
+
+            try:
+                self._more(self.pos)
+            except TheMlbStatsApiException:
+                return b''
+
+    def expect(self, byte: bytes):
+        if self.peek() != byte:
+            raise TheMlbStatsApiException('Bad JSON in response')
+
+        self.pos += 1
+
+    def _end(self, keep: bool) -> int:
+        """
+        return the index just past the value at pos
+
+        If keep is False the value is dropped from the buffer while it is
+        scanned, pos still moves to the returned index.
+        """
+        first = self.peek()
+        index = self.pos
+        depth = 0
+
+        if first == b'':
+            raise TheMlbStatsApiException('Bad JSON in response')
+
+        if first not in b'{["':
+            while True:
+                match = _SCALAR_END.search(self.buffer, index)
+
+                if match is not None:
+                    return match.start()
+
+                # the document can end with a scalar
+                try:
+                    index -= self._more(self.pos)
+                except TheMlbStatsApiException:
+                    return len(self.buffer)
+
+        while True:
+            match = _TOKEN.search(self.buffer, index)
+
+            if match is None or (match.group(0)[:1] == b'"' and match.group(1) != b'"'):
+                # nothing left to scan or a string cut off, scan again from the last complete token
+                index = len(self.buffer) if match is None else match.start()
+
+                if not keep:
+                    self.pos = index
+
+                index -= self._more(self.pos)
+                continue
+
+            index = match.end()
+            token = match.group(0)
+
+            if token in (b'{', b'['):
+                depth += 1
+            elif token in (b'}', b']'):
+                depth -= 1
+
+            if depth == 0:
+                return index
+
+    def read(self) -> Union[dict, list, str, int, float, bool, None]:
+        """
+        return the value at pos decoded with lowercase keys
+        """
+        end = self._end(keep=True)
+
+        try:
+            value = decode_lowered(self.buffer[self.pos:end])
+        except ValueError as e:
+            raise TheMlbStatsApiException('Bad JSON in response') from e
+
+        self.pos = end
+        return value
+
+    def skip(self):
+        self.pos = self._end(keep=False)
+
+    def separator(self, close: bytes) -> bool:
+        """
+        step over the comma after a member, False at the close of the object or array
+        """
+        byte = self.peek()
+        self.pos += 1
+
+        if byte == b',':
+            return True
+
+        if byte != close:
+            raise TheMlbStatsApiException('Bad JSON in response')
+
+        return False
+
+    def enter(self, key: str) -> bool:
+        """
+        step into the object at pos up to the value of key, keys match case insensitively
+
+        False if the object has no key, pos is then past the object.
+        """
+        self.expect(b'{')
+
+        if self.peek() == b'}':
+            self.pos += 1
+            return False
+
+        while True:
+            name = self.read()
+            self.expect(b':')
+
+            if isinstance(name, str) and name.lower() == key:
+                return True
+
+            self.skip()
+
+            if not self.separator(b'}'):
+                return False
+
+
+def iter_array(chunks: Iterable[bytes], path: Sequence[str]) -> Iterator:
+    """
+    yield each item of the array at path in a JSON document as it is read
+
+    Each item is decoded with lowercase keys like decode_lowered once its
+    closing bracket arrives, the rest of the document is scanned over
+    without decoding it.
+
+    Parameters
+    ----------
+    chunks : iterable of bytes
+        the document, e.g. from MlbDataAdapter.stream
+    path : list of str
+        lowercase keys of the objects leading to the array, e.g.
+        ['livedata', 'plays', 'allplays']
+
+    Yields
+    ------
+    dict or list or scalar
+        nothing if the document is empty or does not have path
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        for a document that is not JSON
+    """
+    document = _JsonStream(chunks)
+
+    # a BOM can be split over the first chunks
+    while len(document.buffer) < len(codecs.BOM_UTF8):
+        try:
+            document._more(0)
+        except TheMlbStatsApiException:
+            break
+
+    if document.buffer.startswith(codecs.BOM_UTF8):
+        document.pos += len(codecs.BOM_UTF8)
+
+    if document.peek() == b'':
+        return
+
+    for key in path:
+        if document.peek() != b'{' or not document.enter(key):
+            return
+
+    if document.peek() != b'[':
+        return
+
+    document.pos += 1
+
+    if document.peek() == b']':
+        return
+
+    while True:
+        yield document.read()
+
+        if not document.separator(b']'):
+            return
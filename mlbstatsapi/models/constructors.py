@@ -0,0 +1,259 @@
+import contextvars
+import inspect
+import threading
+import typing
+
+from dataclasses import is_dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, Union
+
+
+# class -> keys of its dicts that it has no attribute for
+UnknownKeys = Dict[Type, Set[str]]
+
+# called as constructor(data, unknown), unknown is None to drop unknown keys
+Constructor = Callable[[dict, Optional[UnknownKeys]], Any]
+
+# how a field holds the model its type hint names, one, a list of them or a dict of them
+_ONE, _LIST, _DICT = 'one', 'list', 'dict'
+
+# class -> names of its __init__ parameters, None if it takes **kwargs, and its nested models by field
+_Plan = Tuple[Optional[frozenset], Dict[str, Tuple[Type, str]]]
+
+_constructors: Dict[Type, Constructor] = {}
+_plans: Dict[Type, _Plan] = {}
+_constructors_lock = threading.RLock()
+
+# where from_dict calls made while building, e.g. by a lazy model's builders, collect unknown keys
+_unknown_keys: contextvars.ContextVar[Optional[UnknownKeys]] = contextvars.ContextVar('unknown_keys', default=None)
+
+
+def from_dict(cls: Type, data: dict, unknown: Optional[UnknownKeys] = None):
+    """
+    return a cls built from data with cls's constructor
+
+    Builds the same model as cls(**data), but keys cls has no attribute for
+    are dropped instead of raising TypeError, or added to unknown. Keys the
+    nested models that cls builds in __post_init__ have no attribute for
+    are dropped too, the nested models are found by the type hints of cls.
+
+    Parameters
+    ----------
+    cls : class
+        model to build, e.g. Team
+    data : dict
+        response with lowercase keys, taken apart like cls(**data) would
+    unknown : dict, optional
+        dict to add the unknown keys of each class to, e.g. {Team: {'newkey'}}
+
+    Examples
+    --------
+    >>> unknown = {}
+    >>> from_dict(Sport, {'id': 1, 'link': '/api/v1/sports/1', 'newkey': 'x'}, unknown)
+    Sport(id=1, link=/api/v1/sports/1)
+    >>> unknown
+    {<class 'Sport'>: {'newkey'}}
+    """
+    if unknown is None:
+        return constructor(cls)(data, _unknown_keys.get())
+
+    token = _unknown_keys.set(unknown)
+
+    try:
+        return constructor(cls)(data, unknown)
+    finally:
+        _unknown_keys.reset(token)
+
+
+def constructor(cls: Type) -> Constructor:
+    """
+    return the constructor of cls, made the first time cls is asked for
+
+    A constructor is called as constructor(data, unknown). It drops the keys
+    cls has no attribute for and calls cls, so __post_init__ builds the
+    nested models like it always does. When a nested model raises TypeError
+    for a key it has no attribute for, the nested dicts are checked against
+    the models the type hints of cls name, e.g. team: Union[Team, dict] or
+    allplays: List[Play], at every depth, and cls is called again without
+    their unknown keys. Only type hints and signatures are read, so it works
+    the same where the source of the models is not installed.
+    """
+    built = _constructors.get(cls)
+
+    if built is not None:
+        return built
+
+    with _constructors_lock:
+        if cls not in _constructors:
+            _constructors[cls] = _generate(cls)
+
+        return _constructors[cls]
+
+
+def _known(cls: Type, names: frozenset, data: dict, unknown: Optional[UnknownKeys]) -> dict:
+    """
+    return data without the keys cls has no attribute for, they are added to unknown
+    """
+    if unknown is not None:
+        unknown.setdefault(cls, set()).update(data.keys() - names)
+
+    return {key: value for key, value in data.items() if key in names}
+
+
+def _model(hint) -> Optional[Tuple[Type, str]]:
+    """
+    return the model a type hint names and how the field holds it, None unless it names exactly one dataclass
+
+    Union[Team, dict] and Optional[Team] name Team, List[Play] a list of
+    Play and Dict[str, Person] a dict of Person.
+    """
+    origin, arguments = typing.get_origin(hint), typing.get_args(hint)
+
+    if origin is Union:
+        models = [model for model in map(_model, arguments) if model is not None]
+        return models[0] if len(models) == 1 else None
+
+    if origin is list and len(arguments) == 1:
+        model = _model(arguments[0])
+        return (model[0], _LIST) if model is not None and model[1] == _ONE else None
+
+    if origin is dict and len(arguments) == 2:
+        model = _model(arguments[1])
+        return (model[0], _DICT) if model is not None and model[1] == _ONE else None
+
+    if isinstance(hint, type) and is_dataclass(hint):
+        return hint, _ONE
+
+    return None
+
+
+def _plan(cls: Type) -> _Plan:
+    plan = _plans.get(cls)
+
+    if plan is not None:
+        return plan
+
+    # not inspect.signature(cls), the Interned metaclass's __call__ takes **kwargs
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+        names = None
+    else:
+        names = frozenset(parameter.name for parameter in parameters)
+
+    nested = {}
+
+    if is_dataclass(cls):
+        try:
+            hints = typing.get_type_hints(cls)
+        except (NameError, TypeError):
+            hints = {name: model_field.type for name, model_field in cls.__dataclass_fields__.items()}
+
+        for name in names or ():
+            model = _model(hints.get(name))
+
+            if model is not None:
+                nested[name] = model
+
+    with _constructors_lock:
+        return _plans.setdefault(cls, (names, nested))
+
+
+def _clean(cls: Type, data: dict, unknown: Optional[UnknownKeys]) -> dict:
+    """
+    return data without the keys cls and the models its type hints name have no attribute for, at every depth
+
+    data is returned as it is if no key is dropped, the dicts that change are copies.
+    """
+    names, nested = _plan(cls)
+
+    if names is not None and not data.keys() <= names:
+        data = _known(cls, names, data, unknown)
+
+    cleaned = data
+
+    for name, (model, held) in nested.items():
+        value = data.get(name)
+
+        if held == _ONE and isinstance(value, dict):
+            kept = _clean(model, value, unknown)
+            changed = kept is not value
+        elif held == _LIST and isinstance(value, list):
+            kept = [_clean(model, item, unknown) if isinstance(item, dict) else item for item in value]
+            changed = any(item is not before for item, before in zip(kept, value))
+        elif held == _DICT and isinstance(value, dict):
+            kept = {key: _clean(model, item, unknown) if isinstance(item, dict) else item
+                    for key, item in value.items()}
+            changed = any(kept[key] is not item for key, item in value.items())
+        else:
+            continue
+
+        if changed:
+            if cleaned is data:
+                cleaned = dict(data)
+
+            cleaned[name] = kept
+
+    return cleaned
+
+
+def _restore(built, original: dict, cleaned: dict):
+    """
+    give the dicts built kept as dicts, e.g. a game log's game, back the keys _clean dropped from them
+
+    A type hint can name a model that __post_init__ does not build, the
+    dict it leaves is put back the way it was in the response.
+    """
+    attributes = getattr(built, '__dict__', None)
+
+    if attributes is None or cleaned is original:
+        return
+
+    for name, value in cleaned.items():
+        before = original.get(name)
+        attribute = attributes.get(name)
+
+        if value is before:
+            continue
+
+        if attribute is value:
+            attributes[name] = before
+        elif isinstance(value, dict) and is_dataclass(attribute):
+            _restore(attribute, before, value)
+        elif isinstance(value, list) and isinstance(attribute, list) and len(attribute) == len(value):
+            for item, item_before, item_value in zip(attribute, before, value):
+                if isinstance(item_value, dict) and is_dataclass(item):
+                    _restore(item, item_before, item_value)
+
+
+def _generate(cls: Type) -> Constructor:
+    names, _ = _plan(cls)
+
+    if names is None:
+        return lambda data, unknown: cls(**data)
+
+    def build(data: dict, unknown: Optional[UnknownKeys]):
+        if not data.keys() <= names:
+            data = _known(cls, names, data, unknown)
+
+        try:
+            return cls(**data)
+        except TypeError as error:
+            # raised for a missing key too, only an unknown one in a nested model is dropped
+            if 'unexpected keyword argument' not in str(error):
+                raise
+
+            cleaned = _clean(cls, data, unknown)
+
+            if cleaned is data:
+                raise
+
+            try:
+                built = cls(**cleaned)
+            except Exception:
+                raise error
+
+            _restore(built, data, cleaned)
+            return built
+
+    build.__qualname__ = build.__name__ = cls.__name__
+    return build
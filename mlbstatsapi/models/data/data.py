@@ -1,10 +1,10 @@
-﻿from dataclasses import dataclass, field, InitVar
+﻿from dataclasses import dataclass, field, fields, InitVar
 from typing import List, Union, Dict, Any, Optional
 
 
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class PitchBreak:
     """
     A class to hold pitch pitch break data
@@ -34,10 +34,10 @@ class PitchBreak:
     spindirection: Optional[float] = None
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name) is not None]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class PitchCoordinates:
     """
     A class to hold pitch coordinates for playLog
@@ -99,10 +99,10 @@ class PitchCoordinates:
     y: Optional[float] = None
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name) is not None]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class PitchData:
     """
     A class to hold data on a pitch
@@ -153,10 +153,10 @@ class PitchData:
         self.breaks = PitchBreak(**self.breaks) if self.breaks else self.breaks
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name) is not None]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
 
-@dataclass
+@dataclass(slots=True)
 class HitCoordinates:
     """
     A class to represent a play events hit location coordinates.
@@ -179,7 +179,7 @@ class HitCoordinates:
     def y(self):
         return self.coordy
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class HitData:
     """
     A class to represent a play events hit data.
@@ -215,10 +215,10 @@ class HitData:
         self.coordinates = HitCoordinates(**self.coordinates) if self.coordinates else self.coordinates
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name) is not None]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
 
-@dataclass
+@dataclass(slots=True)
 class CodeDesc:
     """
     a class to hold a code and a description
@@ -233,7 +233,7 @@ class CodeDesc:
     code: str
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     """
     
@@ -250,7 +250,7 @@ class Violation:
     description: Optional[str] = None
     player: Optional[dict] = None
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class Count:
     """
     a class to hold a pitch count and base runners
@@ -286,10 +286,10 @@ class Count:
     istopinning: Optional[bool] = None
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None and value]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name)]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class PlayDetails:
     """
     A class to represent a gamelog stat for a hitter
@@ -358,5 +358,5 @@ class PlayDetails:
         self.violation = Violation(**self.violation) if self.violation else self.violation
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None and value]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name)]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
\ No newline at end of file
@@ -1,14 +1,18 @@
-from typing import Union, Optional
-from dataclasses import dataclass
+from array import array
+from typing import Union, Optional, Dict, List
+from dataclasses import dataclass, InitVar
 
 from mlbstatsapi.models.game.gamedata import GameData
 from mlbstatsapi.models.game.livedata import LiveData
 
+from mlbstatsapi.models.lazy import LazyModel
+from mlbstatsapi.models.constructors import from_dict
+
 from .attributes import MetaData
 
 
 @dataclass
-class Game:
+class Game(LazyModel):
     """
     A class to represent a Game.
 
@@ -26,23 +30,39 @@ class Game:
         gameData of this game
     livedata : LiveData
         liveData of this game
+    lazy : bool
+        build metadata, gamedata and livedata, and the models nested in
+        them, from their raw dicts only when they are first read
 
     Methods
     -------
     id():
         returns this games id
+    pitch_table():
+        returns every pitch in this game as columns
     """
     gamepk: int
     link: str
     metadata: Union[MetaData, dict]
     gamedata: Union[GameData, dict]
     livedata: Union[LiveData, dict]
+    lazy: InitVar[bool] = False
+
+    _builders = {
+        'metadata': lambda metadata, lazy: from_dict(MetaData, metadata),
+        'gamedata': lambda gamedata, lazy: from_dict(GameData, {**gamedata, 'lazy': lazy}),
+        'livedata': lambda livedata, lazy: from_dict(LiveData, {**livedata, 'lazy': lazy}),
+    }
 
-    def __post_init__(self):
-        self.metadata = MetaData(**self.metadata)
-        self.gamedata = GameData(**self.gamedata)
-        self.livedata = LiveData(**self.livedata)
+    def __post_init__(self, lazy: bool):
+        self._hydrate(lazy)
 
     @property
     def id(self):
         return self.gamepk
+
+    def pitch_table(self) -> Dict[str, Union[array, List[str]]]:
+        """
+        return every pitch in this game as columns, see Plays.pitch_table
+        """
+        return self.livedata.plays.pitch_table()
@@ -1,7 +1,9 @@
 from typing import Optional, Union, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from mlbstatsapi.models.venues import Venue
 from mlbstatsapi.models.people import Person
+from mlbstatsapi.models.lazy import LazyModel
+from mlbstatsapi.models.constructors import from_dict
 
 from .attributes import GameDataGame
 from .attributes import GameDatetime
@@ -15,7 +17,7 @@ from .attributes import GameProbablePitchers
 from .attributes import MoundVisits
 
 @dataclass(repr=False)
-class GameData:
+class GameData(LazyModel):
     """
     A class to represent a games game data.
 
@@ -51,6 +53,8 @@ class GameData:
         The official scorer for this game
     primarydatacaster : Person
         The official dataCaster for this game
+    lazy : bool
+        build each attribute from its raw dict when it is first read
     """
 
     game: Union[GameDataGame, dict]
@@ -70,26 +74,32 @@ class GameData:
     officialscorer: Optional[Union[Person, dict]] = field(default_factory=dict)
     primarydatacaster: Optional[Union[Person, dict]] = field(default_factory=dict)
     secondarydatacaster: Optional[Union[Person, dict]] = field(default_factory=dict)
+    lazy: InitVar[bool] = False
 
-    def __post_init__(self):
-        self.game = GameDataGame(**self.game)
-        self.datetime = GameDatetime(**self.datetime)
-        self.status = GameStatus(**self.status)
-        self.teams = GameTeams(**self.teams)
-        self.players = [Person(**(self.players[key])) for key in self.players]
-        self.venue = Venue(**self.venue)
-        self.officialvenue = Venue(**self.officialvenue)
-        self.weather = GameWeather(**self.weather) if self.weather else self.weather
-        self.gameinfo = GameInfo(**self.gameinfo) if self.gameinfo else self.gameinfo
-        self.review = GameReview(**self.review)
-        self.flags = GameFlags(**self.flags)
-        self.probablepitchers = GameProbablePitchers(**self.probablepitchers)
-        self.officialscorer = Person(**self.officialscorer) if self.officialscorer else self.officialscorer
-        self.primarydatacaster = Person(**self.primarydatacaster) if self.primarydatacaster else self.primarydatacaster
-        self.secondarydatacaster = Person(**self.secondarydatacaster) if self.secondarydatacaster else self.secondarydatacaster
-        self.moundvisits = MoundVisits(**self.moundvisits) if self.moundvisits else self.moundvisits
+    _builders = {
+        'game': lambda game, lazy: from_dict(GameDataGame, game),
+        'datetime': lambda datetime, lazy: from_dict(GameDatetime, datetime),
+        'status': lambda status, lazy: from_dict(GameStatus, status),
+        'teams': lambda teams, lazy: from_dict(GameTeams, teams),
+        'players': lambda players, lazy: [from_dict(Person, players[key]) for key in players],
+        'venue': lambda venue, lazy: from_dict(Venue, venue),
+        'officialvenue': lambda officialvenue, lazy: from_dict(Venue, officialvenue),
+        'weather': lambda weather, lazy: from_dict(GameWeather, weather) if weather else weather,
+        'gameinfo': lambda gameinfo, lazy: from_dict(GameInfo, gameinfo) if gameinfo else gameinfo,
+        'review': lambda review, lazy: from_dict(GameReview, review),
+        'flags': lambda flags, lazy: from_dict(GameFlags, flags),
+        'probablepitchers': lambda probablepitchers, lazy: from_dict(GameProbablePitchers, probablepitchers),
+        'officialscorer': lambda person, lazy: from_dict(Person, person) if person else person,
+        'primarydatacaster': lambda person, lazy: from_dict(Person, person) if person else person,
+        'secondarydatacaster': lambda person, lazy: from_dict(Person, person) if person else person,
+        'moundvisits': lambda moundvisits, lazy: from_dict(MoundVisits, moundvisits) if moundvisits else moundvisits,
+    }
+
+    def __post_init__(self, lazy: bool):
+        self._hydrate(lazy)
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None and value]
+        kws = [f'{key}={value}' for key, value in self.__dict__.items()
+               if value is not None and value and not key.startswith('_')]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
 
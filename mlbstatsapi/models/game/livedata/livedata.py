@@ -1,15 +1,17 @@
 from typing import Union, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 
 from mlbstatsapi.models.game.livedata.plays import Plays
 from mlbstatsapi.models.game.livedata.linescore import Linescore
 from mlbstatsapi.models.game.livedata.boxscore import BoxScore
+from mlbstatsapi.models.lazy import LazyModel
+from mlbstatsapi.models.constructors import from_dict
 
 from .attributes import GameLeaders, GameDecisions
 
 
 @dataclass(repr=False)
-class LiveData:
+class LiveData(LazyModel):
     """
     A class to represent this games live data.
 
@@ -25,21 +27,29 @@ class LiveData:
         The data leaders for this game
     decisions : GameDecisions = None
         Decisions for this game, Ie a winner or a loser
+    lazy : bool
+        build each attribute from its raw dict when it is first read
     """
     plays: Union[Plays, dict]
     boxscore: Union[BoxScore, dict]
     leaders: Union[GameLeaders, dict]
     decisions: Optional[Union[GameDecisions, dict]] = field(default_factory=dict)
     linescore: Union[Linescore, dict] = field(default_factory=dict)
+    lazy: InitVar[bool] = False
 
+    _builders = {
+        # plays already built, e.g. merged with Plays.merge, are kept
+        'plays': lambda plays, lazy: plays if isinstance(plays, Plays) else from_dict(Plays, {**plays, 'lazy': lazy}),
+        'linescore': lambda linescore, lazy: from_dict(Linescore, linescore) if linescore else linescore,
+        'boxscore': lambda boxscore, lazy: from_dict(BoxScore, boxscore),
+        'decisions': lambda decisions, lazy: from_dict(GameDecisions, decisions) if decisions else decisions,
+        'leaders': lambda leaders, lazy: from_dict(GameLeaders, leaders),
+    }
 
-    def __post_init__(self):
-        self.plays = Plays(**self.plays)
-        self.linescore = Linescore(**self.linescore) if self.linescore else self.linescore
-        self.boxscore = BoxScore(**self.boxscore)
-        self.decisions = GameDecisions(**self.decisions) if self.decisions else self.decisions
-        self.leaders = GameLeaders(**self.leaders)
+    def __post_init__(self, lazy: bool):
+        self._hydrate(lazy)
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None and value]
+        kws = [f'{key}={value}' for key, value in self.__dict__.items()
+               if value is not None and value and not key.startswith('_')]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
\ No newline at end of file
@@ -0,0 +1,125 @@
+from array import array
+from typing import Dict, List, Union
+
+from mlbstatsapi.models.game.livedata.plays.play import Play
+
+
+# column name -> array typecode, or None for columns of strings kept in a list
+PITCH_COLUMNS = {
+    'atbatindex': 'q',
+    'pitchnumber': 'q',
+    'inning': 'q',
+    'istopinning': 'b',
+    'batter': 'q',
+    'pitcher': 'q',
+    'balls': 'q',
+    'strikes': 'q',
+    'outs': 'q',
+    'call': None,
+    'pitchtype': None,
+    'startspeed': 'd',
+    'endspeed': 'd',
+    'zone': 'd',
+    'extension': 'd',
+    'strikezonetop': 'd',
+    'strikezonebottom': 'd',
+    'spinrate': 'd',
+    'spindirection': 'd',
+    'breakangle': 'd',
+    'breaklength': 'd',
+    'breakvertical': 'd',
+    'breakverticalinduced': 'd',
+    'breakhorizontal': 'd',
+    'px': 'd',
+    'pz': 'd',
+    'pfxx': 'd',
+    'pfxz': 'd',
+    'x0': 'd',
+    'y0': 'd',
+    'z0': 'd',
+    'vx0': 'd',
+    'vy0': 'd',
+    'vz0': 'd',
+    'ax': 'd',
+    'ay': 'd',
+    'az': 'd',
+}
+
+_PITCHDATA_COLUMNS = ('startspeed', 'endspeed', 'zone', 'extension', 'strikezonetop', 'strikezonebottom')
+_BREAK_COLUMNS = ('spinrate', 'spindirection', 'breakangle', 'breaklength', 'breakvertical',
+                  'breakverticalinduced', 'breakhorizontal')
+_COORDINATE_COLUMNS = ('px', 'pz', 'pfxx', 'pfxz', 'x0', 'y0', 'z0', 'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az')
+
+_NAN = float('nan')
+
+
+def _float(model, name: str) -> float:
+    # nested models missing from the feed are left as None or {}
+    value = getattr(model, name, None)
+    return _NAN if value is None else float(value)
+
+
+def _code(model) -> Union[str, None]:
+    return getattr(model, 'code', None)
+
+
+def pitch_table(allplays: List[Play]) -> Dict[str, Union[array, List[str]]]:
+    """
+    Flatten every pitch in allplays into columns, one row per pitch
+
+    Numeric columns are array.array of the typecode in PITCH_COLUMNS, so
+    numpy.asarray or pandas can wrap them without copying. Floats the feed
+    leaves out are nan, and call and pitchtype are lists of codes.
+
+    Parameters
+    ----------
+    allplays : List[Play]
+        the plays to flatten, in order
+
+    Returns
+    -------
+    Dict[str, Union[array, List[str]]]
+        a column for every name in PITCH_COLUMNS, all the same length
+    """
+    columns = {name: array(typecode) if typecode else [] for name, typecode in PITCH_COLUMNS.items()}
+
+    for play in allplays:
+        atbatindex = play.atbatindex
+        inning = play.about.inning
+        istopinning = play.about.istopinning
+        batter = play.matchup.batter.id
+        pitcher = play.matchup.pitcher.id
+
+        for event in play.playevents:
+            if not event.ispitch:
+                continue
+
+            columns['atbatindex'].append(atbatindex)
+            columns['pitchnumber'].append(event.pitchnumber or 0)
+            columns['inning'].append(inning)
+            columns['istopinning'].append(istopinning)
+            columns['batter'].append(batter)
+            columns['pitcher'].append(pitcher)
+
+            count = event.count
+            columns['balls'].append(count.balls if count else 0)
+            columns['strikes'].append(count.strikes if count else 0)
+            columns['outs'].append(count.outs if count else 0)
+
+            columns['call'].append(_code(event.details.call))
+            columns['pitchtype'].append(_code(event.details.type))
+
+            pitchdata = event.pitchdata
+            breaks = getattr(pitchdata, 'breaks', None)
+            coordinates = getattr(pitchdata, 'coordinates', None)
+
+            for name in _PITCHDATA_COLUMNS:
+                columns[name].append(_float(pitchdata, name))
+
+            for name in _BREAK_COLUMNS:
+                columns[name].append(_float(breaks, name))
+
+            for name in _COORDINATE_COLUMNS:
+                columns[name].append(_float(coordinates, name))
+
+    return columns
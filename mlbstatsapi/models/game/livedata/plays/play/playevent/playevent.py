@@ -1,9 +1,9 @@
 from typing import Union, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from mlbstatsapi.models.people import Person, Position
 from mlbstatsapi.models.data import Count, HitData, PitchData, PlayDetails
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class PlayEvent:
     """
     A class to represent a information about a play.
@@ -81,5 +81,5 @@ class PlayEvent:
         self.replacedplayer = Person(**self.replacedplayer) if self.replacedplayer else self.replacedplayer
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None]
+        kws = [f'{f.name}={getattr(self, f.name)}' for f in fields(self) if getattr(self, f.name) is not None]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
\ No newline at end of file
@@ -1,12 +1,16 @@
-from typing import Union, List
-from dataclasses import dataclass, field
+from array import array
+from typing import Union, List, Dict
+from dataclasses import dataclass, field, InitVar
 
 from mlbstatsapi.models.game.livedata.plays.play import Play
 from mlbstatsapi.models.game.livedata.plays.playbyinning import PlayByInning
+from mlbstatsapi.models.game.livedata.plays.pitchtable import pitch_table
+from mlbstatsapi.models.lazy import LazyModel
+from mlbstatsapi.models.constructors import from_dict
 
 
 @dataclass(repr=False)
-class Plays:
+class Plays(LazyModel):
     """
     A class to represent the plays in this game.
 
@@ -20,18 +24,83 @@ class Plays:
         Which plays are scoring plays, indexed with allPlays
     playsbyinning : List[PlayByInning]
         Plays by inning
+    lazy : bool
+        build the plays from their raw dicts when they are first read
+
+    Methods
+    -------
+    pitch_table():
+        returns every pitch in allplays as columns
+    merge(plays):
+        brings these plays up to date with a newer response, reusing the
+        plays that did not change
     """
     allplays: Union[List[Play], List[dict]]
     scoringplays: List[int]
     playsbyinning: Union[List[PlayByInning], List[dict]]
     currentplay: Union[Play, dict] = field(default_factory=dict)
+    lazy: InitVar[bool] = False
+
+    _builders = {
+        'allplays': lambda allplays, lazy: [from_dict(Play, play) for play in allplays if play],
+        'currentplay': lambda currentplay, lazy: from_dict(Play, currentplay) if currentplay else currentplay,
+        'playsbyinning': lambda playsbyinning, lazy: [from_dict(PlayByInning, inning) for inning in playsbyinning if inning],
+    }
+
+    def __post_init__(self, lazy: bool):
+        self._hydrate(lazy)
+
+    def merge(self, plays: dict) -> 'Plays':
+        """
+        bring these plays up to date with a newer response of the same game
+
+        A play is only built again when its atbatindex is new, or it was not
+        complete, or its playevents grew. Completed plays are kept as the
+        same Play objects, so merging a poll costs about as much as the
+        plays that changed instead of every play of the game.
+
+        Parameters
+        ----------
+        plays : dict
+            plays with lowercase keys, e.g. the plays of a feed or
+            get_game_play_by_play with raw='dict'
+
+        Returns
+        -------
+        Plays
+            these plays
+        """
+        built = {play.atbatindex: play for play in self.allplays}
+        allplays = []
+
+        for play in plays.get('allplays', []):
+            if not play:
+                continue
+
+            old = built.get(play.get('atbatindex'))
+
+            if (old is None or not old.about.iscomplete or not play.get('about', {}).get('iscomplete')
+                    or len(play.get('playevents', [])) != len(old.playevents)):
+                old = from_dict(Play, play)
+
+            allplays.append(old)
+
+        # the merged plays are all set here, nothing is left to build lazily
+        self.__dict__.pop('_lazy', None)
+        self.allplays = allplays
+        self.scoringplays = plays.get('scoringplays', [])
+        self.playsbyinning = self._builders['playsbyinning'](plays.get('playsbyinning', []), False)
+        self.currentplay = self._builders['currentplay'](plays.get('currentplay', {}), False)
 
+        return self
 
-    def __post_init__(self):
-        self.allplays = [Play(**play) for play in self.allplays if play]
-        self.currentplay = Play(**self.currentplay) if self.currentplay else self.currentplay
-        self.playsbyinning = [PlayByInning(**inning) for inning in self.playsbyinning if inning]
+    def pitch_table(self) -> Dict[str, Union[array, List[str]]]:
+        """
+        return every pitch in allplays as columns, see pitchtable.pitch_table
+        """
+        return pitch_table(self.allplays)
 
     def __repr__(self) -> str:
-        kws = [f'{key}={value}' for key, value in self.__dict__.items() if value is not None and value]
+        kws = [f'{key}={value}' for key, value in self.__dict__.items()
+               if value is not None and value and not key.startswith('_')]
         return "{}({})".format(type(self).__name__, ", ".join(kws))
\ No newline at end of file
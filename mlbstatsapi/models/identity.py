@@ -0,0 +1,126 @@
+import contextlib
+import contextvars
+import threading
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class IdentityMap:
+    """
+    Shared instances of models that have an id, keyed by class and id
+
+    While an identity map is active, building a model whose class uses the
+    Interned metaclass returns the instance already built for that id, so a
+    player seen in every play of a game is one Person. When a later dict for
+    the id has keys the shared instance was not built with, e.g. a full
+    player record after a matchup's id, fullname and link, those attributes
+    are set on the shared instance. That instance may already have been
+    returned, so models returned earlier change too: a Person from an
+    earlier response of a session map gains the attributes of a later,
+    fuller record. Attributes that are already set are never changed.
+
+    Without max_size a map only grows, it holds every Person, Team and
+    League it has seen until clear is called. With max_size the least
+    recently used instances are dropped once there are more, and a later
+    dict for a dropped id builds a new instance.
+
+    Attributes
+    ----------
+    max_size : int
+        optional max number of shared instances
+    """
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self._instances: Dict[Tuple[type, Any], Tuple[Any, set]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def clear(self):
+        with self._lock:
+            self._instances.clear()
+
+    def resolve(self, cls: type, build, kwargs: dict):
+        """
+        return the shared instance of cls for kwargs['id'], built with build(**kwargs) if there is none
+        """
+        key = (cls, kwargs['id'])
+        entry = self._instances.get(key)
+
+        if entry is not None and self.max_size is not None:
+            with self._lock:
+                if key in self._instances:
+                    self._instances.move_to_end(key)
+
+        if entry is None:
+            instance = build(**kwargs)
+
+            with self._lock:
+                entry = self._instances.setdefault(key, (instance, set(kwargs)))
+
+                if self.max_size is not None and len(self._instances) > self.max_size:
+                    self._instances.popitem(last=False)
+
+            if entry[0] is instance:
+                return instance
+
+        instance, keys = entry
+        missing = kwargs.keys() - keys
+
+        if missing:
+            fuller = build(**kwargs)
+
+            with self._lock:
+                for name in missing:
+                    # InitVars are keys of kwargs but not attributes
+                    if hasattr(fuller, name):
+                        setattr(instance, name, getattr(fuller, name))
+
+                keys.update(missing)
+
+        return instance
+
+
+_identity_map: contextvars.ContextVar[Optional[IdentityMap]] = contextvars.ContextVar('identity_map', default=None)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """
+    return the identity map models are interned in, or None
+    """
+    return _identity_map.get()
+
+
+@contextlib.contextmanager
+def identity_scope(identity_map: Optional[IdentityMap] = None):
+    """
+    Intern models built inside the block in identity_map, a new one if None
+
+    Examples
+    --------
+    >>> with identity_scope():
+    ...     game = mlb.get_game(662242)
+    >>> game.livedata.plays.allplays[0].matchup.pitcher is game.livedata.plays.allplays[1].matchup.pitcher
+    True
+    """
+    token = _identity_map.set(IdentityMap() if identity_map is None else identity_map)
+
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
+
+
+class Interned(type):
+    """
+    Metaclass for models that are shared per id while an identity map is active
+    """
+    def __call__(cls, *args, **kwargs):
+        identity_map = _identity_map.get()
+
+        if identity_map is None or args or kwargs.get('id') is None:
+            return super().__call__(*args, **kwargs)
+
+        return identity_map.resolve(cls, super().__call__, kwargs)
@@ -0,0 +1,54 @@
+import threading
+
+from typing import Any, Callable, Dict
+
+from mlbstatsapi.models.identity import current_identity_map, identity_scope
+
+
+# builders take apart the raw dicts they are given, so a field must never be
+# built twice, even when two threads read it at the same time
+_hydrate_lock = threading.RLock()
+
+
+class LazyModel:
+    """
+    A mixin for dataclasses whose nested models can be built on first access
+
+    Subclasses list a builder for each nested field in _builders. A builder
+    takes the raw value of the field and the lazy flag, and returns the built
+    value. __post_init__ calls _hydrate, which builds every field right away,
+    or with lazy keeps the raw values aside and builds each field the first
+    time it is read. Fields built later are interned in the identity map
+    that was active when the model was made, if any.
+    """
+    _builders: Dict[str, Callable[[Any, bool], Any]] = {}
+
+    def _hydrate(self, lazy: bool = False):
+        if lazy:
+            self.__dict__['_lazy'] = {name: self.__dict__.pop(name) for name in self._builders}
+            self.__dict__['_identity_map'] = current_identity_map()
+            return
+
+        for name, build in self._builders.items():
+            setattr(self, name, build(getattr(self, name), False))
+
+    def __getattr__(self, name: str):
+        # only called when name is not in __dict__, i.e. not built yet
+        lazy = self.__dict__.get('_lazy')
+
+        if lazy is not None and name in lazy:
+            with _hydrate_lock:
+                if name in lazy:
+                    identity_map = self.__dict__.get('_identity_map')
+
+                    if identity_map is None:
+                        self.__dict__[name] = self._builders[name](lazy[name], True)
+                    else:
+                        with identity_scope(identity_map):
+                            self.__dict__[name] = self._builders[name](lazy[name], True)
+
+                    del lazy[name]
+
+            return self.__dict__[name]
+
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
@@ -3,6 +3,7 @@ from typing import Optional, Union
 
 from mlbstatsapi.models.sports import Sport
 from mlbstatsapi.models.seasons import Season
+from mlbstatsapi.models.identity import Interned
 
 
 @dataclass
@@ -28,7 +29,7 @@ class LeagueRecord:
 
 
 @dataclass(repr=False)
-class League:
+class League(metaclass=Interned):
     """
     A class to represent a league.
 
@@ -4,11 +4,12 @@ from typing import Union, Dict, Any, Optional
 from .attributes import BatSide, Position, PitchHand, Status, Home, School
 from mlbstatsapi.models.teams import Team
 from mlbstatsapi.models.data import CodeDesc
+from mlbstatsapi.models.identity import Interned
 # from mlbstatsapi.models.drafts import Home, College
 
 
 @dataclass(repr=False)
-class Person:
+class Person(metaclass=Interned):
     """
     A class to represent a Person.
 
@@ -0,0 +1,315 @@
+import functools
+
+from dataclasses import fields, is_dataclass
+from typing import Dict, Iterable, List, Optional, Set, Type, Union, get_args
+
+from mlbstatsapi.exceptions import TheMlbStatsApiException
+from mlbstatsapi.models.constructors import from_dict
+
+
+# spellings of model attributes in statsapi.mlb.com responses, the fields
+# param is case sensitive. Every attribute of the models that take attributes
+# is listed, camelCase or not, tests check it against the models. Collected
+# from the keys of the responses in tests/mock_tests/mock_json
+API_NAMES = """
+    abbreviation about abstractGameCode abstractGameState actionIndex actionPlayId active
+    activeStatus additionalReviews address1 address2 address3 airOuts alerts allPlays allPositions
+    allStarDate allStarStatus ampm atBatIndex atBatNumber atBats atBatsPerHomeRun attendance away
+    awayScore awayTeamNoHitter awayTeamPerfectGame aX aY aZ azimuthAngle ballColor balls ballsInPlay
+    base baseOnBalls baseOnBallsPer9 batSide batter batterHotColdZones batterHotColdZoneStats
+    batters battersFaced battingOrder bench bequeathedRunners bequeathedRunnersScored birthCity
+    birthCountry birthDate birthStateProvince bisPlayerId blownSaves bonusTime bottom bottomSeed
+    boxscore boxscoreName breakAngle breakHorizontal breakLength breaks breakVertical
+    breakVerticalInduced breakY bullpen calendarEventID call capacity captivatingIndex catcher
+    catchersInterference caughtStealing center centerField challengeTeamId city clinchIndicator
+    clockStopped clubName code codedGameState completeGames condition conferenceGamesBack
+    conferencesInUse content coordinates coordX coordY count country credit credits currentAge
+    currentInning currentInningOrdinal currentPlay currentRound currentRoundTimeLeft currentTeam
+    date dates dateTime dayNight deathCity deathCountry deathDate deathStateProvince decisions
+    defaultCoordinates defense delayDurationMinutes description detailedState details
+    disengagementNum displayPickNumber division divisionChamp divisionGamesBack divisionLeader
+    divisionRank divisionRecords divisionsInUse doubleHeader draftType draftYear earned earnedRuns
+    elevation eliminationNumber eliminationNumberConference eliminationNumberDivision
+    eliminationNumberLeague eliminationNumberSport end endIndex endSpeed endTime errors event
+    eventDate eventNumber events eventType expectedRecords extension extraBaseHits fieldInfo
+    fieldList fileCode first firstDate2ndHalf firstLastName firstName firstPitch firstYearOfPlay
+    flags flyHits flyOuts franchiseName fromCatcher fullFMLName fullLFMName fullName game gameData
+    gameDate gamedayType gameDurationMinutes gameEvents gameGuid gameInfo gameLevelGamedayType
+    gameNumber gamePk games gamesBack gameScore gamesFinished gamesInSeries gamesPitched gamesPlayed
+    gamesStarted gameStatus gameType gender gidpOpp groundHits groundIntoDoublePlay
+    groundIntoTriplePlay groundOuts groundOutsToAirouts halfInning hardness hasChallenges hasOut
+    hasPlayoffPoints hasReview hasSplitSeason hasWildCard hasWildcard headshotLink height hitBatsmen
+    hitByPitch hitData hitDistance hits hitSpeed hitsPer9 hitsPer9Inn hitsPerGame hitsPerRun
+    hittingGameScore home homeRun homeRuns homeRunsPer9 homeRunsPerPlateAppearance homeScore
+    homeTeamNoHitter homeTeamPerfectGame id ifNecessary ifNecessaryDescription index info
+    inheritedRunners inheritedRunnersScored inHole initLastName injuryType inning inningBreakLength
+    inningHalf innings inningsPitched inningsPlayedPerGame inningState inProgress intentionalWalks
+    inTieBreaker isAtBat isBall isBaseHit isBaseRunningPlay isBonusTime isComplete isCurrentBatter
+    isCurrentPitcher isDrafted isHome isHomeRun isInPlay isMultiDay isOnBench isOut isOverturned
+    isPass isPitch isPlateAppearance isPlayer isPrimaryCalendar isScoringEvent isScoringPlay
+    isStarted isStrike isSubstitute isSubstitution isTie isTieBreaker isTopInning isVerified
+    isWinner jerseyNumber jobId label landingPosX landingPosY lastDate1stHalf lastFirstName
+    lastInitName lastName lastPlayedDate lastUpdated latitude launchAngle launchSpeed leaders league
+    leagueGamesBack leagueRank leagueRecord leagueRecords left leftCenter leftCenterField leftField
+    leftLine leftOnBase lineHits lineOuts linescore link liveData location locationName
+    logicalEvents longitude loser losses magicNumber matchup measuredTimeInterval menOnBase metaData
+    middleName mlbDebutDate moundVisits movement movementReason name nameFirstLast nameMatrilineal
+    nameShort nameSlug nameSuffix nameTitle nickName noHitter nonGameGuid note num numBatters
+    numberOfPitches numGames numHomeRuns numPlayoffTeams numTeams numWildcardTeams offense official
+    officialDate officials officialScorer officialType officialVenue offSeasonEndDate
+    offseasonStartDate offset offsetAtGameTime onDeck ordinalNum orgCode originalDate originBase
+    outBase outNumber outs outsPitched overallRecords parentOrgId parentOrgName parentTeamId
+    passedBall pct perfectGame person pfxId pfxX pfxZ phone pickNumber pickRound pickValue pitchData
+    pitcher pitcherHotColdZones pitcherHotColdZoneStats pitchers pitchersPerGame pitchesPer9Inn
+    pitchesPerGame pitchesPerInning pitchesPerPitcher pitchesPerPlateAppearance pitchHand pitchIndex
+    pitchingGameScore pitchingNotes pitchNumber pitchSpeed pk plateAppearances
+    plateAppearancesPer9Inn plateAppearancesPerGame plateTime playEndTime player players playEvents
+    playId playIndex plays playsByInning popHits popOuts position postalCode postOnFirst
+    postOnSecond postOnThird postSeasonEndDate postSeasonStartDate preSeasonEndDate
+    preSeasonStartDate primaryDatacaster primaryNumber primaryPosition probablePitchers
+    pronunciation prPortalCalculatedFields publicFacing putOuts pX pZ qualifierOutsPitched
+    qualifierPlateAppearances qualityStarts rbi reachedOnError reason record records recordSource
+    regularSeasonEndDate regularSeasonStartDate remaining replacedPlayer rescheduleDate
+    rescheduledFrom rescheduledFromDate rescheduleGameDate responsiblePitcher result resumeDate
+    resumeDateTime resumedFrom resumedFromDate resumedFromDateTime resumeGameDate
+    reverseHomeAwayStatus review reviewDetails reviewType right rightCenter rightCenterField
+    rightField rightLine roofType roundPickNumber runDifferential runner runnerGoing runnerIndex
+    runnerOn1b runnerOn2b runnerOn3b runners runs runsAllowed runsPer9Inn runsPerGame runsScored
+    runsScoredPer9 runSupport sacBunts sacFlies save saveOpportunities scheduledInnings schoolClass
+    score scoringPlays scoutingReport season seasonDateInfo seasonDisplay seasonEndDate seasonId
+    seasonLevelGamedayType seasonStartDate seasonState seasonStats second secondaryDatacaster
+    seriesDescription seriesGameNumber seriesNumber shortName shortstop signingBonus sortOrder
+    spinDirection spinRate splitRecords splits splitSquad sport sportGamesBack sportRank
+    springEndDate springLeague springLeagueGamesBack springStartDate springVenue standingsType start
+    startIndex startSpeed startTime startTimeTBD state stateAbbrev stats status statusCode
+    stolenBasePercentage stolenBases streakCode streakNumber streakType strikeOuts strikeoutsPer9
+    strikeoutsPer9Inn strikeoutsPerPlateAppearance strikeoutWalkRatio strikePercentage strikes
+    strikesoutsToWalks strikeZoneBottom strikeZoneDepth strikeZoneTop strikeZoneWidth swingAndMisses
+    team teamCode teamName teamRecords teams teamStats teamUnearned temp third tieBreaker
+    tieBreakerNum ties time timePer77PlateAppearances timePer7InnGame timePer7InnGameWithoutExtraInn
+    timePer9Inn timePer9InnGame timePerExtraInnGame timePerGame timePerHit timePerPitch
+    timePerPlateAppearance timePerRun timeRemaining timeStamp timeZone title top topDerbyHitData
+    topPerformers topSeed total7InnGames total7InnGamesCompletedEarly total7InnGamesScheduled
+    total7InnGamesWithoutExtraInn total9InnGames total9InnGamesCompletedEarly
+    total9InnGamesScheduled total9InnGamesWithoutExtraInn totalBases totalDistance totalEvents
+    totalExtraInnGames totalExtraInnTime totalGames totalGamesInProgress totalGameTime totalHits
+    totalInningsPlayed totalItems totalPitchers totalPitches totalPlateAppearances totalRuns
+    totalSplits totalSwings trailColor trajectory trajectoryData trajectoryPolynomialX
+    trajectoryPolynomialY trajectoryPolynomialZ turfType type typeConfidence tz umpire used
+    useLastName useName validTimeInterval value venue violation vX0 vY0 vZ0 wait walkOffs
+    walksPer9Inn walksPerPlateAppearance walksPerStrikeout weather weight wildCardEliminationNumber
+    wildCardGamesBack wildCardLeader wildCardRank wildPitches wind winner winningPercentage
+    winPercentage wins x x0 y y0 z0 zone
+"""
+
+_api_names: Dict[str, Set[str]] = {}
+
+for _name in API_NAMES.split():
+    # a few keys are spelled more than one way, e.g. hasWildcard and hasWildCard
+    _api_names.setdefault(_name.lower(), set()).add(_name)
+
+# attributes whose dict is keyed by id, e.g. {'ID660271': {...}}, the fields
+# param keeps keys by name so it cannot ask for their values
+KEYED_BY_ID = {('GameData', 'players'), ('BoxScoreTeam', 'players')}
+
+# attribute path tree, an attribute maps to None when all of it is wanted
+# or to the tree of the attributes wanted inside it
+ProjectionTree = Dict[str, Optional['ProjectionTree']]
+
+
+def api_names(name: str) -> Set[str]:
+    """
+    return the spellings of a lowercase model attribute in responses
+    """
+    return _api_names.get(name, {name})
+
+
+def _spellings(cls: Type, name: str) -> Set[str]:
+    """
+    return the spellings of the attribute name of cls in responses
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        if the attribute is keyed by id or has no spelling in API_NAMES, it
+        would be dropped by the api and never set
+    """
+    if (cls.__name__, name) in KEYED_BY_ID:
+        raise TheMlbStatsApiException(f'{cls.__name__}.{name} is keyed by id and cannot be requested with '
+                                      f'attributes, request the other attributes of {cls.__name__} instead')
+
+    if name not in _api_names:
+        raise TheMlbStatsApiException(f'{cls.__name__}.{name} has no spelling in API_NAMES to request it with')
+
+    return _api_names[name]
+
+
+def _model_class(hint) -> Optional[Type]:
+    """
+    return the dataclass in a field's type hint, Play for Union[List[Play], List[dict]]
+    """
+    if isinstance(hint, type) and is_dataclass(hint):
+        return hint
+
+    for arg in get_args(hint):
+        model = _model_class(arg)
+
+        if model is not None:
+            return model
+
+    return None
+
+
+def projection_tree(attributes: Iterable[str]) -> ProjectionTree:
+    """
+    return the tree of dotted attribute paths, e.g. ['gamedata.status', 'livedata.linescore']
+
+    A path that is a prefix of another, e.g. gamedata and gamedata.status, wants all of it.
+    """
+    tree = {}
+
+    for attribute in attributes:
+        node = tree
+        *parents, leaf = attribute.lower().split('.')
+
+        for name in parents:
+            if name in node and node[name] is None:
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[leaf] = None
+
+    return tree
+
+
+def _all_names(cls: Type, names: Set[str], seen: Set[Type]):
+    if cls in seen:
+        return
+
+    seen.add(cls)
+
+    for model_field in fields(cls):
+        names.update(_spellings(cls, model_field.name))
+        model = _model_class(model_field.type)
+
+        if model is not None:
+            _all_names(model, names, seen)
+
+
+def projection_fields(cls: Type, tree: ProjectionTree, names: Set[str] = None) -> Set[str]:
+    """
+    return the names to send in the fields param for the attributes in tree of cls
+
+    Parameters
+    ----------
+    cls : dataclass
+        model the response is built into, e.g. Game
+    tree : ProjectionTree
+        attributes wanted, from projection_tree
+
+    Returns
+    -------
+    set
+        the spellings of every attribute in tree, and of every attribute of
+        the models it wants all of
+
+    Raises
+    ------
+    TheMlbStatsApiException
+        if cls has no attribute named in tree, or one of the attributes
+        cannot be requested, e.g. gamedata.players which is keyed by id
+    """
+    names = set() if names is None else names
+    hints = {model_field.name: model_field.type for model_field in fields(cls)}
+
+    for name, subtree in tree.items():
+        if name not in hints:
+            raise TheMlbStatsApiException(f'{cls.__name__} has no attribute {name}')
+
+        names.update(_spellings(cls, name))
+        model = _model_class(hints[name])
+
+        if model is None:
+            continue
+
+        if subtree is None:
+            _all_names(model, names, set())
+        else:
+            projection_fields(model, subtree, names)
+
+    return names
+
+
+def _build(hint, value):
+    model = _model_class(hint)
+
+    if model is None or not value:
+        return value
+
+    if isinstance(value, list):
+        return [from_dict(model, item) for item in value if item]
+
+    return from_dict(model, value)
+
+
+def _partial_repr(self) -> str:
+    kws = [f'{key}={value}' for key, value in self.__dict__.items()]
+    return "{}({})".format(type(self).__name__, ", ".join(kws))
+
+
+def _partial_eq(self, other) -> bool:
+    if type(other) is not type(self):
+        return NotImplemented
+    return self.__dict__ == other.__dict__
+
+
+@functools.lru_cache(maxsize=None)
+def _partial_class(cls: Type) -> Type:
+    # the dataclass __repr__ and __eq__ read every field, partial instances
+    # only have the attributes that were asked for, so they use these instead
+    partial = type(cls.__name__, (cls,), {'__repr__': _partial_repr, '__eq__': _partial_eq, '__hash__': None})
+    partial.__qualname__ = cls.__qualname__
+    partial.__module__ = cls.__module__
+    return partial
+
+
+def build_partial(cls: Type, data: Union[dict, List[dict]], tree: ProjectionTree):
+    """
+    return a cls with only the attributes in tree set, built from data
+
+    Attributes that are wanted whole are built the way cls builds them,
+    attributes not in tree are left unset and raise AttributeError.
+    Attributes missing from data are None. The instance is of a subclass of
+    cls whose repr and == only look at the attributes that are set.
+
+    Parameters
+    ----------
+    cls : dataclass
+        model to build, e.g. Game
+    data : dict
+        response with lowercase keys, usually requested with projection_fields
+    tree : ProjectionTree
+        attributes wanted, from projection_tree
+    """
+    instance = object.__new__(_partial_class(cls))
+    hints = {model_field.name: model_field.type for model_field in fields(cls)}
+    builders = getattr(cls, '_builders', {})
+
+    for name, subtree in tree.items():
+        value = data.get(name)
+
+        if value is None:
+            pass
+        elif subtree is None:
+            value = builders[name](value, False) if name in builders else _build(hints[name], value)
+        else:
+            model = _model_class(hints[name])
+
+            if isinstance(value, list):
+                value = [build_partial(model, item, subtree) for item in value]
+            else:
+                value = build_partial(model, value, subtree)
+
+        setattr(instance, name, value)
+
+    return instance
@@ -5,13 +5,14 @@ from mlbstatsapi.models.leagues import League
 from mlbstatsapi.models.venues import Venue
 from mlbstatsapi.models.divisions import Division
 from mlbstatsapi.models.sports import Sport
+from mlbstatsapi.models.identity import Interned
 
 from .attributes import TeamRecord
 # from mlbstatsapi.models.standings import Teamrecords
 
 
 @dataclass(repr=False)
-class Team:
+class Team(metaclass=Interned):
     """
     A class to represent a Team.
 
@@ -0,0 +1,145 @@
+"""
+Benchmark building the models of every fixture with cls(**data) and with from_dict
+
+Each fixture in tests/mock_tests/mock_json is built into the models the
+Mlb method for its endpoint returns. The error responses in response/
+have no model and are skipped.
+
+    PYTHONPATH=. python3 tests/benchmarks/bench_from_dict.py
+"""
+import os
+import time
+
+from mlbstatsapi import mlb_module
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.models.awards import Award
+from mlbstatsapi.models.constructors import from_dict
+from mlbstatsapi.models.divisions import Division
+from mlbstatsapi.models.drafts import Round
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.gamepace import Gamepace
+from mlbstatsapi.models.homerunderby import Homerunderby
+from mlbstatsapi.models.leagues import League
+from mlbstatsapi.models.people import Coach, Person, Player
+from mlbstatsapi.models.schedules import Schedule
+from mlbstatsapi.models.sports import Sport
+from mlbstatsapi.models.standings import Standings
+from mlbstatsapi.models.teams import Team
+from mlbstatsapi.models.venues import Venue
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_mock_json = os.path.join(current_directory, "../mock_tests/mock_json")
+
+
+def listed(cls, *keys):
+    def models(data):
+        for key in keys:
+            data = data[key]
+        return [(cls, item) for item in data]
+    return models
+
+
+def whole(cls):
+    return lambda data: [(cls, data)]
+
+
+def roster(cls):
+    return lambda data: [(cls, mlb_module.merge_keys(item, ['person'])) for item in data['roster']]
+
+
+def splits(data):
+    models = []
+
+    for stat in data['stats']:
+        stat_type, stat_group, _ = mlb_module.get_stat_attributes(stat)
+        stat_class = mlb_module.get_stat_class(stat_group, stat_type)
+
+        if stat_class is not None:
+            models += [(stat_class, split) for split in stat['splits'] if split.get('stat')]
+
+    return models
+
+
+FIXTURES = {
+    'awards/awards.json': listed(Award, 'awards'),
+    'divisions/division.json': listed(Division, 'divisions'),
+    'divisions/divisions.json': listed(Division, 'divisions'),
+    'drafts/draft.json': listed(Round, 'drafts', 'rounds'),
+    'gamepace/gamepace.json': whole(Gamepace),
+    'games/game.json': whole(Game),
+    'homerunderby/homerunderby.json': whole(Homerunderby),
+    'leagues/league.json': listed(League, 'leagues'),
+    'leagues/leagues.json': listed(League, 'leagues'),
+    'people/person.json': listed(Person, 'people'),
+    'people/players.json': listed(Person, 'people'),
+    'schedule/schedule_date.json': whole(Schedule),
+    'schedule/schedule_start_end_date.json': whole(Schedule),
+    'sports/sport.json': listed(Sport, 'sports'),
+    'sports/sports.json': listed(Sport, 'sports'),
+    'standings/standings.json': listed(Standings, 'records'),
+    'stats/person/game_stats_player_archie.json': splits,
+    'stats/person/game_stats_player_cal.json': splits,
+    'stats/person/game_stats_player_shoei_ohtani.json': splits,
+    'stats/person/game_stats_player_ty_france.json': splits,
+    'stats/person/hitting_player_pitchlog.json': splits,
+    'stats/person/hitting_player_playlog.json': splits,
+    'stats/person/hitting_player_stats.json': splits,
+    'stats/person/hotcoldzone.json': splits,
+    'stats/person/pitching_player_pitchlog.json': splits,
+    'stats/person/pitching_player_playlog.json': splits,
+    'stats/person/pitching_player_stats.json': splits,
+    'stats/person/spraychart.json': splits,
+    'stats/team/hitting_team_stats.json': splits,
+    'stats/team/pitching_team_stats.json': splits,
+    'teams/team.json': listed(Team, 'teams'),
+    'teams/team_coaches.json': roster(Coach),
+    'teams/team_roster_coaches.json': roster(Coach),
+    'teams/team_roster_players.json': roster(Player),
+    'teams/teams.json': listed(Team, 'teams'),
+    'venues/venue.json': listed(Venue, 'venues'),
+    'venues/venues.json': listed(Venue, 'venues'),
+}
+
+
+def fixture_models(path: str) -> list:
+    # models take apart the dicts they are built from, so each build gets fresh ones
+    with open(os.path.join(path_to_mock_json, path), "rb") as fixture:
+        data = decode_lowered(fixture.read().lstrip(b'\xef\xbb\xbf'))
+
+    data.pop('copyright', None)
+    return FIXTURES[path](data)
+
+
+def call(cls, data):
+    return cls(**data)
+
+
+def time_build(path: str, build, number: int) -> float:
+    fixtures = [fixture_models(path) for _ in range(number)]
+    started = time.perf_counter()
+
+    for models in fixtures:
+        for cls, data in models:
+            build(cls, data)
+
+    return (time.perf_counter() - started) / number
+
+
+def main(number: int = 50, repeat: int = 5):
+    print(f'tests/mock_tests/mock_json, best of {repeat} x {number}, microseconds per fixture')
+    print(f'{"fixture":48} {"cls(**data)":>12} {"from_dict":>12}')
+    totals = [0.0, 0.0]
+
+    for path in FIXTURES:
+        best = [min(time_build(path, build, number) for _ in range(repeat)) for build in (call, from_dict)]
+        totals = [total + seconds for total, seconds in zip(totals, best)]
+        print(f'{path:48} {best[0] * 1e6:12.0f} {best[1] * 1e6:12.0f}')
+
+    print(f'{"all fixtures":48} {totals[0] * 1e6:12.0f} {totals[1] * 1e6:12.0f}')
+    print(f'{"fixtures per second":48} {len(FIXTURES) / totals[0]:12.0f} {len(FIXTURES) / totals[1]:12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark building a Game with and without an identity map
+
+Every Person, Team and League reference in game.json is built as its own
+instance without an identity map, and resolves to one shared instance per
+id with one.
+
+    PYTHONPATH=. python3 tests/benchmarks/bench_identity_map.py
+"""
+import os
+import time
+import tracemalloc
+
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.identity import identity_scope
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_tests/mock_json/games/game.json")
+
+GAME_JSON = open(path_to_game, "rb").read().lstrip(b'\xef\xbb\xbf')
+
+
+def game_data() -> dict:
+    data = decode_lowered(GAME_JSON)
+    del data['copyright']
+    return data
+
+
+def build(data: dict) -> Game:
+    return Game(**data)
+
+
+def build_interned(data: dict) -> Game:
+    with identity_scope():
+        return Game(**data)
+
+
+def time_build(build, number: int) -> float:
+    # models take apart the dicts they are built from, so each build gets fresh ones
+    games = [game_data() for _ in range(number)]
+    started = time.perf_counter()
+
+    for data in games:
+        build(data)
+
+    return (time.perf_counter() - started) / number
+
+
+def held_bytes(build) -> int:
+    data = game_data()
+    tracemalloc.start()
+    game = build(data)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del game
+    return held
+
+
+def main(number: int = 50, repeat: int = 5):
+    print(f'game.json, best of {repeat} x {number}')
+
+    for name, game_build in (('no identity map', build), ('identity map', build_interned)):
+        best = min(time_build(game_build, number) for _ in range(repeat))
+        print(f'{name:20} {best * 1000:7.3f} ms  held {held_bytes(game_build) / 1024:6.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark decoding a game feed with lowercase keys
+
+Compares decoding then walking the tree to lowercase keys, the old
+MlbDataAdapter path, with lowering keys while decoding.
+
+    PYTHONPATH=. python3 tests/benchmarks/bench_json_decode.py
+"""
+import json
+import os
+import timeit
+import tracemalloc
+
+from mlbstatsapi import MlbDataAdapter
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_tests/mock_json/games/game.json")
+
+GAME_JSON = open(path_to_game, "r", encoding="utf-8-sig").read().encode()
+
+
+def decode_then_lower(content: bytes, adapter: MlbDataAdapter = MlbDataAdapter()) -> dict:
+    return adapter._transform_keys_in_data(json.loads(content))
+
+
+def peak_bytes(decode) -> int:
+    tracemalloc.start()
+    decode(GAME_JSON)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(number: int = 200, repeat: int = 5):
+    assert decode_then_lower(GAME_JSON) == decode_lowered(GAME_JSON)
+
+    print(f'game.json, {len(GAME_JSON) / 1024:.0f} KiB, best of {repeat} x {number}')
+
+    for name, decode in (('json.loads + _transform_keys_in_data', decode_then_lower),
+                         ('decode_lowered', decode_lowered)):
+        best = min(timeit.repeat(lambda: decode(GAME_JSON), number=number, repeat=repeat)) / number
+        print(f'{name:40} {best * 1000:7.3f} ms  peak {peak_bytes(decode) / 1024:7.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark bringing the plays of a live game up to date after a poll
+
+game.json has 2 plays, they are repeated to make a game with as many
+plays as a full game. Each poll adds one pitch to the last play, which
+is then built again in full, merged with Plays.merge, or patched with a
+diff patch and patch_model.
+
+    PYTHONPATH=. python3 tests/benchmarks/bench_live_updates.py
+"""
+import os
+import time
+
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.mlb_live import apply_patch, copy_json, patch_model
+from mlbstatsapi.models.constructors import from_dict
+from mlbstatsapi.models.game import Plays
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_tests/mock_json/games/game.json")
+
+GAME_JSON = open(path_to_game, "rb").read().lstrip(b'\xef\xbb\xbf')
+
+
+def plays_data(count: int) -> dict:
+    plays = decode_lowered(GAME_JSON)['livedata']['plays']
+    template = plays['allplays']
+    plays['allplays'] = [{**copy_json(template[index % len(template)]), 'atbatindex': index}
+                         for index in range(count)]
+    plays['allplays'][-1]['about']['iscomplete'] = False
+    return plays
+
+
+def pitch(plays: dict) -> list:
+    last = len(plays['allplays']) - 1
+    event = plays['allplays'][-1]['playevents'][-1]
+    return [{'op': 'add', 'path': f'/allPlays/{last}/playEvents/-', 'value': copy_json(event)}]
+
+
+def time_update(update, count: int, number: int) -> float:
+    plays = plays_data(count)
+    built = from_dict(Plays, copy_json(plays))
+    polls = [apply_patch(plays, pitch(plays)) for _ in range(number)]
+    # a full poll decodes its own dicts, so rebuild and merge get a copy made beforehand
+    polls = [(poll, copy_json(poll)) for poll in polls]
+    started = time.perf_counter()
+
+    for poll, decoded in polls:
+        update(built, plays, poll, decoded)
+
+    return (time.perf_counter() - started) / number
+
+
+def rebuild(built: Plays, before: dict, after: dict, decoded: dict) -> Plays:
+    return from_dict(Plays, decoded)
+
+
+def merge(built: Plays, before: dict, after: dict, decoded: dict) -> Plays:
+    return built.merge(decoded)
+
+
+def patch(built: Plays, before: dict, after: dict, decoded: dict) -> Plays:
+    return patch_model(built, before, after)
+
+
+def main(number: int = 20, repeat: int = 5):
+    print(f'plays of game.json repeated, best of {repeat} x {number}, milliseconds per poll')
+    print(f'{"plays":>6} {"rebuild":>10} {"merge":>10} {"patch":>10}')
+
+    for count in (10, 40, 80):
+        best = [min(time_update(update, count, number) for _ in range(repeat)) for update in (rebuild, merge, patch)]
+        print(f'{count:6} ' + ' '.join(f'{seconds * 1000:10.3f}' for seconds in best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark the memory held by play events and their pitch models
+
+Builds every play event in game.json with the slotted models and with
+__dict__ backed copies of the same dataclasses, the models before they
+had __slots__, and reports the bytes held per pitch.
+
+    PYTHONPATH=. python3 tests/benchmarks/bench_pitch_memory.py
+"""
+import dataclasses
+import os
+import tracemalloc
+
+from unittest.mock import patch
+
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.models.data import data
+from mlbstatsapi.models.game.livedata.plays.play.playevent import playevent
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_tests/mock_json/games/game.json")
+
+GAME_JSON = open(path_to_game, "rb").read().lstrip(b'\xef\xbb\xbf')
+
+SLOTTED = {
+    data: ('PitchBreak', 'PitchCoordinates', 'PitchData', 'HitCoordinates', 'HitData',
+           'CodeDesc', 'Violation', 'Count', 'PlayDetails'),
+    playevent: ('PlayEvent',),
+}
+
+
+def unslotted(cls) -> type:
+    """
+    return a __dict__ backed copy of a slotted dataclass
+    """
+    namespace = {'__annotations__': dict(cls.__annotations__), '__module__': cls.__module__}
+
+    for model_field in dataclasses.fields(cls):
+        if model_field.default is not dataclasses.MISSING:
+            namespace[model_field.name] = model_field.default
+        elif model_field.default_factory is not dataclasses.MISSING:
+            namespace[model_field.name] = dataclasses.field(default_factory=model_field.default_factory)
+
+    if hasattr(cls, '__post_init__'):
+        namespace['__post_init__'] = cls.__post_init__
+
+    return dataclasses.dataclass(repr=False)(type(cls.__name__, (), namespace))
+
+
+def raw_play_events(copies: int) -> list:
+    events = []
+
+    for _ in range(copies):
+        for play in decode_lowered(GAME_JSON)['livedata']['plays']['allplays']:
+            events.extend(play['playevents'])
+
+    return events
+
+
+def held_bytes(copies: int) -> tuple:
+    """
+    return the bytes held by PlayEvents built from copies of game.json, and the number of pitches
+    """
+    events = raw_play_events(copies)
+    pitches = sum(1 for event in events if event.get('ispitch'))
+
+    tracemalloc.start()
+    built = [playevent.PlayEvent(**event) for event in events]
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del built
+    return held, pitches
+
+
+def main(copies: int = 200):
+    slotted, pitches = held_bytes(copies)
+
+    patches = [patch.multiple(module, **{name: unslotted(getattr(module, name)) for name in names})
+               for module, names in SLOTTED.items()]
+
+    for module_patch in patches:
+        module_patch.start()
+
+    try:
+        before, _ = held_bytes(copies)
+    finally:
+        for module_patch in patches:
+            module_patch.stop()
+
+    print(f'{pitches} pitches from {copies} copies of game.json')
+    print(f'{"__dict__ backed":20} {before / pitches:8.0f} bytes per pitch')
+    print(f'{"__slots__":20} {slotted / pitches:8.0f} bytes per pitch')
+
+
+if __name__ == '__main__':
+    main()
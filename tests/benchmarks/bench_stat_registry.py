@@ -0,0 +1,98 @@
+"""
+Benchmark finding and building stat split classes
+
+Compares scanning the stat group module with inspect on every call, the old
+return_splits, with the stat class registry, over every stat block in
+tests/mock_tests/mock_json/stats.
+
+    PYTHONPATH=. python3 tests/benchmarks/bench_stat_registry.py
+"""
+import glob
+import importlib
+import inspect
+import os
+import time
+import timeit
+
+from mlbstatsapi import mlb_module
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_stats = os.path.join(current_directory, "../mock_tests/mock_json/stats")
+
+STATS_JSON = [open(path, "rb").read().lstrip(b'\xef\xbb\xbf')
+              for path in sorted(glob.glob(os.path.join(path_to_stats, "*", "*.json")))]
+
+
+def scan_stat_class(stat_group: str, stat_type: str):
+    stat_module = importlib.import_module(f"mlbstatsapi.models.stats.{stat_group}")
+
+    for name, obj in inspect.getmembers(stat_module, predicate=inspect.isclass):
+        if hasattr(obj, '_stat') and stat_type in obj._stat:
+            return obj
+
+
+def scan_return_splits(split_data: list, stat_type: str, stat_group: str) -> list:
+    splits = []
+    stat_module = importlib.import_module(f"mlbstatsapi.models.stats.{stat_group}")
+
+    for name, obj in inspect.getmembers(stat_module, predicate=inspect.isclass):
+        if hasattr(obj, '_stat') and stat_type in obj._stat:
+            for split in split_data:
+                if 'stat' in split and split['stat']:
+                    splits.append(obj(**split))
+
+    return splits
+
+
+def stat_blocks() -> list:
+    blocks = []
+
+    for content in STATS_JSON:
+        for stat in decode_lowered(content)['stats']:
+            stat_type, stat_group, _ = mlb_module.get_stat_attributes(stat)
+            blocks.append((stat['splits'], stat_type, stat_group))
+
+    return blocks
+
+
+def time_splits(return_splits, number: int) -> float:
+    # splits are modified while building them, so each round gets fresh ones
+    elapsed = 0.0
+
+    for _ in range(number):
+        blocks = stat_blocks()
+        started = time.perf_counter()
+
+        for splits, stat_type, stat_group in blocks:
+            return_splits(splits, stat_type, stat_group)
+
+        elapsed += time.perf_counter() - started
+
+    return elapsed / number
+
+
+def main(number: int = 50, repeat: int = 5):
+    keys = [(stat_group, stat_type) for _, stat_type, stat_group in stat_blocks()]
+
+    for stat_group, stat_type in keys:
+        assert scan_stat_class(stat_group, stat_type) is mlb_module.get_stat_class(stat_group, stat_type)
+
+    print(f'{len(keys)} stat blocks from {len(STATS_JSON)} files, best of {repeat}')
+
+    scan = min(timeit.repeat(lambda: [scan_stat_class(*key) for key in keys], number=number, repeat=repeat))
+    registry = min(timeit.repeat(lambda: [mlb_module.get_stat_class(*key) for key in keys],
+                                 number=number, repeat=repeat))
+    print(f'{"class lookup, inspect scan":40} {scan / number * 1000:8.3f} ms')
+    print(f'{"class lookup, registry":40} {registry / number * 1000:8.3f} ms')
+
+    scan = min(time_splits(scan_return_splits, number) for _ in range(repeat))
+    registry = min(time_splits(mlb_module.return_splits, number) for _ in range(repeat))
+    print(f'{"return_splits, inspect scan":40} {scan * 1000:8.3f} ms')
+    print(f'{"return_splits, registry":40} {registry * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
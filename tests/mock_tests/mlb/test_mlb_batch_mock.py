@@ -0,0 +1,106 @@
+import unittest
+import requests_mock
+import json
+import os
+import time
+
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.teams import Team
+
+from mlbstatsapi import Mlb
+from mlbstatsapi import MlbBatchResult
+from mlbstatsapi import TheMlbStatsApiException
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_json/games/game.json")
+path_to_oakland_file = os.path.join(current_directory, "../mock_json/teams/team.json")
+path_to_not_found = os.path.join(current_directory, "../mock_json/response/not_found_404.json")
+path_to_error = os.path.join(current_directory, "../mock_json/response/error_500.json")
+
+GAME_JSON_FILE = open(path_to_game, "r", encoding="utf-8-sig").read()
+TEAM_JSON_FILE = open(path_to_oakland_file, "r", encoding="utf-8-sig").read()
+NOT_FOUND_404 = open(path_to_not_found, "r", encoding="utf-8-sig").read()
+ERROR_500 = open(path_to_error, "r", encoding="utf-8-sig").read()
+
+
+@requests_mock.Mocker()
+class TestMlbBatchMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mlb = Mlb()
+        cls.mock_game = json.loads(GAME_JSON_FILE)
+        cls.mock_team = json.loads(TEAM_JSON_FILE)
+        cls.mock_not_found = json.loads(NOT_FOUND_404)
+        cls.error_500 = json.loads(ERROR_500)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.mlb.close()
+
+    def test_get_games_reports_errors_per_id(self, m):
+        """get_games should return games in input order and report failed ids"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/1/feed/live', json=self.error_500,
+        status_code=500)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/2/feed/live', json=self.mock_not_found,
+        status_code=404)
+
+        games = self.mlb.get_games([1, 715720, 2, 715720], max_workers=2)
+
+        self.assertIsInstance(games, MlbBatchResult)
+        self.assertEqual(games.ids, [1, 715720, 2, 715720])
+        self.assertIsNone(games[0])
+        self.assertIsInstance(games[1], Game)
+        self.assertIsNone(games[2])
+        self.assertIsInstance(games[3], Game)
+
+        # only the 500 is an error, a 404 is just not found
+        self.assertEqual(list(games.errors), [1])
+        self.assertIsInstance(games.errors[1], TheMlbStatsApiException)
+
+    def test_get_teams_many(self, m):
+        """get_teams_many should return a Team for every id"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133', json=self.mock_team,
+        status_code=200)
+
+        teams = self.mlb.get_teams_many(iter([133, 133]))
+
+        self.assertEqual(len(teams), 2)
+        self.assertTrue(all(isinstance(team, Team) for team in teams))
+        self.assertEqual(teams.errors, {})
+
+    def test_identical_concurrent_requests_share_one_download(self, m):
+        """concurrent calls for the same game should make one request and decode their own copy"""
+        def slow_game(request, context):
+            # keep the first request in flight until every thread has asked for the game
+            time.sleep(0.2)
+            return self.mock_game
+
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=slow_game,
+        status_code=200)
+
+        games = self.mlb.get_games([715720] * 4, max_workers=4)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(games.errors, {})
+        self.assertTrue(all(isinstance(game, Game) for game in games))
+        self.assertIsNot(games[0].gamedata, games[1].gamedata)
+
+    def test_identical_concurrent_failures_are_shared(self, m):
+        """concurrent calls for the same failing game should all see the error"""
+        def slow_error(request, context):
+            time.sleep(0.2)
+            return self.error_500
+
+        m.get('https://statsapi.mlb.com/api/v1.1/game/1/feed/live', json=slow_error,
+        status_code=500)
+
+        games = self.mlb.get_games([1, 1, 1], max_workers=3)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(games.errors), 1)
+        self.assertIsNone(games[2])
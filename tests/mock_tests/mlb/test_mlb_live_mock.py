@@ -0,0 +1,332 @@
+import unittest
+import requests_mock
+import datetime
+import json
+import os
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from mlbstatsapi import Mlb, GameReplay, LiveGame, LiveGameWatcher, MemoryCache, RateLimiter, TheMlbStatsApiException
+from mlbstatsapi import from_dict
+from mlbstatsapi import LiveEvent, LiveEvents, PitchThrown, PlayCompleted, ScoreChanged, InningChanged, StatusChanged
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.mlb_live import apply_patch, copy_json, patch_model
+from mlbstatsapi.models.game import Game
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_json/games/game.json")
+path_to_not_found = os.path.join(current_directory, "../mock_json/response/not_found_404.json")
+
+GAME_JSON_FILE = open(path_to_game, "r", encoding="utf-8-sig").read()
+NOT_FOUND_404 = open(path_to_not_found, "r", encoding="utf-8-sig").read()
+
+FEED_URL = 'https://statsapi.mlb.com/api/v1.1/game/715720/feed/live'
+DIFF_URL = 'https://statsapi.mlb.com/api/v1.1/game/715720/feed/live/diffPatch'
+
+
+class TestApplyPatch(unittest.TestCase):
+    def test_apply_patch_operations(self):
+        """apply_patch should apply every operation with camelCase paths to lowercase keys"""
+        document = {'gamedata': {'status': {'code': 'P'}}, 'plays': [1, 2], 'keep': {'a': 1}}
+        patched = apply_patch(document, [
+            {'op': 'replace', 'path': '/gameData/status/code', 'value': 'I'},
+            {'op': 'add', 'path': '/plays/-', 'value': 3},
+            {'op': 'add', 'path': '/plays/0', 'value': 0},
+            {'op': 'remove', 'path': '/plays/1'},
+            {'op': 'copy', 'from': '/keep', 'path': '/copied'},
+            {'op': 'move', 'from': '/copied/a', 'path': '/moved'},
+            {'op': 'test', 'path': '/moved', 'value': 1},
+        ])
+
+        self.assertEqual(patched, {'gamedata': {'status': {'code': 'I'}}, 'plays': [0, 2, 3],
+                                   'keep': {'a': 1}, 'copied': {}, 'moved': 1})
+        # the document is left as it was and shares what did not change
+        self.assertEqual(document, {'gamedata': {'status': {'code': 'P'}}, 'plays': [1, 2], 'keep': {'a': 1}})
+        self.assertIs(patched['keep'], document['keep'])
+
+    def test_apply_patch_bad_operation(self):
+        """apply_patch should raise for an operation that does not apply"""
+        for operation in ({'op': 'replace', 'path': '/missing', 'value': 1},
+                          {'op': 'remove', 'path': '/plays/5'},
+                          {'op': 'test', 'path': '/plays/0', 'value': 2},
+                          {'op': 'jump', 'path': '/plays'}):
+            with self.subTest(operation=operation):
+                with self.assertRaises(TheMlbStatsApiException):
+                    apply_patch({'plays': [1]}, [operation])
+
+
+@requests_mock.Mocker()
+class TestLiveGameMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mlb = Mlb()
+        cls.mock_game = json.loads(GAME_JSON_FILE)
+        cls.play = json.loads(GAME_JSON_FILE)['liveData']['plays']['allPlays'][0]
+        cls.play['atBatIndex'] = 2
+
+    def diff(self, timestamp: str) -> list:
+        return [{'diff': [
+            {'op': 'replace', 'path': '/metaData/timeStamp', 'value': timestamp},
+            {'op': 'replace', 'path': '/gameData/status/detailedState', 'value': 'Delayed'},
+            {'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': self.play},
+            {'op': 'replace', 'path': '/liveData/plays/allPlays/1/playEvents/0/details/description',
+             'value': 'Pitch'},
+            {'op': 'replace', 'path': '/liveData/linescore/currentInning', 'value': 10},
+        ]}]
+
+    def test_live_game_update_patches_game(self, m):
+        """live game update should apply diff patches to the feed and the models they touch"""
+        m.get(FEED_URL, json=self.mock_game, status_code=200)
+        m.get(DIFF_URL, json=self.diff('20230423_000000'), status_code=200)
+        live = self.mlb.live_game(715720)
+        first = live.game
+        timecode = live.timecode
+
+        self.assertIsInstance(live, LiveGame)
+        self.assertTrue(live.update())
+        self.assertEqual(m.last_request.qs['starttimecode'], [timecode.lower()])
+        self.assertEqual(live.timecode, '20230423_000000')
+
+        # the patched game is the game built from the patched feed
+        self.assertEqual(live.game, from_dict(Game, copy_json(live.data)))
+        self.assertEqual(live.game.gamedata.status.detailedstate, 'Delayed')
+        self.assertEqual(live.game.livedata.plays.allplays[2].atbatindex, 2)
+        self.assertEqual(live.game.livedata.plays.allplays[1].playevents[0].details.description, 'Pitch')
+
+        # models that did not change are kept, the game before is left as it was
+        self.assertIs(live.game.livedata.plays.allplays[0], first.livedata.plays.allplays[0])
+        self.assertIs(live.game.livedata.boxscore, first.livedata.boxscore)
+        self.assertEqual(first, from_dict(Game, decode_lowered(GAME_JSON_FILE.encode())))
+
+    def test_live_game_update_without_changes(self, m):
+        """live game update should return False for an empty diff patch"""
+        m.get(FEED_URL, json=self.mock_game, status_code=200)
+        m.get(DIFF_URL, json=[], status_code=200)
+        live = self.mlb.live_game(715720)
+        game = live.game
+
+        self.assertFalse(live.update())
+        self.assertIs(live.game, game)
+
+    def test_live_game_update_falls_back_to_full_feed(self, m):
+        """live game update should use the full feed when it gets one or a patch does not apply"""
+        m.get(FEED_URL, json=self.mock_game, status_code=200)
+        m.get(DIFF_URL, [{'json': self.mock_game, 'status_code': 200},
+                         {'json': [{'diff': [{'op': 'remove', 'path': '/liveData/missing'}]}], 'status_code': 200}])
+        live = self.mlb.live_game(715720)
+        first = live.game.livedata.plays.allplays[0]
+
+        self.assertTrue(live.update())
+        self.assertTrue(live.update())
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(live.game, from_dict(Game, decode_lowered(GAME_JSON_FILE.encode())))
+        # completed plays are kept across full feeds
+        self.assertIs(live.game.livedata.plays.allplays[0], first)
+
+    def test_live_game_refresh_decodes_once(self, m):
+        """live game refresh should decode each feed once and keep its data apart from the game's models"""
+        m.get(FEED_URL, json=self.mock_game, status_code=200)
+
+        with mock.patch('json.loads', wraps=json.loads) as decode:
+            live = self.mlb.live_game(715720)
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(live.data, {key: value for key, value in decode_lowered(GAME_JSON_FILE.encode()).items()
+                                     if key != 'copyright'})
+        self.assertEqual(live.game, from_dict(Game, decode_lowered(GAME_JSON_FILE.encode())))
+
+    def test_live_game_not_found(self, m):
+        """mlb live_game should return None for a game id that does not exist"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/1/feed/live', json=json.loads(NOT_FOUND_404),
+              status_code=404)
+
+        self.assertIsNone(self.mlb.live_game(1))
+
+
+@requests_mock.Mocker()
+class TestLiveGameWatcherMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mlb = Mlb()
+
+    def feed(self, game_id: int, state: str) -> dict:
+        game = json.loads(GAME_JSON_FILE)
+        game['gamePk'] = game_id
+        game['gameData']['status']['abstractGameState'] = state
+        game['gameData']['datetime']['dateTime'] = '2100-01-01T00:00:00Z'
+        return game
+
+    def test_watcher_polls_by_status(self, m):
+        """watcher should poll preview games sparsely, live games tightly and stop at final"""
+        for game_id, state in ((1, 'Preview'), (2, 'Live'), (3, 'Final')):
+            m.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live', json=self.feed(game_id, state),
+                  status_code=200)
+
+        updated = []
+        watcher = LiveGameWatcher(self.mlb, game_ids=[1, 2, 3], budget=RateLimiter(1000),
+                                  intervals={'Preview': 300, 'Live': 5, 'Final': None},
+                                  on_update=lambda live: updated.append(live.game_id))
+        wait = watcher.poll()
+
+        self.assertEqual(sorted(updated), [1, 2, 3])
+        self.assertEqual(sorted(watcher.watching), [1, 2])
+        self.assertAlmostEqual(wait, 5, delta=1)
+        due = {game_id: due for due, game_id in watcher._due}
+        self.assertAlmostEqual(due[1] - due[2], 295, delta=1)
+
+    def test_watcher_stops_when_every_game_is_final(self, m):
+        """watcher run should return once no game is left to poll"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/3/feed/live', json=self.feed(3, 'Final'), status_code=200)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/4/feed/live', json=json.loads(NOT_FOUND_404),
+              status_code=404)
+        watcher = LiveGameWatcher(self.mlb, game_ids=[3, 4])
+        watcher.run()
+
+        self.assertEqual(watcher.watching, [])
+        self.assertEqual(m.call_count, 2)
+
+    def test_watcher_games_of_a_date(self, m):
+        """watcher should watch the scheduled games of a date, today when no date is given"""
+        schedule = {'dates': [{'date': '2023-04-23', 'games': [{'gamePk': 1}, {'gamePk': 2}]}]}
+        m.get('https://statsapi.mlb.com/api/v1/schedule', json=schedule, status_code=200)
+
+        watcher = LiveGameWatcher(self.mlb, date='2023-04-23')
+
+        self.assertEqual(sorted(watcher.watching), [1, 2])
+        self.assertEqual(m.last_request.qs['date'], ['2023-04-23'])
+
+        watcher = LiveGameWatcher(self.mlb)
+
+        self.assertEqual(sorted(watcher.watching), [1, 2])
+        self.assertEqual(m.last_request.qs['date'], [datetime.date.today().strftime('%Y-%m-%d')])
+
+    def test_watcher_keeps_polling_when_a_callback_fails(self, m):
+        """watcher should log a failing callback and keep polling the other games"""
+        for game_id in (1, 2):
+            m.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live', json=self.feed(game_id, 'Live'),
+                  status_code=200)
+        updated = []
+
+        def on_update(live):
+            updated.append(live.game_id)
+            if live.game_id == 1:
+                raise ValueError('callback failed')
+
+        watcher = LiveGameWatcher(self.mlb, game_ids=[1, 2], budget=RateLimiter(1000), on_update=on_update)
+        with self.assertLogs('mlbstatsapi', level='ERROR') as logs:
+            watcher.poll()
+
+        self.assertEqual(sorted(updated), [1, 2])
+        self.assertEqual(sorted(watcher.watching), [1, 2])
+        self.assertIn('on_update failed', logs.output[0])
+
+
+class TestLiveEvents(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = decode_lowered(GAME_JSON_FILE.encode())
+        self.game = from_dict(Game, copy_json(self.data))
+
+    def test_live_events_from_a_game(self):
+        """live events should report every pitch, play and change of a game once"""
+        live_events = LiveEvents()
+        events = live_events.events(self.game)
+        pitches = [event for play in self.game.livedata.plays.allplays for event in play.playevents if event.ispitch]
+        linescore = self.game.livedata.linescore
+
+        self.assertEqual(events[0], StatusChanged(715720, 'Final', 'Final'))
+        self.assertEqual([event.event for event in events if isinstance(event, PitchThrown)], pitches)
+        self.assertEqual([event.atbatindex for event in events if isinstance(event, PlayCompleted)], [0, 1])
+        self.assertIn(InningChanged(715720, linescore.currentinning, linescore.istopinning), events)
+        self.assertIn(ScoreChanged(715720, linescore.teams.away.runs, linescore.teams.home.runs), events)
+        self.assertEqual(live_events.events(self.game), [])
+
+    def test_live_events_between_states(self):
+        """live events should report only what happened since the last state"""
+        live_events = LiveEvents(backlog=False)
+        pitch = next(event for event in self.data['livedata']['plays']['allplays'][1]['playevents']
+                     if event['ispitch'])
+        play = {**self.data['livedata']['plays']['allplays'][1], 'atbatindex': 2,
+                'playevents': [{**pitch, 'playid': 'new-pitch'}],
+                'about': {**self.data['livedata']['plays']['allplays'][1]['about'], 'iscomplete': False}}
+        data = apply_patch(self.data, [
+            {'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': play},
+            {'op': 'replace', 'path': '/liveData/linescore/teams/home/runs', 'value': 9},
+        ])
+        game = patch_model(self.game, self.data, data)
+
+        self.assertEqual(live_events.events(self.game), [])
+        events = live_events.events(game)
+
+        self.assertEqual([type(event) for event in events], [PitchThrown, ScoreChanged])
+        self.assertEqual(events[0].atbatindex, 2)
+        self.assertEqual(events[1].home, 9)
+
+    def test_live_event_default_key(self):
+        """live event key should default to one event of its kind per game"""
+        self.assertEqual(LiveEvent(715720).key, ('LiveEvent', 715720))
+        self.assertNotEqual(StatusChanged(715720, 'Live', 'Final').key, LiveEvent(715720).key)
+
+
+@requests_mock.Mocker()
+class TestLiveGameWatcherEventsMock(unittest.TestCase):
+    def test_watcher_iter_events(self, m):
+        """watcher iter_events should yield the events of every game until they are final"""
+        m.get(FEED_URL, json=json.loads(GAME_JSON_FILE), status_code=200)
+        seen = []
+        watcher = LiveGameWatcher(Mlb(), game_ids=[715720], on_event=seen.append)
+        events = list(watcher.iter_events())
+
+        self.assertEqual(events, seen)
+        self.assertEqual(events, LiveEvents().events(from_dict(Game, decode_lowered(GAME_JSON_FILE.encode()))))
+
+
+@requests_mock.Mocker()
+class TestGameReplayMock(unittest.TestCase):
+    timecodes = ['20230422_200000', '20230422_200010', '20230422_200020']
+
+    def snapshot(self, request, context) -> dict:
+        game = json.loads(GAME_JSON_FILE)
+        game['metaData']['timeStamp'] = parse_qs(urlparse(request.url).query)['timecode'][0]
+        return game
+
+    def test_mlb_get_game_timestamps(self, m):
+        """mlb get_game_timestamps should return the timecodes of a game"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live/timestamps', json=self.timecodes,
+              status_code=200)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/1/feed/live/timestamps', json=json.loads(NOT_FOUND_404),
+              status_code=404)
+
+        self.assertEqual(Mlb().get_game_timestamps(715720), self.timecodes)
+        self.assertEqual(Mlb().get_game_timestamps(1), [])
+
+    def test_game_replay_from_cache(self, m):
+        """game replay should step through every snapshot and read them from the cache the second time"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live/timestamps', json=self.timecodes,
+              status_code=200)
+        m.get(FEED_URL, json=self.snapshot, status_code=200)
+        mlb = Mlb(cache=MemoryCache())
+
+        snapshots = list(GameReplay(mlb, 715720, speed=None).snapshots())
+        requests = m.call_count
+        replayed = [game.metadata.timestamp for game in GameReplay(mlb, 715720, speed=1000)]
+
+        self.assertEqual([timecode for timecode, _ in snapshots], self.timecodes)
+        self.assertEqual([game.metadata.timestamp for _, game in snapshots], self.timecodes)
+        self.assertEqual(replayed, self.timecodes)
+        self.assertEqual(requests, 4)
+        self.assertEqual(m.call_count, requests)
+
+    def test_game_replay_range_and_events(self, m):
+        """game replay should replay only the timecodes asked for and report the game's events once"""
+        m.get(FEED_URL, json=self.snapshot, status_code=200)
+        replay = GameReplay(Mlb(), 715720, speed=None, timecodes=self.timecodes, start='20230422_200010')
+        events = list(replay.iter_events())
+
+        self.assertEqual(replay.timecodes, self.timecodes[1:])
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(events, LiveEvents().events(from_dict(Game, decode_lowered(GAME_JSON_FILE.encode()))))
+
+        with self.assertRaises(TheMlbStatsApiException):
+            GameReplay(Mlb(), 715720, speed=0, timecodes=self.timecodes)
@@ -4,6 +4,7 @@ import unittest
 import requests_mock
 import json
 import os
+from urllib.parse import parse_qs, urlparse
 
 from mlbstatsapi.models.people import Person
 from mlbstatsapi.models.teams import Team
@@ -17,6 +18,7 @@ from mlbstatsapi.models.schedules import Schedule
 from mlbstatsapi import Mlb
 from mlbstatsapi import MlbResult
 from mlbstatsapi import TheMlbStatsApiException
+from mlbstatsapi.mlb_api import _passthrough
 
 # Mocked JSON directory
 # TODO Find a better way to structure and handle this :) 
@@ -427,6 +429,201 @@ class TestMlbGetGame(unittest.TestCase):
         self.assertIsInstance(game, Game)
         self.assertEqual(game.id, 715720)
 
+    def test_mlb_get_game_lazy(self, m):
+        """mlb get_game with lazy should build nested models on first access"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        game = self.mlb.get_game(715720, lazy=True)
+        eager = self.mlb.get_game(715720)
+
+        self.assertNotIn('livedata', game.__dict__)
+        self.assertEqual(game.gamedata.status, eager.gamedata.status)
+
+        # reading gamedata.status builds neither livedata nor the other gamedata attributes
+        self.assertNotIn('livedata', game.__dict__)
+        self.assertNotIn('players', game.gamedata.__dict__)
+
+        self.assertEqual(game.livedata.linescore, eager.livedata.linescore)
+        self.assertNotIn('allplays', game.livedata.plays.__dict__)
+        self.assertEqual(game.livedata.plays.allplays, eager.livedata.plays.allplays)
+        self.assertEqual(game, eager)
+
+    def test_mlb_get_game_raw(self, m):
+        """mlb get_game with raw should return the lowercased dict or the body instead of a Game"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        data = self.mlb.get_game(715720, raw='dict')
+        content = self.mlb.get_game(715720, raw='bytes')
+
+        self.assertEqual(data['gamepk'], 715720)
+        self.assertIn('livedata', data)
+        self.assertNotIn('copyright', data)
+        self.assertEqual(json.loads(content), self.mock_game)
+        self.assertIsInstance(self.mlb.get_game(715720), Game)
+
+    def test_mlb_get_game_attributes(self, m):
+        """mlb get_game with attributes should request only their fields and build just them"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        game = self.mlb.get_game(715720, attributes=['gamedata.status', 'livedata.linescore'])
+        eager = self.mlb.get_game(715720)
+        fields = parse_qs(urlparse(m.request_history[0].url).query)['fields'][0].split(',')
+
+        # the fields param is case sensitive, so the api spellings are sent
+        self.assertIn('gamePk', fields)
+        self.assertIn('abstractGameState', fields)
+        self.assertIn('currentInning', fields)
+        self.assertNotIn('allPlays', fields)
+
+        self.assertIsInstance(game, Game)
+        self.assertEqual(game.gamepk, 715720)
+        self.assertEqual(game.gamedata.status, eager.gamedata.status)
+        self.assertEqual(game.livedata.linescore, eager.livedata.linescore)
+
+        with self.assertRaises(AttributeError):
+            game.metadata
+
+        with self.assertRaises(TheMlbStatsApiException):
+            self.mlb.get_game(715720, attributes=['gamedata.nosuchattribute'])
+
+    def test_mlb_iter_game_plays(self, m):
+        """mlb iter_game_plays should yield the plays get_game builds, one at a time"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/1/feed/live', json=json.loads(NOT_FOUND_404),
+        status_code=404)
+        allplays = self.mlb.get_game(715720).livedata.plays.allplays
+        plays = self.mlb.iter_game_plays(715720, chunk_size=512)
+
+        self.assertEqual(next(plays), allplays[0])
+        self.assertEqual(list(plays), allplays[1:])
+        self.assertEqual(list(self.mlb.iter_game_plays(1)), [])
+
+    def test_mlb_iter_game_plays_identity_map(self, m):
+        """mlb iter_game_plays with an identity map should share a Person across plays"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        plays = list(Mlb(identity_map='response').iter_game_plays(715720))
+
+        self.assertIs(plays[0].matchup.pitcher, plays[1].matchup.pitcher)
+
+    def test_mlb_plays_merge(self, m):
+        """plays merge should keep completed plays and build only new or growing ones"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        plays = self.mlb.get_game(715720).livedata.plays
+        first, second = plays.allplays
+        newer = self.mlb.get_game(715720, raw='dict')['livedata']['plays']
+        newer['allplays'][1]['playevents'].append(newer['allplays'][1]['playevents'][-1])
+        newer['allplays'].append({**newer['allplays'][0], 'atbatindex': 2})
+        expected = Plays(**json.loads(json.dumps(newer)))
+
+        self.assertIs(plays.merge(newer), plays)
+        self.assertIs(plays.allplays[0], first)
+        self.assertIsNot(plays.allplays[1], second)
+        self.assertEqual(plays.allplays[2].atbatindex, 2)
+        self.assertEqual(plays, expected)
+
+    def test_mlb_raw_through_except_exception(self, m):
+        """mlb raw should return the response of a method that catches Exception around its request"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+
+        def get_feed(mlb):
+            try:
+                return mlb._mlb_adapter_v1_1.get(endpoint='game/715720/feed/live')
+            except Exception:
+                return None
+
+        self.assertEqual(_passthrough(get_feed)(self.mlb, raw='dict')['gamepk'], 715720)
+
+    def test_mlb_raw_per_client(self, m):
+        """mlb with raw should return responses from every call, batch calls included"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/1/feed/live', json=json.loads(NOT_FOUND_404),
+        status_code=404)
+        mlb = Mlb(raw='dict')
+        games = mlb.get_games([715720, 1])
+
+        self.assertEqual(games[0]['gamepk'], 715720)
+        self.assertIsNone(games[1])
+        self.assertEqual(games.errors, {})
+        self.assertIsInstance(mlb.get_game(715720, raw=False), Game)
+
+        with self.assertRaises(TheMlbStatsApiException):
+            Mlb(raw='yaml')
+
+    def test_mlb_get_game_identity_map(self, m):
+        """mlb with an identity map should build one Person and Team per id in a game"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        mlb = Mlb(identity_map='response')
+        game = mlb.get_game(715720)
+        allplays = game.livedata.plays.allplays
+        credited = allplays[0].runners[0].credits[0].player
+
+        self.assertIs(allplays[0].matchup.pitcher, allplays[1].matchup.pitcher)
+        self.assertIs(game.livedata.boxscore.teams.home.team, game.livedata.linescore.offense.team)
+        # a reference with only an id, fullname and link shares the full record
+        self.assertEqual(credited.fullname, 'Brandon Marsh')
+        self.assertIsNot(mlb.get_game(715720).livedata.plays.allplays[0].matchup.pitcher,
+                         allplays[0].matchup.pitcher)
+
+    def test_mlb_get_game_session_identity_map(self, m):
+        """mlb with a session identity map should share instances across responses"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        mlb = Mlb(identity_map='session')
+        first = mlb.get_game(715720)
+        second = mlb.get_game(715720, lazy=True)
+
+        self.assertIs(second.livedata.plays.allplays[0].matchup.pitcher,
+                      first.livedata.plays.allplays[0].matchup.pitcher)
+
+    def test_mlb_identity_map_unknown_scope(self, m):
+        """mlb should raise for an identity map scope it does not know"""
+        with self.assertRaises(TheMlbStatsApiException):
+            Mlb(identity_map='forever')
+
+    def test_mlb_get_game_pitch_table(self, m):
+        """game pitch_table should return a column per pitch attribute with a row per pitch"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        game = self.mlb.get_game(715720)
+        pitches = [(play, event) for play in game.livedata.plays.allplays
+                   for event in play.playevents if event.ispitch]
+        table = game.pitch_table()
+
+        self.assertEqual(table.keys(), game.livedata.plays.pitch_table().keys())
+        self.assertTrue(all(len(column) == len(pitches) for column in table.values()))
+
+        for row, (play, event) in enumerate(pitches):
+            self.assertEqual(table['batter'][row], play.matchup.batter.id)
+            self.assertEqual(table['pitcher'][row], play.matchup.pitcher.id)
+            self.assertEqual(table['inning'][row], play.about.inning)
+            self.assertEqual(table['strikes'][row], event.count.strikes)
+            self.assertEqual(table['call'][row], event.details.call.code)
+            self.assertEqual(table['startspeed'][row], event.pitchdata.startspeed)
+            self.assertEqual(table['px'][row], event.pitchdata.coordinates.px)
+            self.assertEqual(table['spinrate'][row], event.pitchdata.breaks.spinrate)
+
+    def test_mlb_get_game_play_events_are_slotted(self, m):
+        """play events and their pitch data should not carry an instance __dict__"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+        game = self.mlb.get_game(715720)
+        pitches = [event for play in game.livedata.plays.allplays
+                   for event in play.playevents if event.ispitch]
+
+        self.assertTrue(pitches)
+
+        for event in pitches:
+            self.assertFalse(hasattr(event, '__dict__'))
+            self.assertFalse(hasattr(event.pitchdata, '__dict__'))
+            self.assertFalse(hasattr(event.details, '__dict__'))
+            self.assertIn('pitchdata=', repr(event))
+
     # def test_get_game_playByPlay(self):
     #     playbyplay = self.mlb.get_game_play_by_play(662242)
     #     self.assertIsInstance(playbyplay, Plays)
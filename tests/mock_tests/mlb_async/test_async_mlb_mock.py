@@ -0,0 +1,228 @@
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+from mlbstatsapi import AsyncMlb, AsyncMlbDataAdapter, MlbResult, RequestHook, SqliteCache, TheMlbStatsApiException
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.teams import Team
+from mlbstatsapi.models.people import Player
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_game = os.path.join(current_directory, "../mock_json/games/game.json")
+path_to_team = os.path.join(current_directory, "../mock_json/teams/team.json")
+path_to_roster = os.path.join(current_directory, "../mock_json/teams/team_roster_players.json")
+path_to_error = os.path.join(current_directory, "../mock_json/response/error_500.json")
+
+GAME_JSON_FILE = open(path_to_game, "r", encoding="utf-8-sig").read()
+TEAM_JSON_FILE = open(path_to_team, "r", encoding="utf-8-sig").read()
+ROSTER_JSON_FILE = open(path_to_roster, "r", encoding="utf-8-sig").read()
+ERROR_500 = open(path_to_error, "r", encoding="utf-8-sig").read()
+
+RESPONSES = {
+    'https://statsapi.mlb.com/api/v1.1/game/715720/feed/live': (200, GAME_JSON_FILE),
+    'https://statsapi.mlb.com/api/v1/teams/133': (200, TEAM_JSON_FILE),
+    'https://statsapi.mlb.com/api/v1/teams/133/roster': (200, ROSTER_JSON_FILE),
+    'https://statsapi.mlb.com/api/v1/teams/0': (500, ERROR_500),
+    'https://statsapi.mlb.com/api/v1.1/game/1/feed/live': (500, ERROR_500),
+}
+
+
+REQUESTED = []
+
+
+async def mock_request(self, full_url, ep_params, headers=None):
+    REQUESTED.append(full_url)
+    status_code, body = RESPONSES[full_url]
+    await asyncio.sleep(0)
+    return status_code, 'OK', full_url, body.encode(), {}
+
+
+@patch.object(AsyncMlbDataAdapter, '_request', mock_request)
+class TestAsyncMlbMock(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.mlb = AsyncMlb()
+
+    async def test_async_adapter_get(self):
+        """AsyncMlbDataAdapter.get should return a MlbResult with lowercase keys"""
+        adapter = AsyncMlbDataAdapter()
+        result = await adapter.get('teams/133')
+
+        self.assertIsInstance(result, MlbResult)
+        self.assertEqual(result.status_code, 200)
+        self.assertIn('teams', result.data)
+
+    async def test_async_adapter_500(self):
+        """AsyncMlbDataAdapter.get should raise TheMlbStatsApiException for 500"""
+        adapter = AsyncMlbDataAdapter()
+
+        with self.assertRaises(TheMlbStatsApiException):
+            await adapter.get('teams/0')
+
+    async def test_async_mlb_get_game(self):
+        """AsyncMlb.get_game should return a Game"""
+        game = await self.mlb.get_game(715720)
+
+        self.assertIsInstance(game, Game)
+        self.assertEqual(game.id, 715720)
+
+    async def test_async_mlb_gather(self):
+        """AsyncMlb calls should run together on one event loop"""
+        game, team, roster = await asyncio.gather(self.mlb.get_game(715720),
+                                                  self.mlb.get_team(133),
+                                                  self.mlb.get_team_roster(133))
+
+        self.assertIsInstance(game, Game)
+        self.assertIsInstance(team, Team)
+        self.assertIsInstance(roster[0], Player)
+
+    async def test_async_mlb_mirrors_mlb(self):
+        """AsyncMlb should have a coroutine for every Mlb get_ method"""
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncMlb.get_schedule))
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncMlb.get_player_stats))
+        self.assertEqual(AsyncMlb.get_game.__doc__, AsyncMlb.get_game.__wrapped__.__doc__)
+
+    async def test_async_mlb_get_games(self):
+        """AsyncMlb.get_games should keep input order and report failed ids"""
+        games = await self.mlb.get_games([715720, 1, 715720], max_workers=2)
+
+        self.assertIsInstance(games[0], Game)
+        self.assertIsNone(games[1])
+        self.assertIsInstance(games[2], Game)
+        self.assertIsInstance(games.errors[1], TheMlbStatsApiException)
+
+    async def test_async_mlb_raw(self):
+        """AsyncMlb with raw should return the response instead of models"""
+        data = await self.mlb.get_game(715720, raw='dict')
+        content = await AsyncMlb(raw='bytes').get_game(715720)
+
+        self.assertEqual(data['gamepk'], 715720)
+        self.assertEqual(content, GAME_JSON_FILE.encode())
+
+    async def test_async_replay_same_request_twice(self):
+        """AsyncMlb should replay a method that makes the same request twice, even inside except Exception"""
+        def twice(mlb):
+            first = mlb.get_game(715720)
+
+            try:
+                second = mlb.get_game(715720)
+            except Exception:
+                return None
+
+            return first, second
+
+        REQUESTED.clear()
+        first, second = await self.mlb._call(twice)
+
+        self.assertEqual(REQUESTED, ['https://statsapi.mlb.com/api/v1.1/game/715720/feed/live'])
+        self.assertEqual(first, second)
+        self.assertIsNot(first.gamedata, second.gamedata)
+
+    async def test_async_replay_is_capped(self):
+        """AsyncMlb should raise for a method that keeps making new requests"""
+        def endless(mlb):
+            for page in range(1000):
+                mlb._mlb_adapter_v1.get('teams/133', ep_params={'page': page})
+
+        with self.assertRaises(TheMlbStatsApiException):
+            await self.mlb._call(endless)
+
+    async def test_async_identical_requests_share_one_download(self):
+        """AsyncMlb calls for the same game at the same time should make one request"""
+        REQUESTED.clear()
+        games = await asyncio.gather(*(self.mlb.get_game(715720) for _ in range(3)))
+
+        self.assertEqual(REQUESTED, ['https://statsapi.mlb.com/api/v1.1/game/715720/feed/live'])
+        self.assertTrue(all(isinstance(game, Game) for game in games))
+        self.assertIsNot(games[0].gamedata, games[1].gamedata)
+
+    async def test_async_sqlite_cache_off_the_loop(self):
+        """AsyncMlbDataAdapter should read and write a SqliteCache outside the loop's thread"""
+        threads = []
+        get, set = SqliteCache.get, SqliteCache.set
+
+        def record(method):
+            def recorded(cache, *args):
+                threads.append(threading.get_ident())
+                return method(cache, *args)
+            return recorded
+
+        with tempfile.TemporaryDirectory() as directory, \
+                patch.object(SqliteCache, 'get', record(get)), patch.object(SqliteCache, 'set', record(set)):
+            cache = SqliteCache(os.path.join(directory, 'cache.db'))
+            adapter = AsyncMlbDataAdapter(ver='v1.1', cache=cache)
+            REQUESTED.clear()
+            # a final game never changes, so SqliteCache keeps it
+            first = await adapter.get('game/715720/feed/live')
+            second = await adapter.get('game/715720/feed/live')
+            cache.close()
+
+        self.assertEqual(REQUESTED, ['https://statsapi.mlb.com/api/v1.1/game/715720/feed/live'])
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_async_hooks_report_model_timings(self):
+        """AsyncMlb hooks should get each request with the method that made it"""
+        class RecordingHook(RequestHook):
+            requests = []
+
+            def on_request(self, stats):
+                self.requests.append(stats)
+
+        hook = RecordingHook()
+        await AsyncMlb(hooks=[hook]).get_team_roster(133)
+
+        self.assertEqual(len(hook.requests), 1)
+        self.assertEqual(hook.requests[0].method, 'get_team_roster')
+        self.assertGreaterEqual(hook.requests[0].model, 0)
+        self.assertGreaterEqual(hook.requests[0].decode, 0)
+
+
+@unittest.skipIf(web is None, 'aiohttp is not installed')
+class TestAsyncMlbDataAdapterServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.requests = []
+        app = web.Application()
+        app.router.add_get('/api/v1/teams/133', self.team)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def team(self, request):
+        self.requests.append(request.query_string)
+        await asyncio.sleep(0.01)
+        return web.Response(body=TEAM_JSON_FILE.encode(), content_type='application/json')
+
+    async def test_async_adapter_over_http(self):
+        """AsyncMlbDataAdapter should create one session for concurrent first requests and share the download"""
+        adapter = AsyncMlbDataAdapter()
+        adapter.url = str(self.server.make_url('/api/v1/'))
+
+        try:
+            results = await asyncio.gather(*(adapter.get('teams/133', ep_params={'hydrate': 'venue'})
+                                             for _ in range(3)))
+            session = adapter.session
+            again = await adapter.get('teams/133')
+        finally:
+            await adapter.close()
+
+        self.assertEqual(self.requests, ['hydrate=venue', ''])
+        self.assertTrue(all(result.status_code == 200 for result in results))
+        self.assertIn('teams', results[0].data)
+        self.assertEqual(again.data, results[0].data)
+        self.assertIs(adapter.session, session)
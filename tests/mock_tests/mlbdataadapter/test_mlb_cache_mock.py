@@ -0,0 +1,252 @@
+import unittest
+import requests_mock
+import json
+import os
+import tempfile
+import time
+
+from unittest import mock
+
+from mlbstatsapi import Mlb, MlbDataAdapter
+from mlbstatsapi import CacheEntry, CachePolicy, MemoryCache, SqliteCache, TieredCache
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_teams_file = os.path.join(current_directory, "../mock_json/teams/teams.json")
+path_to_game = os.path.join(current_directory, "../mock_json/games/game.json")
+
+TEAMS_JSON_FILE = open(path_to_teams_file, "r", encoding="utf-8-sig").read()
+GAME_JSON_FILE = open(path_to_game, "r", encoding="utf-8-sig").read()
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_cache_policy_ttl_for(self):
+        """CachePolicy should match endpoints against patterns in order"""
+        policy = CachePolicy()
+
+        self.assertEqual(policy.ttl_for('game/715720/feed/live'), 10)
+        self.assertEqual(policy.ttl_for('teams'), 6 * 60 * 60)
+        self.assertEqual(policy.ttl_for('teams/133/roster'), 60 * 60)
+        self.assertEqual(policy.ttl_for('gamePace?season=2022'), policy.default_ttl)
+
+    def test_memory_cache_evicts_lru_by_bytes(self):
+        """MemoryCache should evict least recently used entries to stay under max_bytes"""
+        cache = MemoryCache(max_bytes=10)
+        cache.set('a', CacheEntry(200, 'OK', 'a', b'1234'))
+        cache.set('b', CacheEntry(200, 'OK', 'b', b'1234'))
+
+        # touch a so b is the least recently used
+        cache.get('a')
+        cache.set('c', CacheEntry(200, 'OK', 'c', b'1234'))
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.size, 8)
+
+    def test_memory_cache_skips_oversized_entries(self):
+        """MemoryCache should not store an entry bigger than max_bytes"""
+        cache = MemoryCache(max_bytes=2)
+        cache.set('a', CacheEntry(200, 'OK', 'a', b'1234'))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_entry_is_fresh(self):
+        """CacheEntry should go stale once expires has passed"""
+        self.assertTrue(CacheEntry(200, 'OK', 'a', b'', expires=None).is_fresh())
+        self.assertTrue(CacheEntry(200, 'OK', 'a', b'', expires=time.time() + 60).is_fresh())
+        self.assertFalse(CacheEntry(200, 'OK', 'a', b'', expires=time.time() - 1).is_fresh())
+
+
+@requests_mock.Mocker()
+class TestMlbDataAdapterCacheMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mock_teams = json.loads(TEAMS_JSON_FILE)
+
+    def test_adapter_serves_fresh_entries_from_cache(self, m):
+        """MlbDataAdapter should only hit the network once for a cached endpoint"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', json=self.mock_teams,
+        status_code=200)
+
+        mlb = Mlb(cache=MemoryCache())
+
+        first = mlb.get_team_id('Oakland Athletics')
+        second = mlb.get_team_id('Oakland Athletics')
+
+        self.assertEqual(first, second)
+        self.assertEqual(m.call_count, 1)
+
+    def test_adapter_decodes_undecoded_responses_only_to_check_immutability(self, m):
+        """MlbDataAdapter should decode a raw bytes response to cache it only if the response decides its ttl"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', text=TEAMS_JSON_FILE, status_code=200)
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', text=GAME_JSON_FILE, status_code=200)
+        cache = MemoryCache()
+        mlb_adapter = MlbDataAdapter(cache=cache)
+        game_adapter = MlbDataAdapter(ver='v1.1', cache=cache)
+
+        with mock.patch('json.loads', wraps=json.loads) as decode:
+            mlb_adapter.get(endpoint='teams', decode=False)
+
+            self.assertEqual(decode.call_count, 0)
+
+            game_adapter.get(endpoint='game/715720/feed/live', decode=False)
+
+            self.assertEqual(decode.call_count, 1)
+
+        self.assertEqual(len(cache), 2)
+        self.assertFalse(cache.policy.needs_data('game/715720/feed/live', {'timecode': '20230422_200000'}))
+
+    def test_adapter_keys_on_params(self, m):
+        """MlbDataAdapter cache keys should include normalized params"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', json=self.mock_teams,
+        status_code=200)
+
+        adapter = MlbDataAdapter(cache=MemoryCache())
+
+        adapter.get('teams', ep_params={'sportId': 1, 'season': 2022})
+        adapter.get('teams', ep_params={'season': 2022, 'sportId': 1})
+        adapter.get('teams', ep_params={'season': 2021, 'sportId': 1})
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_adapter_refetches_stale_entries(self, m):
+        """MlbDataAdapter should refetch once an entry's ttl has passed"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', json=self.mock_teams,
+        status_code=200)
+
+        cache = MemoryCache(policy=CachePolicy(ttls=[], default_ttl=60))
+        adapter = MlbDataAdapter(cache=cache)
+
+        adapter.get('teams')
+        for key in list(cache._entries):
+            cache._entries[key].expires = time.time() - 1
+        adapter.get('teams')
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_adapter_revalidates_stale_entries(self, m):
+        """MlbDataAdapter should revalidate a stale entry with its ETag and reuse it on 304"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', [
+            {'json': self.mock_teams, 'status_code': 200, 'headers': {'ETag': '"v1"'}},
+            {'status_code': 304, 'headers': {'ETag': '"v1"'}},
+        ])
+
+        cache = MemoryCache(policy=CachePolicy(ttls=[], default_ttl=60))
+        adapter = MlbDataAdapter(cache=cache)
+
+        first = adapter.get('teams')
+        for key in list(cache._entries):
+            cache._entries[key].expires = time.time() - 1
+        second = adapter.get('teams')
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers['If-None-Match'], '"v1"')
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(second.status_code, 200)
+        self.assertTrue(all(entry.is_fresh() for entry in cache._entries.values()))
+
+    def test_adapter_does_not_cache_errors(self, m):
+        """MlbDataAdapter should not cache error responses"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/0', json={}, status_code=404)
+
+        cache = MemoryCache()
+        adapter = MlbDataAdapter(cache=cache)
+        adapter.get('teams/0')
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestSqliteCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_sqlite_cache_persists(self):
+        """SqliteCache entries should survive reopening the database"""
+        cache = SqliteCache(self.path)
+        cache.set('a', CacheEntry(200, 'OK', 'a', b'1234'))
+        cache.close()
+
+        cache = SqliteCache(self.path)
+        entry = cache.get('a')
+
+        self.assertEqual(entry.content, b'1234')
+        self.assertEqual(cache.size, 4)
+        cache.close()
+
+    def test_sqlite_cache_immutable_only(self):
+        """SqliteCache should skip entries that expire when immutable_only is set"""
+        cache = SqliteCache(self.path)
+        cache.set('a', CacheEntry(200, 'OK', 'a', b'1234', expires=time.time() + 60))
+
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def test_sqlite_cache_evicts_lru_by_bytes(self):
+        """SqliteCache should evict least recently used entries past max_bytes"""
+        cache = SqliteCache(self.path, max_bytes=10)
+        cache.set('a', CacheEntry(200, 'OK', 'a', b'1234'))
+        cache.set('b', CacheEntry(200, 'OK', 'b', b'1234'))
+        cache.get('a')
+        cache.set('c', CacheEntry(200, 'OK', 'c', b'1234'))
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.size, 8)
+        cache.close()
+
+    def test_cache_policy_is_immutable(self):
+        """CachePolicy should mark final games, timecodes, past drafts and seasons immutable"""
+        policy = CachePolicy()
+        final = {'gamedata': {'status': {'abstractgamestate': 'Final'}}}
+        live = {'gamedata': {'status': {'abstractgamestate': 'Live'}}}
+
+        self.assertTrue(policy.is_immutable('game/1/feed/live', {}, final))
+        self.assertFalse(policy.is_immutable('game/1/feed/live', {}, live))
+        self.assertTrue(policy.is_immutable('game/1/feed/live', {'timecode': '20220801_010101'}, live))
+        self.assertTrue(policy.is_immutable('draft/2019', {}, {}))
+        self.assertTrue(policy.is_immutable('people/1/stats', {'season': 2019}, {}))
+        self.assertFalse(policy.is_immutable('people/1/stats', {}, {}))
+        self.assertFalse(policy.is_immutable('teams', {}, {}))
+
+    def test_cache_policy_timestamps_and_diff_patches(self):
+        """CachePolicy should keep timestamps of long finished games and never cache diff patches"""
+        policy = CachePolicy()
+        recent = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+
+        self.assertTrue(policy.is_immutable('game/1/feed/live/timestamps', {}, ['20220801_010101']))
+        self.assertFalse(policy.is_immutable('game/1/feed/live/timestamps', {}, ['20220801_010101', recent]))
+        self.assertFalse(policy.is_immutable('game/1/feed/live/timestamps', {}, []))
+        self.assertFalse(policy.ttl_for('game/1/feed/live/diffPatch'))
+
+
+@requests_mock.Mocker()
+class TestTieredCacheMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mock_game = json.loads(GAME_JSON_FILE)
+
+    def test_final_game_served_from_disk_after_restart(self, m):
+        """A final game should be read from disk by a new Mlb without network calls"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=self.mock_game,
+        status_code=200)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+
+            disk_cache = SqliteCache(path)
+            Mlb(cache=TieredCache(MemoryCache(), disk_cache)).get_game(715720)
+            disk_cache.close()
+
+            disk_cache = SqliteCache(path)
+            game = Mlb(cache=TieredCache(MemoryCache(), disk_cache)).get_game(715720)
+            disk_cache.close()
+
+        self.assertEqual(game.id, 715720)
+        self.assertEqual(m.call_count, 1)
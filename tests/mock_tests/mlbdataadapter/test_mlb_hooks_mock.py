@@ -0,0 +1,112 @@
+import unittest
+import requests_mock
+import io
+import json
+import os
+from contextlib import redirect_stdout
+
+from mlbstatsapi import Mlb, MlbDataAdapter, MemoryCache, RequestHook
+from mlbstatsapi import TheMlbStatsApiException
+from mlbstatsapi.models.teams import Team
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_oakland_file = os.path.join(current_directory, "../mock_json/teams/team.json")
+path_to_error = os.path.join(current_directory, "../mock_json/response/error_500.json")
+
+TEAM_JSON_FILE = open(path_to_oakland_file, "r", encoding="utf-8-sig").read()
+ERROR_500 = open(path_to_error, "r", encoding="utf-8-sig").read()
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.requests = []
+
+    def on_request(self, stats):
+        self.requests.append(stats)
+
+
+class BrokenHook(RequestHook):
+    def on_request(self, stats):
+        raise RuntimeError('broken hook')
+
+
+@requests_mock.Mocker()
+class TestRequestHooksMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mock_team = json.loads(TEAM_JSON_FILE)
+        cls.error_500 = json.loads(ERROR_500)
+
+    def test_hooks_report_request_and_model_timings(self, m):
+        """Mlb hooks should get one RequestStats per request with every timing set"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133', json=self.mock_team,
+        status_code=200)
+
+        hook = RecordingHook()
+        team = Mlb(hooks=[hook]).get_team(133)
+
+        self.assertIsInstance(team, Team)
+        self.assertEqual(len(hook.requests), 1)
+
+        stats = hook.requests[0]
+        self.assertEqual(stats.method, 'get_team')
+        self.assertEqual(stats.url, 'https://statsapi.mlb.com/api/v1/teams/133')
+        self.assertEqual(stats.status_code, 200)
+        self.assertEqual(stats.attempts, 1)
+        self.assertGreater(stats.bytes, 0)
+        self.assertFalse(stats.from_cache)
+
+        for timing in ('ttfb', 'download', 'decode', 'model', 'total'):
+            self.assertGreaterEqual(getattr(stats, timing), 0, timing)
+
+    def test_hooks_report_cache_hits(self, m):
+        """Mlb hooks should report responses served from the cache"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133', json=self.mock_team,
+        status_code=200)
+
+        hook = RecordingHook()
+        mlb = Mlb(hooks=[hook], cache=MemoryCache())
+        mlb.get_team(133)
+        mlb.get_team(133)
+
+        self.assertEqual([stats.from_cache for stats in hook.requests], [False, True])
+        self.assertIsNone(hook.requests[1].ttfb)
+
+    def test_adapter_hooks_report_errors(self, m):
+        """MlbDataAdapter hooks should be told about requests that raise"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/0', json=self.error_500,
+        status_code=500)
+
+        hook = RecordingHook()
+        adapter = MlbDataAdapter(hooks=[hook])
+
+        with self.assertRaises(TheMlbStatsApiException):
+            adapter.get('teams/0')
+
+        self.assertEqual(hook.requests[0].status_code, 500)
+        self.assertIsInstance(hook.requests[0].error, TheMlbStatsApiException)
+        self.assertIsNone(hook.requests[0].model)
+
+    def test_broken_hook_does_not_fail_request(self, m):
+        """A hook that raises should not fail the request it reports on"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133', json=self.mock_team,
+        status_code=200)
+
+        with self.assertLogs('mlbstatsapi', level='ERROR'):
+            team = Mlb(hooks=[BrokenHook()]).get_team(133)
+
+        self.assertIsInstance(team, Team)
+
+    def test_adapter_does_not_print(self, m):
+        """MlbDataAdapter.get should not write to stdout"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133', json=self.mock_team,
+        status_code=200)
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            MlbDataAdapter().get('teams/133')
+
+        self.assertEqual(stdout.getvalue(), '')
@@ -0,0 +1,125 @@
+import unittest
+import requests_mock
+import requests
+import json
+import os
+from email.utils import formatdate
+from unittest.mock import patch
+
+from mlbstatsapi import Mlb, MlbDataAdapter, RateLimiter, RetryPolicy
+from mlbstatsapi import TheMlbStatsApiException
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_teams_file = os.path.join(current_directory, "../mock_json/teams/teams.json")
+path_to_error = os.path.join(current_directory, "../mock_json/response/error_500.json")
+
+TEAMS_JSON_FILE = open(path_to_teams_file, "r", encoding="utf-8-sig").read()
+ERROR_500 = open(path_to_error, "r", encoding="utf-8-sig").read()
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_rate_limiter_allows_burst_then_spaces_requests(self):
+        """RateLimiter should allow burst requests at once then one per 1 / rate seconds"""
+        limiter = RateLimiter(rate=10, burst=2)
+
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertAlmostEqual(limiter.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(limiter.reserve(), 0.2, places=2)
+
+    def test_rate_limiter_hold(self):
+        """RateLimiter.hold should delay the next request even with tokens left"""
+        limiter = RateLimiter(rate=10)
+        limiter.hold(5)
+
+        self.assertGreater(limiter.reserve(), 4.9)
+
+    def test_retry_policy_delays(self):
+        """RetryPolicy should back off exponentially, honor Retry-After and give up"""
+        policy = RetryPolicy(retries=2, backoff=1, max_backoff=3)
+
+        self.assertLessEqual(policy.retry_delay(0, 503), 1)
+        self.assertLessEqual(policy.retry_delay(1, 503), 2)
+        self.assertEqual(policy.retry_delay(0, 429, '7'), 7)
+        self.assertIsNone(policy.retry_delay(2, 503))
+        self.assertIsNone(policy.retry_delay(0, 404))
+        self.assertIsNotNone(policy.retry_delay(0, None))
+
+    def test_retry_policy_parses_retry_after_dates(self):
+        """RetryPolicy.parse_retry_after should accept seconds and HTTP dates"""
+        self.assertEqual(RetryPolicy.parse_retry_after('120'), 120)
+        self.assertEqual(RetryPolicy.parse_retry_after(formatdate(0, usegmt=True)), 0)
+        self.assertIsNone(RetryPolicy.parse_retry_after('soon'))
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+
+
+@requests_mock.Mocker()
+@patch('mlbstatsapi.mlb_dataadapter.time.sleep')
+class TestMlbDataAdapterRetryMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mock_teams = json.loads(TEAMS_JSON_FILE)
+        cls.error_500 = json.loads(ERROR_500)
+
+    def test_adapter_retries_5xx(self, m, sleep):
+        """MlbDataAdapter should retry a 503 and return the following 200"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', [
+            {'json': self.error_500, 'status_code': 503},
+            {'json': self.mock_teams, 'status_code': 200},
+        ])
+
+        adapter = MlbDataAdapter(retry=RetryPolicy())
+        result = adapter.get('teams')
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(sleep.call_count, 1)
+
+    def test_adapter_honors_retry_after(self, m, sleep):
+        """MlbDataAdapter should wait Retry-After seconds on 429 and hold the rate limiter"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', [
+            {'json': {}, 'status_code': 429, 'headers': {'Retry-After': '3'}},
+            {'json': self.mock_teams, 'status_code': 200},
+        ])
+
+        limiter = RateLimiter(rate=100)
+        adapter = MlbDataAdapter(rate_limiter=limiter, retry=RetryPolicy())
+        result = adapter.get('teams')
+
+        self.assertEqual(result.status_code, 200)
+        self.assertIn(3, [call.args[0] for call in sleep.call_args_list])
+        self.assertGreater(limiter._hold_until, 0)
+
+    def test_adapter_gives_up_after_retries(self, m, sleep):
+        """MlbDataAdapter should raise TheMlbStatsApiException once retries run out"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', json=self.error_500, status_code=500)
+
+        adapter = MlbDataAdapter(retry=RetryPolicy(retries=2))
+
+        with self.assertRaises(TheMlbStatsApiException):
+            adapter.get('teams')
+
+        self.assertEqual(m.call_count, 3)
+
+    def test_adapter_retries_connection_errors(self, m, sleep):
+        """MlbDataAdapter should retry requests that fail to connect"""
+        m.get('https://statsapi.mlb.com/api/v1/teams', [
+            {'exc': requests.exceptions.ConnectionError},
+            {'json': self.mock_teams, 'status_code': 200},
+        ])
+
+        adapter = MlbDataAdapter(retry=RetryPolicy())
+
+        self.assertEqual(adapter.get('teams').status_code, 200)
+
+    def test_mlb_shares_rate_limiter_and_retry(self, m, sleep):
+        """Mlb should pass one rate limiter and retry policy to both adapters"""
+        limiter = RateLimiter(rate=5)
+        mlb = Mlb(rate_limiter=limiter, retry=RetryPolicy())
+
+        self.assertIs(mlb._mlb_adapter_v1._rate_limiter, limiter)
+        self.assertIs(mlb._mlb_adapter_v1_1._rate_limiter, limiter)
+        self.assertIs(mlb._mlb_adapter_v1._retry, mlb._mlb_adapter_v1_1._retry)
@@ -0,0 +1,134 @@
+import codecs
+import unittest
+import requests_mock
+import requests
+import json
+import os
+
+from mlbstatsapi import Mlb, MlbDataAdapter, MlbResult, TheMlbStatsApiException
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.mlb_stream import iter_array
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_sports = os.path.join(current_directory, "../mock_json/sports/sports.json")
+path_to_game = os.path.join(current_directory, "../mock_json/games/game.json")
+
+SPORTS_JSON_FILE = open(path_to_sports, "r", encoding="utf-8-sig").read()
+GAME_JSON_FILE = open(path_to_game, "r", encoding="utf-8-sig").read()
+
+
+@requests_mock.Mocker()
+class TestMlbDataAdapterSessionMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mock_sports = json.loads(SPORTS_JSON_FILE)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        pass
+
+    def test_adapter_creates_pooled_session(self, m):
+        """MlbDataAdapter should own a session mounted with a sized pool"""
+        adapter = MlbDataAdapter(pool_size=4)
+        self.assertIsInstance(adapter.session, requests.Session)
+
+        http_adapter = adapter.session.get_adapter('https://statsapi.mlb.com')
+        self.assertEqual(http_adapter._pool_maxsize, 4)
+
+    def test_adapter_uses_session(self, m):
+        """MlbDataAdapter.get should send requests through its session"""
+        m.get('https://statsapi.mlb.com/api/v1/sports', json=self.mock_sports,
+        status_code=200)
+
+        adapter = MlbDataAdapter()
+        result = adapter.get('sports')
+
+        self.assertIsInstance(result, MlbResult)
+        self.assertEqual(result.status_code, 200)
+        self.assertTrue(result.data['sports'])
+
+    def test_mlb_adapters_share_session(self, m):
+        """Mlb should share one session between its v1 and v1.1 adapters"""
+        mlb = Mlb(pool_size=2)
+
+        self.assertIs(mlb._mlb_adapter_v1.session, mlb._mlb_adapter_v1_1.session)
+        http_adapter = mlb._mlb_adapter_v1.session.get_adapter('https://statsapi.mlb.com')
+        self.assertEqual(http_adapter._pool_maxsize, 2)
+        mlb.close()
+
+
+class TestDecodeLowered(unittest.TestCase):
+    def test_decode_lowered_matches_transform_keys(self):
+        """decode_lowered should give the same tree as decoding then lowercasing"""
+        adapter = MlbDataAdapter()
+        expected = adapter._transform_keys_in_data(json.loads(GAME_JSON_FILE))
+
+        self.assertEqual(decode_lowered(GAME_JSON_FILE.encode()), expected)
+
+    def test_decode_lowered_only_lowers_keys(self):
+        """decode_lowered should leave values and list items as they are"""
+        data = decode_lowered(b'{"fullName": "Ty France", "Teams": [{"ID": 1}], "X": ["ABC"]}')
+
+        self.assertEqual(data, {'fullname': 'Ty France', 'teams': [{'id': 1}], 'x': ['ABC']})
+
+
+class TestIterArray(unittest.TestCase):
+    def test_iter_array_matches_decode_lowered(self):
+        """iter_array should yield the items at path for any chunk size"""
+        content = GAME_JSON_FILE.encode()
+        expected = decode_lowered(content)['livedata']['plays']['allplays']
+
+        for size in (1, 3, 100, len(content)):
+            with self.subTest(size=size):
+                chunks = (content[start:start + size] for start in range(0, len(content), size))
+                self.assertEqual(list(iter_array(chunks, ['livedata', 'plays', 'allplays'])), expected)
+
+    def test_iter_array_skips_bom_in_small_chunks(self):
+        """iter_array should skip a BOM that is split over the first chunks"""
+        content = codecs.BOM_UTF8 + b'{"List": [1, {"A": 2}]}'
+
+        for size in (1, 2, 3, len(content)):
+            with self.subTest(size=size):
+                chunks = (content[start:start + size] for start in range(0, len(content), size))
+                self.assertEqual(list(iter_array(chunks, ['list'])), [1, {'a': 2}])
+
+        self.assertEqual(list(iter_array([codecs.BOM_UTF8[:2], codecs.BOM_UTF8[2:]], ['list'])), [])
+
+    def test_iter_array_skips_strings_and_scalars(self):
+        """iter_array should not mistake brackets and quotes in strings for structure"""
+        content = (b'{"A": "}]\\"{[", "b": [1, {"c": "]"}], "N": -1.5e3, "T": true, '
+                   b'"List": [{"Key": "a\\\\"}, 2, "x", null]}')
+
+        self.assertEqual(list(iter_array([content], ['list'])), [{'key': 'a\\'}, 2, 'x', None])
+        self.assertEqual(list(iter_array([content], ['missing'])), [])
+        self.assertEqual(list(iter_array([b''], ['list'])), [])
+
+        with self.assertRaises(TheMlbStatsApiException):
+            list(iter_array([content[:40]], ['list']))
+
+
+@requests_mock.Mocker()
+class TestMlbDataAdapterStreamMock(unittest.TestCase):
+    def test_stream_yields_body(self, m):
+        """MlbDataAdapter.stream should yield the body in chunks of at most chunk_size"""
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', text=GAME_JSON_FILE,
+        status_code=200)
+        adapter = MlbDataAdapter(ver='v1.1')
+        chunks = list(adapter.stream('game/715720/feed/live', chunk_size=1000))
+
+        self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+        self.assertEqual(b''.join(chunks), GAME_JSON_FILE.encode())
+
+    def test_stream_status_codes(self, m):
+        """MlbDataAdapter.stream should yield nothing for a 4xx and raise for a 5xx"""
+        m.get('https://statsapi.mlb.com/api/v1/sports', [{'text': 'not found', 'status_code': 404},
+                                                        {'text': 'error', 'status_code': 500}])
+        adapter = MlbDataAdapter()
+
+        self.assertEqual(list(adapter.stream('sports')), [])
+
+        with self.assertRaises(TheMlbStatsApiException):
+            list(adapter.stream('sports'))
@@ -0,0 +1,189 @@
+import unittest
+import requests_mock
+import json
+import os
+
+from dataclasses import dataclass
+from unittest import mock
+
+from mlbstatsapi import Mlb, from_dict, identity_scope
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.game.gamedata.attributes import GameStatus
+from mlbstatsapi.models.homerunderby import Homerunderby
+from mlbstatsapi.models.people import Person
+from mlbstatsapi.models.schedules import Schedule
+from mlbstatsapi.models.sports import Sport
+from mlbstatsapi.models.standings import Standings
+from mlbstatsapi.models.stats import CatchingSeason, HittingGameLog, HotColdZones, SprayCharts
+from mlbstatsapi.models.teams import Team
+
+
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_mock_json = os.path.join(current_directory, "../mock_json")
+
+
+def fixture(path: str):
+    with open(os.path.join(path_to_mock_json, path), "rb") as mock_json:
+        data = decode_lowered(mock_json.read().lstrip(b'\xef\xbb\xbf'))
+
+    data.pop('copyright', None)
+    return data
+
+
+def label(value: str) -> str:
+    return value.upper()
+
+
+@dataclass
+class Labelled:
+    name: str
+
+    def __post_init__(self):
+        self.name = label(self.name)
+
+
+class TestFromDict(unittest.TestCase):
+    def test_from_dict_builds_the_same_models(self):
+        """from_dict should build the same models as calling the class"""
+        fixtures = [(Game, 'games/game.json', None), (Homerunderby, 'homerunderby/homerunderby.json', None),
+                    (Schedule, 'schedule/schedule_date.json', None), (Person, 'people/players.json', 'people'),
+                    (Standings, 'standings/standings.json', 'records')]
+
+        for cls, path, key in fixtures:
+            with self.subTest(path=path):
+                called = fixture(path)
+                built = fixture(path)
+
+                if key is None:
+                    self.assertEqual(from_dict(cls, built), cls(**called))
+                else:
+                    self.assertEqual([from_dict(cls, item) for item in built[key]],
+                                     [cls(**item) for item in called[key]])
+
+    def test_from_dict_unknown_keys(self):
+        """from_dict should drop keys a model has no attribute for, or collect them"""
+        unknown = {}
+        schedule = fixture('schedule/schedule_date.json')
+        schedule['dates'][0]['games'][0]['status']['newkey'] = 'new'
+        schedule['newkey'] = 'new'
+
+        built = from_dict(Schedule, schedule, unknown)
+        status = built.dates[0].games[0].status
+
+        self.assertEqual(status.abstractgamestate, 'Final')
+        self.assertFalse(hasattr(status, 'newkey'))
+        self.assertEqual(unknown[Schedule], {'newkey'})
+        self.assertEqual(unknown[type(status)], {'newkey'})
+        self.assertEqual(from_dict(Sport, {'id': 1, 'link': '/api/v1/sports/1', 'newkey': 'new'}),
+                         Sport(id=1, link='/api/v1/sports/1'))
+
+    def test_from_dict_unknown_keys_in_splits(self):
+        """from_dict should drop unknown keys in the models a split builds, also when it calls super().__post_init__()"""
+        team = {'id': 133, 'name': 'Oakland Athletics', 'link': '/api/v1/teams/133', 'newkey': 'new'}
+        splits = [(CatchingSeason, {'season': '2022', 'team': team, 'stat': {'gamesplayed': 10, 'newkey': 'new'}}),
+                  (HotColdZones, {'stat': {'name': 'battingAverage', 'newkey': 'new',
+                                           'zones': [{'zone': '01', 'value': '.300', 'newkey': 'new'}]}}),
+                  (SprayCharts, {'team': team,
+                                 'stat': {'leftfield': 1, 'leftcenterfield': 2, 'centerfield': 3,
+                                          'rightcenterfield': 4, 'rightfield': 5, 'newkey': 'new'}})]
+
+        for cls, split in splits:
+            with self.subTest(cls=cls.__name__):
+                unknown = {}
+                built = from_dict(cls, split, unknown)
+
+                self.assertIsInstance(built, cls)
+                self.assertNotIn(cls, unknown)
+                self.assertEqual(set().union(*unknown.values()), {'newkey'})
+
+        # CatchingSeason builds its team in Split.__post_init__ through super()
+        catching = from_dict(CatchingSeason, splits[0][1])
+        self.assertEqual(catching.team, Team(id=133, name='Oakland Athletics', link='/api/v1/teams/133'))
+        self.assertEqual(catching.stat.gamesplayed, 10)
+        self.assertEqual(from_dict(CatchingSeason, {'season': '2022', 'stat': {'gamesplayed': 10}}),
+                         CatchingSeason(season='2022', stat={'gamesplayed': 10}))
+
+    def test_from_dict_without_source(self):
+        """from_dict should drop nested unknown keys where the source of the models cannot be read"""
+        data = fixture('games/game.json')
+        data['livedata']['plays']['allplays'][0]['playevents'][0]['details']['newkey'] = 'new'
+        unknown = {}
+
+        with mock.patch('inspect.getsource', side_effect=OSError('could not get source code')):
+            game = from_dict(Game, data, unknown)
+
+        details = game.livedata.plays.allplays[0].playevents[0].details
+        self.assertFalse(hasattr(details, 'newkey'))
+        self.assertEqual(unknown[type(details)], {'newkey'})
+
+    def test_from_dict_keeps_dicts_a_model_does_not_build(self):
+        """from_dict should leave a dict the model keeps as a dict as it was, also when a nested key is dropped"""
+        game = {'gamepk': 715720, 'link': '/api/v1.1/game/715720/feed/live', 'gamenumber': 1}
+        split = {'season': '2022', 'ishome': True, 'iswin': False, 'date': '2022-04-07', 'game': game,
+                 'opponent': {'id': 133, 'name': 'Oakland Athletics', 'link': '/api/v1/teams/133'},
+                 'stat': {'gamesplayed': 1, 'newkey': 'new'}}
+
+        built = from_dict(HittingGameLog, split)
+
+        self.assertEqual(built.game, game)
+        self.assertFalse(hasattr(built.stat, 'newkey'))
+
+    def test_from_dict_uses_live_globals(self):
+        """from_dict should see a global of the model's module rebound after its constructor was made"""
+        self.assertEqual(from_dict(Labelled, {'name': 'a'}).name, 'A')
+
+        with mock.patch(f'{__name__}.label', lambda value: value * 2):
+            self.assertEqual(from_dict(Labelled, {'name': 'a'}).name, 'aa')
+
+    def test_from_dict_missing_field(self):
+        """from_dict should raise TypeError for a missing field like calling the class"""
+        with self.assertRaises(TypeError):
+            from_dict(GameStatus, {'abstractgamestate': 'Final'})
+
+    def test_from_dict_identity_map(self):
+        """from_dict should share a Person per id while an identity map is active"""
+        with identity_scope():
+            game = from_dict(Game, fixture('games/game.json'))
+
+        allplays = game.livedata.plays.allplays
+        self.assertIs(allplays[0].matchup.pitcher, allplays[1].matchup.pitcher)
+
+
+@requests_mock.Mocker()
+class TestFromDictMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mlb = Mlb()
+
+    def test_get_game_with_new_keys(self, m):
+        """mlb get_game should build a Game from a response with keys the models do not have"""
+        game = json.loads(open(os.path.join(path_to_mock_json, 'games/game.json'), encoding='utf-8-sig').read())
+        game['newKey'] = 'new'
+        game['gameData']['newKey'] = 'new'
+        game['gameData']['status']['newKey'] = 'new'
+        game['liveData']['newKey'] = 'new'
+        game['liveData']['plays']['newKey'] = 'new'
+        game['liveData']['plays']['allPlays'][0]['matchup']['batter']['newKey'] = 'new'
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=game, status_code=200)
+
+        built = self.mlb.get_game(715720)
+
+        self.assertIsInstance(built, Game)
+        self.assertEqual(built.gamedata.status.abstractgamestate, 'Final')
+        self.assertEqual(built.livedata.plays.allplays[0].matchup.batter.id,
+                         game['liveData']['plays']['allPlays'][0]['matchup']['batter']['id'])
+
+    def test_get_game_lazy_with_new_keys(self, m):
+        """mlb get_game should build a lazy Game from a response with keys the models do not have"""
+        game = json.loads(open(os.path.join(path_to_mock_json, 'games/game.json'), encoding='utf-8-sig').read())
+        game['gameData']['newKey'] = 'new'
+        game['liveData']['newKey'] = 'new'
+        game['liveData']['plays']['newKey'] = 'new'
+        m.get('https://statsapi.mlb.com/api/v1.1/game/715720/feed/live', json=game, status_code=200)
+
+        built = self.mlb.get_game(715720, lazy=True)
+
+        self.assertEqual(built.gamedata.status.abstractgamestate, 'Final')
+        self.assertEqual(len(built.livedata.plays.allplays), len(game['liveData']['plays']['allPlays']))
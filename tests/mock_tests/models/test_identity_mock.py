@@ -0,0 +1,31 @@
+import unittest
+
+from mlbstatsapi import IdentityMap, identity_scope
+from mlbstatsapi.models.people import Person
+
+
+class TestIdentityMap(unittest.TestCase):
+    def test_identity_map_fills_in_returned_instances(self):
+        """identity map should set the attributes of a fuller record on the instance already returned"""
+        with identity_scope():
+            first = Person(id=1, fullname='A', link='/api/v1/people/1')
+            second = Person(id=1, fullname='B', link='/api/v1/people/1', primarynumber='7')
+
+        self.assertIs(first, second)
+        self.assertEqual(first.fullname, 'A')
+        self.assertEqual(first.primarynumber, '7')
+
+    def test_identity_map_max_size(self):
+        """identity map with max_size should drop the least recently used instances"""
+        identity_map = IdentityMap(max_size=2)
+
+        with identity_scope(identity_map):
+            first = Person(id=1, fullname='A', link='/api/v1/people/1')
+            second = Person(id=2, fullname='B', link='/api/v1/people/2')
+            self.assertIs(Person(id=1, fullname='A', link='/api/v1/people/1'), first)
+            Person(id=3, fullname='C', link='/api/v1/people/3')
+
+            self.assertEqual(len(identity_map), 2)
+            self.assertIs(Person(id=1, fullname='A', link='/api/v1/people/1'), first)
+            self.assertIsNot(Person(id=2, fullname='B', link='/api/v1/people/2'), second)
+            self.assertEqual(len(identity_map), 2)
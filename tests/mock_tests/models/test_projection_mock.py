@@ -0,0 +1,85 @@
+import unittest
+
+from dataclasses import fields
+
+from mlbstatsapi import TheMlbStatsApiException
+from mlbstatsapi.models import projection
+from mlbstatsapi.models.game import Game
+from mlbstatsapi.models.people import Player
+from mlbstatsapi.models.schedules import Schedule
+
+
+def model_fields(cls, seen=None):
+    """yield the class and name of every attribute of cls and the models nested in it"""
+    seen = set() if seen is None else seen
+
+    if cls in seen:
+        return
+
+    seen.add(cls)
+
+    for model_field in fields(cls):
+        yield cls, model_field.name
+        model = projection._model_class(model_field.type)
+
+        if model is not None:
+            yield from model_fields(model, seen)
+
+
+class TestProjection(unittest.TestCase):
+    def test_every_attribute_has_a_spelling(self):
+        """every attribute of the models that take attributes should have its spelling in API_NAMES"""
+        for root in (Game, Schedule, Player):
+            for cls, name in model_fields(root):
+                if (cls.__name__, name) in projection.KEYED_BY_ID:
+                    continue
+
+                with self.subTest(model=cls.__name__, attribute=name):
+                    self.assertIn(name, projection._api_names)
+
+    def test_projection_fields_spellings(self):
+        """projection_fields should send the api spelling of each attribute"""
+        names = projection.projection_fields(Game, projection.projection_tree(['gamedata.moundvisits',
+                                                                                'gamedata.status.codedgamestate']))
+
+        self.assertEqual(names, {'gameData', 'moundVisits', 'home', 'away', 'status', 'codedGameState'})
+
+    def test_projection_fields_keyed_by_id(self):
+        """projection_fields should raise for attributes keyed by id, alone or inside a model wanted whole"""
+        for attributes in (['gamedata.players'], ['gamedata.players.fullname'], ['gamedata'],
+                           ['livedata.boxscore.teams.home.players'], ['livedata.boxscore']):
+            with self.subTest(attributes=attributes):
+                with self.assertRaises(TheMlbStatsApiException):
+                    projection.projection_fields(Game, projection.projection_tree(attributes))
+
+    def test_build_partial_unknown_keys(self):
+        """build_partial should drop unknown keys in the models it builds whole"""
+        tree = projection.projection_tree(['dates.date', 'dates.games.status'])
+        status = {'abstractgamestate': 'Final', 'codedgamestate': 'F', 'detailedstate': 'Final',
+                  'statuscode': 'F', 'starttimetbd': False, 'abstractgamecode': 'F', 'newkey': 'new'}
+        schedule = projection.build_partial(Schedule, {'dates': [{'date': '2022-10-01',
+                                                                  'games': [{'status': status}]}]}, tree)
+
+        self.assertEqual(schedule.dates[0].games[0].status.detailedstate, 'Final')
+        self.assertFalse(hasattr(schedule.dates[0].games[0].status, 'newkey'))
+
+    def test_build_partial_repr_and_eq(self):
+        """build_partial instances should print and compare by the attributes that are set"""
+        tree = projection.projection_tree(['gamepk', 'gamedata.status'])
+        status = {'abstractgamestate': 'Final', 'codedgamestate': 'F', 'detailedstate': 'Final',
+                  'statuscode': 'F', 'starttimetbd': False, 'abstractgamecode': 'F'}
+        game = projection.build_partial(Game, {'gamepk': 715720, 'gamedata': {'status': status}}, tree)
+        same = projection.build_partial(Game, {'gamepk': 715720, 'gamedata': {'status': status}}, tree)
+        other = projection.build_partial(Game, {'gamepk': 715721, 'gamedata': {'status': status}}, tree)
+
+        self.assertIsInstance(game, Game)
+        self.assertTrue(repr(game).startswith('Game(gamepk=715720, gamedata=GameData(status='))
+        self.assertNotIn('metadata', repr(game))
+        self.assertEqual(game, same)
+        self.assertNotEqual(game, other)
+
+        tree = projection.projection_tree(['id', 'fullname'])
+        players = [projection.build_partial(Player, {'id': 1, 'fullname': 'A'}, tree) for _ in range(2)]
+
+        self.assertEqual(players[0], players[1])
+        self.assertEqual(str(players[0]), 'Player(id=1, fullname=A)')
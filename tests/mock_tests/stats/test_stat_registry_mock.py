@@ -0,0 +1,46 @@
+import unittest
+import glob
+import os
+
+from mlbstatsapi import mlb_module
+from mlbstatsapi.mlb_dataadapter import decode_lowered
+from mlbstatsapi.models.stats import HittingSeason, PitchingSeason, HotColdZones
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_stats = os.path.join(current_directory, "../mock_json/stats")
+
+STATS_JSON_FILES = sorted(glob.glob(os.path.join(path_to_stats, "*", "*.json")))
+
+
+class TestStatRegistry(unittest.TestCase):
+    def test_get_stat_class(self):
+        """get_stat_class should map a stat group and type to its split class"""
+        self.assertIs(mlb_module.get_stat_class('hitting', 'season'), HittingSeason)
+        self.assertIs(mlb_module.get_stat_class('pitching', 'statsSingleSeason'), PitchingSeason)
+        self.assertIs(mlb_module.get_stat_class('stats', 'hotColdZones'), HotColdZones)
+        self.assertIsNone(mlb_module.get_stat_class('hitting', 'notAStatType'))
+        self.assertIsNone(mlb_module.get_stat_class('notAStatGroup', 'season'))
+
+    def test_return_splits_reports_unknown_types(self):
+        """return_splits should log unknown stat types and return no splits"""
+        with self.assertLogs('mlbstatsapi.mlb_module', level='WARNING') as logs:
+            splits = mlb_module.return_splits([{'stat': {'hits': 1}}], 'unknownType', 'hitting')
+
+        self.assertEqual(splits, [])
+        self.assertIn('unknownType', logs.output[0])
+
+    def test_registry_builds_every_fixture_stat(self):
+        """every stat block in the stats mock json should have a split class"""
+        for path in STATS_JSON_FILES:
+            with open(path, "rb") as stats_file:
+                data = decode_lowered(stats_file.read().lstrip(b'\xef\xbb\xbf'))
+
+            for stat in data['stats']:
+                stat_type, stat_group, _ = mlb_module.get_stat_attributes(stat)
+                splits = mlb_module.return_splits(stat['splits'], stat_type, stat_group)
+
+                self.assertIsNotNone(mlb_module.get_stat_class(stat_group, stat_type), path)
+                self.assertEqual(len(splits), len([split for split in stat['splits'] if split.get('stat')]))
@@ -0,0 +1,147 @@
+import unittest
+import pytest
+import requests_mock
+import json
+import os
+
+from mlbstatsapi import Mlb, TheMlbStatsApiException
+from mlbstatsapi import mlb_module
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+# Mocked JSON directory
+path_to_current_file = os.path.realpath(__file__)
+current_directory = os.path.dirname(path_to_current_file)
+path_to_hitting_stats = os.path.join(current_directory, "../mock_json/stats/person/hitting_player_stats.json")
+path_to_team_stats = os.path.join(current_directory, "../mock_json/stats/team/hitting_team_stats.json")
+HITTING_STATS = json.loads(open(path_to_hitting_stats, "r", encoding="utf-8-sig").read())
+TEAM_STATS = json.loads(open(path_to_team_stats, "r", encoding="utf-8-sig").read())
+
+
+class TestSplitColumns(unittest.TestCase):
+    def test_flatten_split(self):
+        """flatten_split should join nested keys with dots"""
+        split = {'season': '2022', 'stat': {'hits': 160}, 'team': {'id': 136, 'link': '/api/v1/teams/136'}}
+
+        self.assertEqual(mlb_module.flatten_split(split),
+                         {'season': '2022', 'stat.hits': 160, 'team.id': 136, 'team.link': '/api/v1/teams/136'})
+
+    def test_split_columns(self):
+        """split_columns should pad keys a split does not have and skip splits without a stat"""
+        splits = [{'season': '2021', 'stat': {'hits': 150}},
+                  {'season': '2022', 'stat': {}},
+                  {'season': '2022', 'stat': {'hits': 160, 'triples': 2}, 'team': {'id': 136}}]
+
+        self.assertEqual(mlb_module.split_columns(splits),
+                         {'season': ['2021', '2022'], 'stat.hits': [150, 160],
+                          'stat.triples': [None, 2], 'team.id': [None, 136]})
+
+    def test_flatten_split_nested(self):
+        """flatten_split should flatten every level and keep lists as values"""
+        split = {'stat': {'type': {'code': 'FF'}, 'zones': [{'zone': '01'}]}, 'rank': None}
+
+        self.assertEqual(mlb_module.flatten_split(split, 'split.'),
+                         {'split.stat.type.code': 'FF', 'split.stat.zones': [{'zone': '01'}], 'split.rank': None})
+
+    def test_split_columns_fixture(self):
+        """split_columns should have one row per split with a stat, the same length in every column"""
+        for stat in HITTING_STATS['stats']:
+            with self.subTest(stat=stat['type']['displayName']):
+                columns = mlb_module.split_columns(stat['splits'])
+                rows = len([split for split in stat['splits'] if split.get('stat')])
+
+                self.assertEqual({len(column) for column in columns.values()}, {rows})
+                self.assertEqual(columns['stat.plateAppearances'],
+                                 [split['stat']['plateAppearances'] for split in stat['splits']])
+
+    def test_check_table(self):
+        """check_table should accept None, pandas and arrow and raise for anything else"""
+        for table in (None, 'pandas', 'arrow'):
+            self.assertEqual(mlb_module.check_table(table), table)
+
+        for table in ('csv', 'Pandas', ''):
+            with self.subTest(table=table):
+                with self.assertRaisesRegex(TheMlbStatsApiException, 'pandas, arrow'):
+                    mlb_module.check_table(table)
+
+    def test_create_split_tables_unknown_table(self):
+        """create_split_tables should raise for a table kind it does not know"""
+        with self.assertRaises(TheMlbStatsApiException):
+            mlb_module.create_split_tables([], 'csv')
+
+    @unittest.skipIf(pandas is not None, 'pandas is installed')
+    def test_create_split_tables_without_pandas(self):
+        """create_split_tables should say how to install pandas when it is missing"""
+        with self.assertRaisesRegex(ImportError, r'python-mlb-statsapi\[pandas\]'):
+            mlb_module.create_split_tables([], 'pandas')
+
+
+@requests_mock.Mocker()
+class TestStatTablesArgumentsMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mlb = Mlb()
+
+    def test_get_stats_unknown_table(self, m):
+        """mlb stats methods should raise for an unknown table before making a request"""
+        calls = [lambda: self.mlb.get_player_stats(665742, ['season'], ['hitting'], table='csv'),
+                 lambda: self.mlb.get_team_stats(133, ['season'], ['hitting'], table='csv'),
+                 lambda: self.mlb.get_players_stats_for_game(665742, 715720, table='csv'),
+                 lambda: self.mlb.get_stats(['season'], ['hitting'], table='csv')]
+
+        for call in calls:
+            with self.assertRaisesRegex(TheMlbStatsApiException, 'pandas, arrow'):
+                call()
+
+        self.assertEqual(m.call_count, 0)
+
+    def test_get_player_stats_arrow_table(self, m):
+        """mlb get_player_stats with table='arrow' should return a pyarrow Table for each stat"""
+        pyarrow = pytest.importorskip('pyarrow')
+        m.get('https://statsapi.mlb.com/api/v1/people/665742/stats?stats=season&stats=career&group=hitting',
+              json=HITTING_STATS, status_code=200)
+        stats = self.mlb.get_player_stats(665742, ['season', 'career'], ['hitting'], table='arrow')
+        splits = self.mlb.get_player_stats(665742, ['season', 'career'], ['hitting'])
+
+        for stat_type, stat in splits['hitting'].items():
+            table = stats['hitting'][stat_type]
+            self.assertIsInstance(table, pyarrow.Table)
+            self.assertEqual(table.num_rows, len(stat.splits))
+            self.assertEqual(table.column('stat.plateappearances').to_pylist(),
+                             [split.stat.plateappearances for split in stat.splits])
+
+
+@requests_mock.Mocker()
+@unittest.skipIf(pandas is None, 'pandas is not installed')
+class TestStatTablesMock(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mlb = Mlb()
+
+    def test_get_player_stats_table(self, m):
+        """mlb get_player_stats with table should return a DataFrame for each stat"""
+        m.get('https://statsapi.mlb.com/api/v1/people/665742/stats?stats=season&stats=career&group=hitting',
+              json=HITTING_STATS, status_code=200)
+        stats = self.mlb.get_player_stats(665742, ['season', 'career'], ['hitting'], table='pandas')
+        splits = self.mlb.get_player_stats(665742, ['season', 'career'], ['hitting'])
+
+        for stat_type, stat in splits['hitting'].items():
+            frame = stats['hitting'][stat_type]
+            self.assertIsInstance(frame, pandas.DataFrame)
+            self.assertEqual(len(frame), len(stat.splits))
+            self.assertEqual(list(frame['stat.plateappearances']),
+                             [split.stat.plateappearances for split in stat.splits])
+
+    def test_get_team_stats_table(self, m):
+        """mlb get_team_stats with table should have team id and season columns"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133/stats?stats=season&group=hitting',
+              json=TEAM_STATS, status_code=200)
+        stats = self.mlb.get_team_stats(133, ['season'], ['hitting'], table='pandas')
+        frame = stats['hitting']['season']
+
+        self.assertIn('team.id', frame.columns)
+        self.assertIn('season', frame.columns)
@@ -2,6 +2,7 @@
 import requests_mock
 import json
 import os
+from urllib.parse import parse_qs, urlparse
 
 from mlbstatsapi import Mlb
 from mlbstatsapi.models.teams import Team
@@ -49,6 +50,24 @@ class TestTeamRoster(unittest.TestCase):
         # roster should not be a empty list
         self.assertNotEqual(roster, [])
 
+    def test_team_roster_attributes(self, m):
+        """Team Roster with attributes should build players with just those attributes"""
+        m.get('https://statsapi.mlb.com/api/v1/teams/133/roster', json=self.mock_players,
+        status_code=200)
+
+        roster = self.mlb.get_team_roster(133, attributes=['id', 'fullname', 'jerseynumber'])
+        fields = parse_qs(urlparse(m.last_request.url).query)['fields'][0].split(',')
+
+        self.assertIn('fullName', fields)
+        self.assertIn('jerseyNumber', fields)
+        self.assertNotIn('status', fields)
+
+        self.assertEqual(len(roster), len(self.mock_players['roster']))
+        self.assertEqual(roster[0].fullname, self.mock_players['roster'][0]['person']['fullName'])
+
+        with self.assertRaises(AttributeError):
+            roster[0].status
+
     def test_team_roster_list_of_coach_objects(self, m):
         """Default Team Roster should return a list of players"""
         m.get('https://statsapi.mlb.com/api/v1/teams/133/coaches', json=self.mock_coaches,